@@ -7,8 +7,10 @@ Tarayıcı otomasyonu için temel sınıf
 
 import time
 import os
-import requests
+import re
+from contextlib import contextmanager, nullcontext
 from typing import Callable, Optional
+from urllib.parse import urlsplit
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,9 +19,25 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 
+from .cancel import CancelToken, Cancelled
+from .concurrency import AIMDController, CircuitBreaker
 from .config import BotConfig
+from .history import TimingHistory
+from .mailpanel import MAILPANEL_API_URL, MAILPANEL_DOMAIN, MailpanelClient
+from .manifest import combined_summary, describe_job
+from .netlog import ERROR_SELECTORS, INLINE_STATUS_SCRIPT, LOGGING_PREFS, PERF_LOGGING_PREFS, SubmitMonitor
+from .planner import RunPlanner, format_duration
+from .profiler import CommandProfiler
+from .profiles import BrowserProfile
+from .ratelimit import get_rate_limiter
+from .timeouts import StepTimeouts, item_deadline
+from .verify import ImapVerifier
+from .watchdog import Watchdog, kill_process_tree
+
+
+# Form sonucu kontrolleri arasındaki bekleme (WebDriverWait varsayılanı 0.5 sn)
+RESULT_POLL_INTERVAL = 0.1
 
 
 class BotEngine:
@@ -30,7 +48,8 @@ class BotEngine:
         config: BotConfig, 
         logger: Optional[Callable[[str], None]] = None,
         panel_email: str = "",
-        panel_password: str = ""
+        panel_password: str = "",
+        cancel_token: Optional[CancelToken] = None
     ):
         """
         Bot motorunu başlat
@@ -40,6 +59,8 @@ class BotEngine:
             logger: Log fonksiyonu (opsiyonel, varsayılan: print)
             panel_email: Panel giriş e-postası
             panel_password: Panel giriş şifresi
+            cancel_token: Motor oluşmadan önce de durdurulabilmesi için
+                dışarıda oluşturulan iptal bayrağı (varsayılan: yeni bayrak)
         """
         self.config = config
         self.logger = logger or print
@@ -47,21 +68,126 @@ class BotEngine:
         self.panel_password = panel_password
         self.driver: Optional[webdriver.Chrome] = None
         self.running = False
+        self.cancel_token = cancel_token or CancelToken()
+        self.submit_monitor: Optional[SubmitMonitor] = None
+        self.browser_profile: Optional[BrowserProfile] = None
+        self.last_create_error: Optional[str] = None
+        self.last_create_congested = False  # Son hata zaman aşımı/5xx/tarayıcı hatası mıydı
+        self.profiler: Optional[CommandProfiler] = CommandProfiler() if config.profile else None
+        self.history = TimingHistory.for_config(config) if config.record_history else TimingHistory()
+        self.planner = RunPlanner(config, self.history)
+        self.timeouts = StepTimeouts.for_config(config, self.history)
+        self.concurrency = AIMDController(
+            maximum=config.tabs,
+            initial=1 if config.adaptive_tabs else config.tabs,
+            minimum=1 if config.adaptive_tabs else config.tabs,
+            baseline=self.history.mean("create_email")
+        )
+        self.breaker = CircuitBreaker(config.breaker_threshold, config.breaker_cooldown)
+        deadline = item_deadline(config)
+        self.watchdog = Watchdog(deadline, self._on_hang) if deadline else None
+        self.recovery_seconds: list = []
+        self._driver_pid: Optional[int] = None
+        self.verifier: Optional[ImapVerifier] = None
+        if config.verify_imap:
+            self.verifier = ImapVerifier(
+                config.get_imap_host(),
+                port=config.imap_port,
+                pool_size=config.imap_pool,
+                logger=self.log,
+                cancel_token=self.cancel_token
+            )
+        self._create_started = 0.0
+        self.submit_started_at: Optional[float] = None  # Son formun hız sınırı beklemesinden sonraki başlangıcı
+        self.panel_limiter = get_rate_limiter(config, config.panel_host)
+        self.mailpanel = MailpanelClient(
+            logger=self.log,
+            rate_limiter=get_rate_limiter(config, urlsplit(MAILPANEL_API_URL).netloc),
+            cancel_token=self.cancel_token
+        )
     
     def log(self, message: str):
         """Log mesajı gönder"""
         self.logger(message)
     
+    def cancel(self):
+        """
+        Durdurma iste (GUI thread'inden veya sinyal işleyicisinden)
+        
+        Bekleyen sleep, WebDriverWait ve HTTP çağrıları bir saniyeden kısa
+        sürede Cancelled ile kesilir; sonucu beklenen öğeler iptal olarak
+        kaydedilir ve tarayıcı kapatılır.
+        """
+        self.running = False
+        self.cancel_token.cancel()
+    
+    def _until(self, condition, step: str, poll_frequency: float = 0.5):
+        """
+        İptal edilebilir WebDriverWait.until, adımın öğrenilen zaman aşımıyla
+        
+        Tamamlanan beklemenin süresi adımın geçmişine eklenir; zaman aşımı
+        sadece sayılır.
+        
+        Args:
+            condition: WebDriverWait koşulu
+            step: Zaman aşımı adımı (timeouts.DEFAULT_TIMEOUTS anahtarı)
+            poll_frequency: Yoklama aralığı
+        
+        Raises:
+            TimeoutException: Koşul süresinde sağlanmadı
+            Cancelled: Beklerken durdurma istendi
+        """
+        wait = WebDriverWait(self.driver, self.timeouts.get(step), poll_frequency=poll_frequency)
+        started_at = time.monotonic()
+        try:
+            result = wait.until(self.cancel_token.wrap(condition))
+        except TimeoutException:
+            self.timeouts.record_timeout(step)
+            raise
+        self.timeouts.record(step, time.monotonic() - started_at)
+        return result
+    
+    @contextmanager
+    def _step(self, name: str):
+        """Motor adımını ölç: süre geçmişe, komut ayrıntıları profilleyiciye"""
+        start = time.perf_counter()
+        with self.profiler.measure_step(name) if self.profiler else nullcontext():
+            yield
+        self.history.record_step(name, time.perf_counter() - start)
+    
+    def _chrome_arguments(self) -> list:
+        """Chrome'a verilecek komut satırı argümanları"""
+        arguments = list(self.config.chrome_options)
+        if self.browser_profile:
+            arguments.append(f"--user-data-dir={self.browser_profile.path}")
+        return arguments
+    
+    def _service(self, path: str) -> Service:
+        """
+        chromedriver servisi
+        
+        POSIX'te ayrı süreç grubunda başlatılır; bekçi takılan sürücüyü
+        Chrome alt süreçleriyle birlikte öldürebilir.
+        """
+        if os.name == "nt":
+            return Service(path)
+        return Service(path, popen_kw={"start_new_session": True})
+    
     def _create_driver(self) -> webdriver.Chrome:
         """Chrome WebDriver oluştur"""
         chrome_options = Options()
         
-        for option in self.config.chrome_options:
+        for option in self._chrome_arguments():
             chrome_options.add_argument(option)
         
         if self.config.headless:
             chrome_options.add_argument("--headless=new")
         
+        # Form yanıtlarını okumak için Network olaylarını günlüğe al
+        if self.config.network_probe:
+            chrome_options.set_capability("goog:loggingPrefs", LOGGING_PREFS)
+            chrome_options.add_experimental_option("perfLoggingPrefs", PERF_LOGGING_PREFS)
+        
         # Docker'da Chromium kullan
         chrome_bin = os.environ.get("CHROME_BIN")
         chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
@@ -70,10 +196,12 @@ class BotEngine:
             chrome_options.binary_location = chrome_bin
         
         if chromedriver_path and os.path.exists(chromedriver_path):
-            service = Service(chromedriver_path)
+            service = self._service(chromedriver_path)
         else:
             # Yerel geliştirmede ChromeDriverManager kullan
             try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                
                 driver_path = ChromeDriverManager().install()
                 self.log(f"ChromeDriver path: {driver_path}")
                 
@@ -103,10 +231,10 @@ class BotEngine:
                 
                 if actual_driver:
                     self.log(f"Kullanılan ChromeDriver: {actual_driver}")
-                    service = Service(actual_driver)
+                    service = self._service(actual_driver)
                 else:
                     raise Exception(f"chromedriver binary bulunamadı: {driver_dir}")
-                    
+            
             except Exception as e:
                 self.log(f"ChromeDriver kurulum hatası: {e}")
                 raise
@@ -116,17 +244,118 @@ class BotEngine:
     def start(self):
         """Tarayıcıyı başlat"""
         self.log("Chrome başlatılıyor...")
-        self.driver = self._create_driver()
+        if self.config.persistent_profile and not self.browser_profile:
+            self.browser_profile = BrowserProfile.acquire(self.config, self.panel_email or "default")
+            state = "yeni" if self.browser_profile.is_new else "kayıtlı"
+            self.log(f"Kalıcı profil ({state}): {self.browser_profile.path}")
+        
+        try:
+            self.driver = self._create_driver()
+        except Exception:
+            self._release_profile()
+            raise
+        try:
+            self._driver_pid = self.driver.service.process.pid
+        except AttributeError:
+            self._driver_pid = None
+        if self.profiler:
+            self.profiler.attach(self.driver)
+        self.submit_monitor = SubmitMonitor(self.driver) if self.config.network_probe else None
         self.running = True
         self.log("Chrome başlatıldı!")
     
     def stop(self):
-        """Tarayıcıyı kapat"""
+        """Tarayıcıyı kapat ve arka plan thread'lerini durdur"""
         self.running = False
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-            self.log("Chrome kapatıldı.")
+        try:
+            if self.driver:
+                self.driver.quit()
+                self.driver = None
+                self._driver_pid = None
+                self.log("Chrome kapatıldı.")
+        finally:
+            self._release_profile()
+            self.close()
+    
+    def close(self):
+        """
+        Motorun arka plan thread'lerini durdur (tarayıcı açık kalabilir)
+        
+        Çalışma bittiğinde çağrılır; aksi halde bekçi thread'i motoru ve
+        IMAP havuzunun thread'leri süreçte kalır. Bekleyen doğrulamalar
+        önceden finish_verification ile toplanmalıdır.
+        """
+        if self.watchdog:
+            self.watchdog.close()
+        if self.verifier:
+            self.verifier.close()
+    
+    def _watch(self, label: str):
+        """Blok süresince öğe bekçisini kur (bekçi kapalıysa etkisiz)"""
+        return self.watchdog.guard(label) if self.watchdog else nullcontext()
+    
+    def _unwatched(self):
+        """Blok süresince öğe bekçisinin süresini dondur (sürücü dışı beklemeler)"""
+        return self.watchdog.paused() if self.watchdog else nullcontext()
+    
+    def _on_hang(self, label: str):
+        """Bekçi thread'inden: süre doldu, takılan tarayıcıyı öldür"""
+        self.log(f"✗ {label}: {self.watchdog.deadline:g} sn içinde bitmedi, tarayıcı sonlandırılıyor")
+        if self._driver_pid:
+            kill_process_tree(self._driver_pid)
+    
+    def _check_hang(self) -> bool:
+        """Son korunan blokta bekçi tarayıcıyı öldürdü mü"""
+        return bool(self.watchdog and self.watchdog.consume())
+    
+    def recover_browser(self) -> bool:
+        """
+        Takılan tarayıcıyı yeniden başlat ve panele tekrar giriş yap
+        
+        Returns:
+            True: tarayıcı hazır, False: kurtarılamadı
+        """
+        start = time.perf_counter()
+        self.log("Tarayıcı yeniden başlatılıyor...")
+        if self._driver_pid:
+            kill_process_tree(self._driver_pid)
+        self.driver = None
+        self._driver_pid = None
+        
+        try:
+            with self._watch("kurtarma"):
+                self.start()
+                recovered = self.login()
+        except Exception as e:
+            self.log(f"✗ Tarayıcı başlatılamadı: {str(e)}")
+            recovered = False
+        if self._check_hang():
+            recovered = False
+        
+        elapsed = time.perf_counter() - start
+        self.recovery_seconds.append(elapsed)
+        if recovered:
+            self.log(f"✓ Tarayıcı kurtarıldı ({elapsed:.1f} sn)")
+        else:
+            self.log(f"✗ Tarayıcı kurtarılamadı ({elapsed:.1f} sn)")
+        return recovered
+    
+    def report_hangs(self, results: dict):
+        """Takılma sayısı ve kurtarma sürelerini sonuca ve loga yaz"""
+        if not self.watchdog:
+            return
+        results["hangs"] = self.watchdog.hangs
+        results["recovery_seconds"] = list(self.recovery_seconds)
+        if self.recovery_seconds:
+            average = sum(self.recovery_seconds) / len(self.recovery_seconds)
+            self.log(f"Takılma: {self.watchdog.hangs}, kurtarma süresi ort. {average:.1f} sn, "
+                     f"en uzun {max(self.recovery_seconds):.1f} sn")
+    
+    def _release_profile(self):
+        """Kalıcı profilin kilidini bırak (Chrome kapandıktan sonra)"""
+        if self.browser_profile:
+            self.browser_profile.release()
+            self.browser_profile = None
     
     def panel_login(self) -> bool:
         """
@@ -144,12 +373,11 @@ class BotEngine:
             self.log(f"Panel sayfasına gidiliyor: {self.config.target_url}")
             self.driver.get(self.config.target_url)
             
-            wait = WebDriverWait(self.driver, self.config.timeout)
-            
             # Kullanıcı adı alanı
             self.log(f"Panel kullanıcı adı giriliyor: {self.panel_email}")
-            username_field = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.config.username_selector))
+            username_field = self._until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.config.username_selector)),
+                "login_form"
             )
             username_field.clear()
             username_field.send_keys(self.panel_email)
@@ -166,11 +394,11 @@ class BotEngine:
             login_button.click()
             
             # Giriş başarılı mı kontrol et
-            time.sleep(3)  # Sayfa yüklenmesini bekle
+            self.cancel_token.sleep(3)  # Sayfa yüklenmesini bekle
             
             self.log("✓ Panel girişi başarılı!")
             return True
-            
+        
         except TimeoutException:
             self.log("✗ Zaman aşımı: Panel elementleri bulunamadı")
             return False
@@ -188,29 +416,99 @@ class BotEngine:
         Returns:
             True: başarılı, False: zaman aşımı
         """
+        timeout = self.timeouts.get("dashboard")
         try:
-            self.log("Dashboard sayfası bekleniyor (max 30 sn)...")
-            wait = WebDriverWait(self.driver, 30)
-            
+            self.log(f"Dashboard sayfası bekleniyor (max {timeout:.0f} sn)...")
             # URL'in /smb/web/view olmasını bekle
-            wait.until(EC.url_contains("/smb/web/view"))
+            self._until(EC.url_contains("/smb/web/view"), "dashboard")
             self.log("✓ Dashboard sayfasına ulaşıldı!")
             return True
-            
+        
         except TimeoutException:
-            self.log("✗ Dashboard sayfası yüklenemedi (30 sn zaman aşımı)")
+            self.log(f"✗ Dashboard sayfası yüklenemedi ({timeout:.0f} sn zaman aşımı)")
             return False
         except Exception as e:
             self.log(f"✗ Dashboard bekleme hatası: {str(e)}")
             return False
     
+    def resume_session(self) -> bool:
+        """
+        Kalıcı profildeki oturum hâlâ geçerli mi hızlıca kontrol et
+        
+        Dashboard adresi doğrudan açılır; panel login sayfasına yönlendirirse
+        oturum geçersizdir.
+        
+        Returns:
+            True: oturum geçerli ve dashboard açık, False: giriş gerekli
+        """
+        self.log("Kayıtlı oturum kontrol ediliyor...")
+        return self.probe_panel()
+    
+    def probe_panel(self) -> bool:
+        """
+        Panel yanıt veriyor ve oturum açık mı (aktif sekmede dashboard açılır)
+        
+        Returns:
+            True: dashboard açıldı, False: login sayfası, zaman aşımı veya hata
+        """
+        def settled(driver) -> bool:
+            path = urlsplit(driver.current_url).path
+            return path.startswith("/smb/") or "login" in path
+        
+        try:
+            self.driver.get(self.config.get_panel_url("/smb/web/view"))
+            self._until(settled, "panel_probe", poll_frequency=RESULT_POLL_INTERVAL)
+        except (TimeoutException, WebDriverException):
+            return False
+        return urlsplit(self.driver.current_url).path.startswith("/smb/web/view")
+    
+    def login(self) -> bool:
+        """
+        Panele giriş yap ve dashboard'u bekle
+        
+        Kalıcı profil kullanılıyorsa önce kayıtlı oturum denenir; geçersizse
+        normal girişe düşülür.
+        
+        Returns:
+            True: dashboard açık, False: giriş başarısız
+        """
+        if self.browser_profile:
+            start = time.perf_counter()
+            with self._step("resume_session"):
+                resumed = self.resume_session()
+            if resumed:
+                saved = (self.planner.step_seconds("panel_login")
+                         + self.planner.step_seconds("wait_for_dashboard")
+                         - (time.perf_counter() - start))
+                self.log(f"✓ Kayıtlı oturum geçerli, giriş atlandı (kazanılan süre: ~{max(saved, 0):.1f} sn)")
+                return True
+            self.log("Kayıtlı oturum geçersiz, giriş yapılıyor...")
+        
+        with self._step("panel_login"):
+            logged_in = self.panel_login()
+        if not logged_in:
+            return False
+        
+        with self._step("wait_for_dashboard"):
+            return self.wait_for_dashboard()
+    
+    def log_cache_stats(self):
+        """Ağ günlüğünden statik dosya önbellek isabet oranını logla"""
+        if not self.submit_monitor:
+            return
+        self.submit_monitor.drain()
+        rate = self.submit_monitor.cache_hit_rate
+        if rate is not None:
+            self.log(f"Önbellek isabeti: %{rate * 100:.1f} "
+                     f"({self.submit_monitor.cache_hits}/{self.submit_monitor.responses} yanıt)")
+    
     def create_email(self, email: str) -> bool:
         """
         Panelde yeni e-posta oluştur
         
         Args:
             email: Oluşturulacak e-posta adresi (sadece @ öncesi kısım)
-            
+        
         Returns:
             True: başarılı, False: başarısız
         """
@@ -218,84 +516,37 @@ class BotEngine:
             self.log("Hata: Tarayıcı başlatılmamış!")
             return False
         
+        self.last_create_congested = False
         try:
-            self.log(f"E-posta oluşturuluyor: {email}")
-            
-            # 1. E-posta oluşturma sayfasına git
-            create_url = "https://win-webb.wlsrv.com/smb/email-address/create"
-            self.log(f"E-posta oluşturma sayfasına gidiliyor: {create_url}")
-            self.driver.get(create_url)
+            self.submit_create_form(email)
             
-            wait = WebDriverWait(self.driver, 30)
+            # 9. Sunucu yanıtını, satır içi mesajı veya liste sayfasını bekle
+            self.log(f"Form sonucu bekleniyor (max {self.timeouts.get('create_result'):.0f} sn)...")
+            outcome = []
             
-            # 2. E-posta adresi alanını doldur
-            self.log("E-posta adresi giriliyor...")
-            email_input = wait.until(
-                EC.presence_of_element_located((By.ID, "general-generalSection-name"))
-            )
-            email_input.clear()
-            email_input.send_keys(email)
-            
-            # 3. Domain seçimi (varsayılan olarak ilk option seçili kalır)
-            # İsterseniz özel domain seçebilirsiniz
-            # domain_select = Select(self.driver.find_element(By.ID, "general-generalSection-domain"))
-            # domain_select.select_by_visible_text("phoenixtur.com")
-            
-            # 4. "Plesk'te oturum açmak için kullanılabilir" checkbox'ını kaldır
-            self.log("Oturum açma seçeneği kapatılıyor...")
-            login_checkbox = self.driver.find_element(By.ID, "general-generalSection-loginAsUser")
-            if login_checkbox.is_selected():
-                login_checkbox.click()
-                time.sleep(0.3)
-            
-            # 5. Şifre gir
-            self.log("Şifre giriliyor...")
-            password_field = self.driver.find_element(By.ID, "general-generalSection-password")
-            password_field.clear()
-            password_field.send_keys(self.config.password)
-            
-            # 6. Şifre onayı
-            password_confirm = self.driver.find_element(By.ID, "general-generalSection-passwordConfirmation")
-            password_confirm.clear()
-            password_confirm.send_keys(self.config.password)
-            
-            # 7. Posta kutusu boyutu - "Başka bir boyut" seç ve 30 MB ayarla
-            self.log("Posta kutusu boyutu ayarlanıyor (30 MB)...")
-            
-            # "Başka bir boyut" radio butonuna tıkla
-            specific_radio = self.driver.find_element(By.ID, "general-generalSection-mboxQuotaValue-specific")
-            specific_radio.click()
-            time.sleep(0.3)
-            
-            # Boyut değerini gir
-            size_input = self.driver.find_element(By.ID, "general-generalSection-mboxQuotaValue-specific-input")
-            size_input.clear()
-            size_input.send_keys("30")
+            def settled(driver) -> bool:
+                result = self.check_create_result(email)
+                if result is not None:
+                    outcome.append(result)
+                return result is not None
             
-            # MB seç (multiplier dropdown)
-            from selenium.webdriver.support.ui import Select
-            multiplier_select = Select(self.driver.find_element(By.ID, "general-generalSection-mboxQuotaValue-specific-multiplier"))
-            multiplier_select.select_by_value("1048576")  # MB değeri
+            self._until(settled, "create_result", poll_frequency=RESULT_POLL_INTERVAL)
             
-            # 8. Tamam butonuna tıkla
-            self.log("Tamam butonuna tıklanıyor...")
-            submit_button = self.driver.find_element(By.ID, "btn-send")
-            submit_button.click()
-            
-            # 9. E-posta listesi sayfasını bekle (max 60 sn)
-            self.log("E-posta listesi sayfası bekleniyor (max 60 sn)...")
-            wait_long = WebDriverWait(self.driver, 60)
-            wait_long.until(EC.url_contains("/smb/email-address/list"))
+            if not outcome[0]:
+                self.log(f"✗ {email} oluşturulamadı: {self.last_create_error}")
+                return False
             
             self.log(f"✓ {email} başarıyla oluşturuldu!")
             return True
-            
+        
         except TimeoutException as e:
+            self.last_create_congested = True
             error_msg = f"Zaman aşımı hatası: {str(e)}"
             self.log(f"✗ {error_msg}")
             self._show_error_alert(f"E-posta oluşturma başarısız!\n\n{error_msg}\n\nMevcut URL: {self.driver.current_url}")
             return False
         except WebDriverException as e:
+            self.last_create_congested = True
             error_msg = f"Tarayıcı hatası: {str(e)}"
             self.log(f"✗ {error_msg}")
             self._show_error_alert(f"E-posta oluşturma başarısız!\n\n{error_msg}")
@@ -307,6 +558,119 @@ class BotEngine:
             self._show_error_alert(f"E-posta oluşturma başarısız!\n\n{error_msg}")
             return False
     
+    def submit_create_form(self, email: str, rate_limited: bool = True):
+        """
+        E-posta oluşturma formunu aktif sekmede doldur ve gönder
+        
+        Sonucu beklemez; sonuç check_create_result ile okunur.
+        
+        Args:
+            email: Oluşturulacak e-posta adresi (sadece @ öncesi kısım)
+            rate_limited: False ise hız sınırı token'ı çağıran tarafından alınmıştır
+        """
+        if self.panel_limiter and rate_limited:
+            with self._unwatched():
+                waited = self.panel_limiter.acquire(self.cancel_token)
+            if waited > 0:
+                self.log(f"Hız sınırı: panel için {waited:.1f} sn beklendi")
+        # Gecikme buradan ölçülür: hız sınırının kendi beklemesi tıkanma sayılmaz
+        self.submit_started_at = time.monotonic()
+        
+        self.log(f"E-posta oluşturuluyor: {email}")
+        
+        # 1. E-posta oluşturma sayfasına git
+        create_url = self.config.get_panel_url("/smb/email-address/create")
+        self.log(f"E-posta oluşturma sayfasına gidiliyor: {create_url}")
+        self.driver.get(create_url)
+        
+        # 2. E-posta adresi alanını doldur
+        self.log("E-posta adresi giriliyor...")
+        email_input = self._until(EC.presence_of_element_located((By.ID, "general-generalSection-name")), "create_form")
+        email_input.clear()
+        email_input.send_keys(email)
+        
+        # 3. Domain seçimi (varsayılan olarak ilk option seçili kalır)
+        # İsterseniz özel domain seçebilirsiniz
+        # domain_select = Select(self.driver.find_element(By.ID, "general-generalSection-domain"))
+        # domain_select.select_by_visible_text("phoenixtur.com")
+        
+        # 4. "Plesk'te oturum açmak için kullanılabilir" checkbox'ını kaldır
+        self.log("Oturum açma seçeneği kapatılıyor...")
+        login_checkbox = self.driver.find_element(By.ID, "general-generalSection-loginAsUser")
+        if login_checkbox.is_selected():
+            login_checkbox.click()
+            self.cancel_token.sleep(0.3)
+        
+        # 5. Şifre gir
+        self.log("Şifre giriliyor...")
+        password_field = self.driver.find_element(By.ID, "general-generalSection-password")
+        password_field.clear()
+        password_field.send_keys(self.config.password)
+        
+        # 6. Şifre onayı
+        password_confirm = self.driver.find_element(By.ID, "general-generalSection-passwordConfirmation")
+        password_confirm.clear()
+        password_confirm.send_keys(self.config.password)
+        
+        # 7. Posta kutusu boyutu - "Başka bir boyut" seç ve kotayı MB olarak ayarla
+        self.log(f"Posta kutusu boyutu ayarlanıyor ({self.config.mailbox_quota_mb} MB)...")
+        
+        # "Başka bir boyut" radio butonuna tıkla
+        specific_radio = self.driver.find_element(By.ID, "general-generalSection-mboxQuotaValue-specific")
+        specific_radio.click()
+        self.cancel_token.sleep(0.3)
+        
+        # Boyut değerini gir
+        size_input = self.driver.find_element(By.ID, "general-generalSection-mboxQuotaValue-specific-input")
+        size_input.clear()
+        size_input.send_keys(str(self.config.mailbox_quota_mb))
+        
+        # MB seç (multiplier dropdown)
+        from selenium.webdriver.support.ui import Select
+        multiplier_select = Select(self.driver.find_element(By.ID, "general-generalSection-mboxQuotaValue-specific-multiplier"))
+        multiplier_select.select_by_value("1048576")  # MB değeri
+        
+        # 8. Tamam butonuna tıkla
+        if self.submit_monitor:
+            # Aynı posta kutusunun önceki denemelerinden kalan yanıtları at
+            self.submit_monitor.drain()
+            self.submit_monitor.forget(email)
+        self.log("Tamam butonuna tıklanıyor...")
+        submit_button = self.driver.find_element(By.ID, "btn-send")
+        submit_button.click()
+    
+    def check_create_result(self, email: str) -> Optional[bool]:
+        """
+        Aktif sekmedeki form gönderiminin sonucunu beklemeden kontrol et
+        
+        Önce performans günlüğündeki sunucu yanıtına, yoksa sayfadaki satır
+        içi hata mesajına ve liste sayfasına yönlendirmeye bakılır. Hata
+        nedeni last_create_error'a, 5xx/ağ hatası olup olmadığı
+        last_create_congested'e yazılır.
+        
+        Args:
+            email: Gönderilen posta kutusu adı (sadece @ öncesi kısım)
+        
+        Returns:
+            True: başarılı, False: panel hata döndürdü, None: henüz sonuç yok
+        """
+        if self.submit_monitor:
+            self.submit_monitor.drain()
+            response = self.submit_monitor.result(email)
+            if response is not None:
+                success, self.last_create_error = response
+                self.last_create_congested = self.submit_monitor.server_failure
+                return success
+        
+        self.last_create_congested = False
+        url, error = self.driver.execute_script(INLINE_STATUS_SCRIPT, ERROR_SELECTORS)
+        if "/smb/email-address/list" in url:
+            return True
+        if error:
+            self.last_create_error = error
+            return False
+        return None
+    
     def _show_error_alert(self, message: str):
         """
         JavaScript alert ile hata mesajı göster
@@ -329,49 +693,322 @@ class BotEngine:
         Args:
             email_address: Tam e-posta adresi (örn: test100@mailpanel.phoenixtur.com)
             password: E-posta şifresi
-            
+        
         Returns:
             True: başarılı, False: başarısız
         """
-        api_url = "https://mailpanel2.phoenixtur.com/api/email-accounts/"
+        return self.mailpanel.register(email_address, password)
+    
+    def list_mailboxes(self) -> set:
+        """
+        Paneldeki tüm posta kutularını liste sayfasından toplu olarak oku
+        
+        Returns:
+            Küçük harfe çevrilmiş e-posta adresleri kümesi
+        """
+        return set(self.list_mailbox_rows())
+    
+    def list_mailbox_rows(self) -> dict:
+        """
+        Posta kutusu listesini düzenleme bağlantılarıyla birlikte oku
+        
+        Sayfa boyutu "Tümü" olarak ayarlanır ve satırlar tek bir
+        execute_script çağrısıyla toplanır; posta kutusu başına sayfa
+        yüklemesi yapılmaz.
+        
+        Returns:
+            Küçük harfe çevrilmiş adres -> düzenleme sayfası URL'i (yoksa None)
+        """
+        list_url = self.config.get_panel_url("/smb/email-address/list")
+        self.log(f"Posta kutusu listesi okunuyor: {list_url}")
+        self.driver.get(list_url)
+        
+        self._until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody")), "mailbox_list")
+        
+        # Sayfalama varsa tüm kayıtları tek sayfada göster
+        self.driver.execute_script("""
+            const links = Array.from(document.querySelectorAll('a, button'));
+            const all = links.find(el => ['Tümü', 'All'].includes(el.textContent.trim()));
+            if (all) { all.click(); }
+        """)
+        self.cancel_token.sleep(1)
+        
+        # Satır sayısı sabitlenene kadar bekle (liste yeniden yükleniyor olabilir)
+        previous = -1
+        rows = []
+        for _ in range(20):
+            rows = self.driver.execute_script("""
+                return Array.from(document.querySelectorAll('table tbody tr')).map(row => {
+                    const link = row.querySelector("a[href*='/email-address/edit']");
+                    return [row.innerText, link ? link.href : null];
+                });
+            """) or []
+            if len(rows) == previous:
+                break
+            previous = len(rows)
+            self.cancel_token.sleep(0.5)
+        
+        email_pattern = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+        mailboxes = {}
+        for text, href in rows:
+            match = email_pattern.search(text)
+            if match:
+                mailboxes[match.group(0).lower()] = href
+        
+        self.log(f"Panelde {len(mailboxes)} posta kutusu bulundu")
+        return mailboxes
+    
+    def register_created(self, email_prefix: str) -> bool:
+        """
+        Oluşturulan posta kutusunu mailpanel'e kaydet
+        
+        Args:
+            email_prefix: Posta kutusu adı (@ öncesi kısım)
+        """
+        # Domain'i config'den al (varsayılan mailpanel.phoenixtur.com)
+        full_email = f"{email_prefix}{MAILPANEL_DOMAIN}"
+        with self._step("register_email_to_mailpanel"):
+            return self.register_email_to_mailpanel(
+                full_email, 
+                self.config.password
+            )
+    
+    def _record_result(self, results: dict, index: int, success: bool):
+        """
+        Bir öğenin sonucunu kaydet, başarılıysa mailpanel'e bildir
         
-        # E-posta adresinden name oluştur
-        email_name = email_address.split("@")[0]
+        Args:
+            results: run() sonuç sözlüğü
+            index: Öğenin aralıktaki sırası
+            success: create_email sonucu
+        """
+        email = self.config.get_email(index)  # Tam email (log ve API için)
+        email_prefix = self.config.get_email_prefix(index)
         
-        payload = {
-            "name": f"Phoenix {email_name}",
-            "email_address": email_address,
-            "password": password,
-            "check_interval": 5,
-            "is_active": True
+        # Başarılı oluşturma sonrası Mailpanel'e kaydet
+        interrupted = False
+        try:
+            mailpanel_success = self.register_created(email_prefix) if success else False
+        except Cancelled:
+            # Posta kutusu oluştu; kayıt --reconcile ile tamamlanabilir
+            self.log(f"✗ {email}: mailpanel kaydı durdurma isteğiyle kesildi")
+            mailpanel_success = False
+            interrupted = True
+        
+        detail = {
+            "email": email,
+            "success": success,
+            "mailpanel_registered": mailpanel_success
         }
+        results["details"].append(detail)
+        if success and not interrupted:
+            self.verify_created(email_prefix, detail)
+        
+        if success:
+            results["success"] += 1
+        else:
+            results["failed"] += 1
+        self.history.record_item(success)
+        if interrupted:
+            raise Cancelled()
         
+        # Kalan süreyi bu çalışmanın gözlenen hızıyla güncelle
+        done = results["success"] + results["failed"]
+        if done < self.config.count:
+            remaining = self.planner.remaining(done, time.monotonic() - self._create_started)
+            self.log(f"Tahmini kalan süre: {format_duration(remaining)} ({done}/{self.config.count})")
+    
+    def _record_cancelled(self, results: dict, index: int):
+        """
+        Sonucu alınamadan durdurulan öğeyi iptal olarak kaydet
+        
+        Form gönderilmiş olabilir; posta kutusu panelde oluşmuş olabilir.
+        """
+        email = self.config.get_email(index)
+        self.log(f"✗ {email}: iptal edildi")
+        results["details"].append({
+            "email": email,
+            "success": False,
+            "cancelled": True,
+            "mailpanel_registered": False
+        })
+        results["cancelled"] = results.get("cancelled", 0) + 1
+    
+    def shutdown_cancelled(self, results: dict):
+        """Durdurma isteğinden sonra doğrulamaları bitir ve tarayıcıyı kapat"""
+        self.log(f"\n=== Bot durduruldu! Başarılı: {results['success']}, Başarısız: {results['failed']}, "
+                 f"İptal: {results.get('cancelled', 0)} ===")
+        self.running = False
         try:
-            self.log(f"Mailpanel API'ye kayıt gönderiliyor: {email_address}")
+            self.stop()
+        except WebDriverException as e:
+            self.log(f"Tarayıcı kapatılamadı: {str(e)}")
+        self.finish_verification(results)
+    
+    def verify_created(self, email_prefix: str, detail: dict):
+        """
+        Oluşturulan posta kutusunu arka planda IMAP ile doğrula
+        
+        Sonuç geldiğinde detail["verified"] True/False olur; doğrulama
+        kapalıysa hiçbir şey yapılmaz.
+        
+        Args:
+            email_prefix: Posta kutusu adı (@ öncesi kısım)
+            detail: Öğenin sonuç kaydı
+        """
+        if not self.verifier:
+            return
+        detail["verified"] = None
+        self.verifier.submit(
+            f"{email_prefix}{MAILPANEL_DOMAIN}",
+            self.config.password,
+            lambda verified: detail.update(verified=verified)
+        )
+    
+    def finish_verification(self, results: dict):
+        """
+        Bekleyen IMAP doğrulamalarını bekle ve sonuçları özetle
+        
+        Bot durdurulduysa henüz başlamamış doğrulamalar iptal edilir.
+        """
+        if not self.verifier:
+            return
+        self.log("IMAP doğrulamaları bekleniyor...")
+        self.verifier.wait(cancel=not self.running)
+        
+        outcomes = [detail["verified"] for detail in results["details"] if "verified" in detail]
+        results["verified"] = outcomes.count(True)
+        results["unverified"] = outcomes.count(False)
+        self.log(f"=== IMAP doğrulama: {results['verified']} doğrulandı, "
+                 f"{results['unverified']} doğrulanamadı, {outcomes.count(None)} kontrol edilmedi ===")
+    
+    def _observe(self, latency: float, congested: bool, submitted_at: Optional[float] = None):
+        """
+        Öğe sonucunu eşzamanlılık denetleyicisine ve devre kesiciye bildir
+        
+        Args:
+            latency: Öğenin gönderimden sonuca kadar süresi
+            congested: Zaman aşımı, 5xx veya tarayıcı hatası (doğrulama hataları değil)
+            submitted_at: Öğenin gönderim zamanı (time.monotonic)
+        """
+        previous = self.concurrency.active
+        current = self.concurrency.record(latency, congested, submitted_at)
+        if current != previous:
+            self.log(f"Eşzamanlılık: {previous} → {current} sekme")
+        
+        if self.breaker.record(congested):
+            self.log(f"✗ Devre kesici açıldı: art arda {self.breaker.failures} hata, "
+                     f"panel {self.breaker.remaining():.0f} sn dinlendiriliyor")
+    
+    def _probe_breaker(self):
+        """Devre açıkken aktif sekmede paneli yokla"""
+        self.log("Panel yoklanıyor...")
+        with self._step("probe_panel"):
+            healthy = self.probe_panel()
+        self.breaker.record_probe(healthy)
+        if healthy:
+            self.log("✓ Panel yanıt veriyor, devre kapandı")
+        else:
+            self.log(f"✗ Panel yoklaması başarısız, {self.breaker.remaining():.0f} sn sonra tekrar denenecek")
+    
+    def wait_for_breaker(self) -> bool:
+        """
+        Devre açıksa kapanana kadar bekle (süre dolunca panel yoklanır)
+        
+        Returns:
+            False: beklerken bot durduruldu
+        """
+        while self.breaker.is_open and self.running:
+            if self.breaker.ready_to_probe():
+                self._probe_breaker()
+            else:
+                self.cancel_token.sleep(min(1.0, self.breaker.remaining()))
+        return self.running
+    
+    def create_one(self, email_prefix: str, email: str) -> tuple[bool, bool]:
+        """
+        Tek bir posta kutusunu öğe bekçisi altında oluştur (mailpanel kaydı hariç)
+        
+        Adım süresi geçmişe, gecikme ve tıkanma eşzamanlılık denetleyicisine
+        ve devre kesiciye bildirilir. Sıralı döngü ve kuyruk işçisi kullanır.
+        
+        Args:
+            email_prefix: Posta kutusu adı (@ öncesi kısım)
+            email: Log ve bekçi etiketi için tam adres
+        
+        Returns:
+            (oluşturuldu mu, bekçi takılan tarayıcıyı öldürdü mü); takılmada
+            çağıran recover_browser ile devam etmelidir
+        
+        Raises:
+            Cancelled: Durdurma istendi
+        """
+        if self.profiler:
+            self.profiler.set_item(email)
+        
+        self.submit_started_at = None
+        with self._step("create_email"), self._watch(email):
+            success = self.create_email(email_prefix)
+        hung = self._check_hang()
+        started_at = self.submit_started_at if self.submit_started_at is not None else time.monotonic()
+        self._observe(time.monotonic() - started_at, hung or self.last_create_congested, started_at)
+        return success and not hung, hung
+    
+    def _create_all(self, results: dict):
+        """
+        Aralıktaki tüm e-postaları sırayla oluştur
+        
+        Args:
+            results: run() sonuç sözlüğü
+        """
+        for i in range(self.config.count):
+            if not self.wait_for_breaker():
+                self.log("Bot durduruldu!")
+                break
             
-            response = requests.post(
-                api_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
+            email = self.config.get_email(i)  # Tam email (log ve API için)
+            email_prefix = self.config.get_email_prefix(i)  # Sadece prefix (input için)
+            self.log(f"\n--- E-posta {i+1}/{self.config.count}: {email} ---")
+            try:
+                success, hung = self.create_one(email_prefix, email)
+            except Cancelled:
+                self._record_cancelled(results, i)
+                raise
             
-            if response.status_code in [200, 201]:
-                self.log(f"✓ Mailpanel'e kaydedildi: {email_address}")
-                return True
-            else:
-                self.log(f"✗ Mailpanel API hatası: {response.status_code} - {response.text}")
-                return False
-                
-        except requests.exceptions.Timeout:
-            self.log(f"✗ Mailpanel API zaman aşımı: {email_address}")
-            return False
-        except requests.exceptions.RequestException as e:
-            self.log(f"✗ Mailpanel API bağlantı hatası: {str(e)}")
-            return False
-        except Exception as e:
-            self.log(f"✗ Mailpanel kayıt hatası: {str(e)}")
-            return False
+            self._record_result(results, i, success)
+            
+            # Bekçi tarayıcıyı öldürdüyse yeniden başlat ve sonraki öğeyle devam et
+            if hung and not self.recover_browser():
+                self.log("Tarayıcı kurtarılamadı! Bot durduruluyor.")
+                break
+            
+            # Sonraki işlem için bekle
+            if i < self.config.count - 1 and self.running:
+                with self._step("delay_between_logins"):
+                    self.cancel_token.sleep(self.config.delay_between_logins)
+    
+    def use_config(self, config: BotConfig):
+        """
+        Açık oturumda başka bir aralığa geç (prefix, şifre, aralık, kota)
+        
+        Tarayıcı, giriş, eşzamanlılık ve hız sınırı durumu korunur.
+        """
+        self.config = config
+        self.planner = RunPlanner(config, self.history)
+    
+    def create_range(self, results: dict):
+        """
+        Giriş yapılmış oturumda yapılandırmadaki aralığı oluştur
+        
+        Args:
+            results: Sonuç sözlüğü (total, success, failed, details)
+        """
+        for line in self.planner.describe() + self.timeouts.describe():
+            self.log(line)
+        
+        self._create_started = time.monotonic()
+        self._create_all(results)
+        self.finish_verification(results)
     
     def run(self) -> dict:
         """
@@ -386,69 +1023,112 @@ class BotEngine:
             "total": self.config.count,
             "success": 0,
             "failed": 0,
+            "cancelled": 0,
             "details": []
         }
         
         try:
+            # Motor oluşurken durdurulduysa Chrome hiç başlatılmaz
+            self.cancel_token.check()
             self.start()
             
-            # 1. Panel girişi
+            # 1. Panel girişi ve dashboard (kayıtlı oturum geçerliyse atlanır)
             self.log("\n=== ADIM 1: Panel Girişi ===")
-            if not self.panel_login():
+            if not self.login():
                 self.log("Panel girişi başarısız! Bot durduruluyor.")
                 return results
             
-            # 2. Dashboard sayfasını bekle
-            self.log("\n=== ADIM 2: Dashboard Bekleniyor ===")
-            if not self.wait_for_dashboard():
-                self.log("Dashboard sayfasına ulaşılamadı! Bot durduruluyor.")
-                return results
+            # 2. E-postaları oluştur
+            self.log("\n=== ADIM 2: E-posta Oluşturma ===")
+            self.create_range(results)
+            self.log_cache_stats()
             
-            # 3. E-postaları oluştur
-            self.log("\n=== ADIM 3: E-posta Oluşturma ===")
+            self.log(f"\n=== Bot tamamlandı! Başarılı: {results['success']}, Başarısız: {results['failed']} ===")
+            self.log("Tarayıcı açık bırakıldı. Manuel olarak kapatabilirsiniz.")
+        
+        except Cancelled:
+            self.shutdown_cancelled(results)
+        except Exception as e:
+            self.log(f"Kritik hata: {str(e)}")
+            # Sadece hata durumunda tarayıcıyı kapat
+            self.stop()
+        finally:
+            try:
+                self.history.save()
+            except OSError as e:
+                self.log(f"Zamanlama geçmişi kaydedilemedi: {str(e)}")
+            self.report_hangs(results)
+            if self.profiler:
+                results["profile"] = self.profiler.summary()
+                self.log(self.profiler.report())
+            self.close()
+        
+        return results
+    
+    def run_jobs(self, jobs: list) -> dict:
+        """
+        Birden fazla işi tek tarayıcı ve tek panel girişiyle art arda çalıştır
+        
+        Args:
+            jobs: İş başına BotConfig listesi (prefix, şifre, aralık, kota)
+        
+        Returns:
+            Toplam sonuçlar; iş başına sonuçlar "jobs" altında
+        """
+        base_config = self.config
+        job_results = [
+            {"prefix": job.prefix, "total": job.count, "success": 0, "failed": 0, "cancelled": 0, "details": []}
+            for job in jobs
+        ]
+        summary = combined_summary(job_results)
+        
+        try:
+            self.cancel_token.check()
+            self.start()
             
-            for i in range(self.config.count):
+            self.log("\n=== ADIM 1: Panel Girişi ===")
+            if not self.login():
+                self.log("Panel girişi başarısız! Bot durduruluyor.")
+                return summary
+            
+            for number, (job, results) in enumerate(zip(jobs, job_results), 1):
+                self.cancel_token.check()
                 if not self.running:
-                    self.log("Bot durduruldu!")
                     break
-                
-                email = self.config.get_email(i)  # Tam email (log ve API için)
-                email_prefix = self.config.get_email_prefix(i)  # Sadece prefix (input için)
-                self.log(f"\n--- E-posta {i+1}/{self.config.count}: {email} ---")
-                
-                success = self.create_email(email_prefix)
-                
-                # Başarılı oluşturma sonrası Mailpanel'e kaydet
-                mailpanel_success = False
-                if success:
-                    # Domain'i config'den al (varsayılan mailpanel.phoenixtur.com)
-                    full_email = f"{email_prefix}@mailpanel.phoenixtur.com"
-                    mailpanel_success = self.register_email_to_mailpanel(
-                        full_email, 
-                        self.config.password
-                    )
-                
-                results["details"].append({
-                    "email": email,
-                    "success": success,
-                    "mailpanel_registered": mailpanel_success
-                })
-                
-                if success:
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
-                
-                # Sonraki işlem için bekle
-                if i < self.config.count - 1 and self.running:
-                    time.sleep(self.config.delay_between_logins)
+                self.use_config(job)
+                self.log(f"\n=== {describe_job(number, len(jobs), job)} ===")
+                try:
+                    self.create_range(results)
+                except Cancelled:
+                    # Tarayıcı kapanmadan önce işin doğrulamaları bu iş adına toplanır
+                    self.shutdown_cancelled(results)
+                    raise
+                self.log(f"=== İş {number} tamamlandı: Başarılı: {results['success']}, "
+                         f"Başarısız: {results['failed']} ===")
             
-            self.log(f"\n=== Bot tamamlandı! Başarılı: {results['success']}, Başarısız: {results['failed']} ===")
+            self.log_cache_stats()
+            summary = combined_summary(job_results)
+            self.log(f"\n=== Tüm işler tamamlandı! Başarılı: {summary['success']}, "
+                     f"Başarısız: {summary['failed']} ===")
             self.log("Tarayıcı açık bırakıldı. Manuel olarak kapatabilirsiniz.")
-            
+        
+        except Cancelled:
+            self.log("Kalan işler iptal edildi.")
+            self.stop()
         except Exception as e:
             self.log(f"Kritik hata: {str(e)}")
-            # Sadece hata durumunda tarayıcıyı kapat
             self.stop()
+        finally:
+            self.use_config(base_config)
+            summary = combined_summary(job_results)
+            try:
+                self.history.save()
+            except OSError as e:
+                self.log(f"Zamanlama geçmişi kaydedilemedi: {str(e)}")
+            self.report_hangs(summary)
+            if self.profiler:
+                summary["profile"] = self.profiler.summary()
+                self.log(self.profiler.report())
+            self.close()
         
-        return results
+        return summary
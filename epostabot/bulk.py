@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu Posta Kutusu İşlemleri
+Prefix/aralıktaki posta kutularını silme, kota değiştirme ve şifre sıfırlama
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
+
+from .bot import BotEngine
+from .journal import Journal
+from .mailpanel import MAILPANEL_DOMAIN
+
+
+OPERATIONS = ("delete", "quota", "password")
+
+# Liste sayfasındaki seçili satırları işaretleyen betik
+SELECT_ROWS_SCRIPT = """
+    const targets = new Set(arguments[0]);
+    const pattern = /[\\w.+-]+@[\\w-]+(?:\\.[\\w-]+)+/;
+    const selected = [];
+    for (const row of document.querySelectorAll('table tbody tr')) {
+        const match = row.innerText.match(pattern);
+        const box = row.querySelector("input[type='checkbox']");
+        if (!match || !box) { continue; }
+        const address = match[0].toLowerCase();
+        if (targets.has(address) && !box.checked) { box.click(); }
+        if (targets.has(address)) { selected.push(address); }
+    }
+    return selected;
+"""
+
+# Metni verilen düğmelerden ilkine tıklayan betik
+CLICK_BUTTON_SCRIPT = """
+    const scope = arguments[1] ? document.querySelectorAll(arguments[1]) : [document];
+    for (const root of scope) {
+        for (const el of root.querySelectorAll('button, a')) {
+            if (arguments[0].includes(el.textContent.trim())) { el.click(); return true; }
+        }
+    }
+    return false;
+"""
+
+REMOVE_LABELS = ["Kaldır", "Sil", "Remove"]
+# Grup "Kaldır" düğmesi sadece liste araç çubuğunda aranır (satır içi bağlantılar hariç)
+TOOLBAR_SELECTOR = ".pul-toolbar, .pul-list__toolbar, [role='toolbar']"
+CONFIRM_LABELS = ["Evet, kaldır", "Evet", "Yes, remove", "Yes", "Kaldır", "Remove"]
+DIALOG_SELECTOR = "[role='dialog'], .pul-dialog, .popup-panel"
+
+
+def _submit_succeeded(response) -> bool:
+    """
+    Form gönderiminin yanıtı açıkça başarılı mı
+    
+    Panel başarıda JSON {"status": "success"} döndürür veya düzenlenen
+    kaydın sayfasına yönlendirir. Login sayfasına yönlendirme oturumun
+    düştüğünü gösterir.
+    """
+    if "login" in urlsplit(response.url).path:
+        return False
+    if response.history:
+        return True
+    try:
+        payload = response.json()
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and payload.get("status") == "success"
+
+
+class _FormParser(HTMLParser):
+    """Düzenleme sayfasındaki form alanlarını ve güvenlik token'ını topla"""
+    
+    def __init__(self):
+        super().__init__()
+        self.values = {}
+        self.names = {}  # element id -> name
+        self.radio_values = {}  # element id -> value
+        self.token = None
+        self._select = None
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        name = attrs.get("name")
+        
+        if tag == "meta" and name == "forgery_protection_token":
+            self.token = attrs.get("content")
+            return
+        
+        if attrs.get("id") and name:
+            self.names[attrs["id"]] = name
+        
+        if tag == "input" and name:
+            kind = attrs.get("type", "text")
+            if kind == "radio":
+                self.radio_values[attrs.get("id")] = attrs.get("value", "")
+            if kind in ("radio", "checkbox") and "checked" not in attrs:
+                return
+            if kind in ("submit", "button"):
+                return
+            self.values[name] = attrs.get("value", "")
+        elif tag == "select" and name:
+            self._select = name
+        elif tag == "option" and self._select:
+            if self._select not in self.values or "selected" in attrs:
+                self.values[self._select] = attrs.get("value", "")
+    
+    def handle_endtag(self, tag):
+        if tag == "select":
+            self._select = None
+
+
+class BulkOperations:
+    """Aynı BotConfig aralık modeli üzerinde toplu posta kutusu işlemleri"""
+    
+    def __init__(
+        self,
+        engine: BotEngine,
+        journal: Optional[Journal] = None,
+        workers: int = 8,
+        batch_size: int = 100
+    ):
+        """
+        Args:
+            engine: Panele giriş yapacak bot motoru
+            journal: İşlem günlüğü (opsiyonel)
+            workers: HTTP form yolunda eşzamanlı istek sayısı
+            batch_size: Silme işleminde tek gönderimde seçilecek satır sayısı
+        """
+        self.engine = engine
+        self.config = engine.config
+        self.journal = journal or Journal()
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+    
+    def log(self, message: str):
+        """Log mesajı gönder"""
+        self.engine.log(message)
+    
+    def find_targets(self) -> dict:
+        """
+        Paneldeki posta kutularından aralığa düşenleri bul
+        
+        Returns:
+            Adres -> düzenleme sayfası URL'i
+        """
+        expected = {
+            f"{self.config.get_email_prefix(i)}{MAILPANEL_DOMAIN}".lower()
+            for i in range(self.config.count)
+        }
+        rows = self.engine.list_mailbox_rows()
+        return {address: href for address, href in rows.items() if address.lower() in expected}
+    
+    def delete(self, addresses: list) -> dict:
+        """
+        Liste sayfasının çoklu seçim ve grup silme işlemiyle posta kutularını sil
+        
+        Her gönderimde batch_size kadar satır seçilir; posta kutusu başına
+        sayfa yüklemesi yapılmaz. Grubun tüm satırları seçilemezse grup
+        gönderilmez ve günlüğe "skipped" yazılır. Sonuç, liste yeniden
+        okunarak doğrulanır.
+        
+        Returns:
+            Adres -> başarı durumu (atlanan gruplarda None)
+        """
+        driver = self.engine.driver
+        remaining = list(addresses)
+        skipped = set()
+        
+        for start in range(0, len(remaining), self.batch_size):
+            batch = remaining[start:start + self.batch_size]
+            self.log(f"Silme grubu: {len(batch)} posta kutusu seçiliyor...")
+            if start:
+                self.engine.list_mailbox_rows()
+            
+            if self.engine.panel_limiter:
+                self.engine.panel_limiter.acquire(self.engine.cancel_token)
+            
+            selected = driver.execute_script(SELECT_ROWS_SCRIPT, batch) or []
+            if not selected:
+                self.log("✗ Seçilecek satır bulunamadı")
+                continue
+            
+            # Eksik seçimle silme gönderilmez (yanlış satır riski yerine grubu atla)
+            if set(selected) != set(batch):
+                missing = sorted(set(batch) - set(selected))
+                reason = f"{len(selected)}/{len(batch)} satır seçildi, eksik: {', '.join(missing)}"
+                self.log(f"✗ Silme grubu atlandı: {reason}")
+                for address in batch:
+                    self.journal.record("delete", address, "skipped", reason=reason)
+                skipped.update(batch)
+                continue
+            
+            if not driver.execute_script(CLICK_BUTTON_SCRIPT, REMOVE_LABELS, TOOLBAR_SELECTOR):
+                self.log("✗ Liste araç çubuğunda Kaldır düğmesi bulunamadı")
+                continue
+            
+            try:
+                self.engine._until(
+                    lambda d: d.execute_script(CLICK_BUTTON_SCRIPT, CONFIRM_LABELS, DIALOG_SELECTOR),
+                    "confirm_dialog"
+                )
+            except TimeoutException:
+                self.log("✗ Silme onay penceresi bulunamadı")
+                continue
+            
+            # Grup işleminin tamamlanmasını bekle
+            self.engine.cancel_token.sleep(2)
+        
+        left = set(self.engine.list_mailboxes())
+        return {address: None if address in skipped else address not in left for address in addresses}
+    
+    def _session(self):
+        """Tarayıcı oturum çerezleriyle bir HTTP oturumu oluştur"""
+        import requests
+        
+        session = requests.Session()
+        for cookie in self.engine.driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
+        session.headers["User-Agent"] = self.engine.driver.execute_script("return navigator.userAgent;")
+        return session
+    
+    def _submit_edit_form(self, session, address: str, edit_url: str, overrides: dict) -> bool:
+        """
+        Düzenleme formunu tarayıcı açmadan HTTP ile gönder
+        
+        Başarı sadece açık JSON "status": "success" yanıtı veya login sayfası
+        dışına yönlendirme ile sayılır; login sayfasına düşen (oturumu düşmüş)
+        veya tanınmayan yanıtlar başarısızdır.
+        
+        Args:
+            overrides: Element id -> yeni değer (radio için None: o seçeneği işaretle)
+        """
+        if self.engine.panel_limiter:
+            self.engine.panel_limiter.acquire(self.engine.cancel_token)
+        
+        try:
+            page = session.get(edit_url, timeout=30)
+            page.raise_for_status()
+            
+            form = _FormParser()
+            form.feed(page.text)
+            
+            data = dict(form.values)
+            for element_id, value in overrides.items():
+                name = form.names.get(element_id)
+                if not name:
+                    raise ValueError(f"Form alanı bulunamadı: {element_id}")
+                data[name] = form.radio_values.get(element_id, "") if value is None else value
+            
+            headers = {"X-Requested-With": "XMLHttpRequest"}
+            if form.token:
+                data["forgery_protection_token"] = form.token
+                headers["X-Forgery-Protection-Token"] = form.token
+            
+            response = session.post(edit_url, data=data, headers=headers, timeout=30)
+            response.raise_for_status()
+            
+            ok = _submit_succeeded(response)
+            self.log(f"✓ {address}" if ok else f"✗ {address}: beklenmeyen yanıt (HTTP {response.status_code})")
+            return ok
+        
+        except Exception as e:
+            self.log(f"✗ {address}: {str(e)}")
+            return False
+    
+    def update(self, targets: dict, overrides: dict) -> dict:
+        """
+        Düzenleme formlarını eşzamanlı olarak HTTP ile gönder
+        
+        Returns:
+            Adres -> başarı durumu
+        """
+        session = self._session()
+        
+        def submit(address):
+            edit_url = targets[address]
+            if not edit_url:
+                self.log(f"✗ {address}: düzenleme bağlantısı yok")
+                return False
+            return self._submit_edit_form(session, address, edit_url, overrides)
+        
+        addresses = sorted(targets)
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(addresses))) as executor:
+            return dict(zip(addresses, executor.map(submit, addresses)))
+    
+    def run(
+        self,
+        operation: str,
+        dry_run: bool = False,
+        quota_mb: Optional[int] = None,
+        new_password: Optional[str] = None
+    ) -> dict:
+        """
+        Toplu işlemi çalıştır
+        
+        Args:
+            operation: delete, quota veya password
+            dry_run: True ise sadece etkilenecek posta kutularını listele
+            quota_mb: quota işlemi için yeni boyut (MB)
+            new_password: password işlemi için yeni şifre
+        
+        Returns:
+            Sonuç istatistikleri
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Bilinmeyen işlem: {operation}")
+        
+        results = {"total": 0, "success": 0, "failed": 0, "details": []}
+        
+        try:
+            self.engine.start()
+            
+            self.log("\n=== ADIM 1: Panel Girişi ===")
+            if not self.engine.login():
+                self.log("Panel girişi başarısız! İşlem durduruluyor.")
+                return results
+            
+            self.log("\n=== ADIM 2: Hedef Posta Kutuları ===")
+            targets = self.find_targets()
+            results["total"] = len(targets)
+            self.log(f"=== {operation}: {len(targets)} posta kutusu ===")
+            
+            if dry_run or not targets:
+                for address in sorted(targets):
+                    self.log(f"  [DRY-RUN] {operation}: {address}")
+                    self.journal.record(operation, address, "dry-run")
+                return results
+            
+            self.log("\n=== ADIM 3: Toplu İşlem ===")
+            if operation == "delete":
+                outcomes = self.delete(sorted(targets))
+            elif operation == "quota":
+                outcomes = self.update(targets, {
+                    "general-generalSection-mboxQuotaValue-specific": None,
+                    "general-generalSection-mboxQuotaValue-specific-input": str(quota_mb),
+                    "general-generalSection-mboxQuotaValue-specific-multiplier": "1048576",
+                })
+            else:
+                outcomes = self.update(targets, {
+                    "general-generalSection-password": new_password,
+                    "general-generalSection-passwordConfirmation": new_password,
+                })
+            
+            for address, ok in sorted(outcomes.items()):
+                if ok is None:
+                    # Atlanan grup: günlüğe gerekçesiyle "skipped" olarak yazıldı
+                    results["details"].append({"email": address, "success": False, "skipped": True})
+                    results["failed"] += 1
+                    continue
+                results["details"].append({"email": address, "success": ok})
+                results["success" if ok else "failed"] += 1
+                self.journal.record(operation, address, "ok" if ok else "failed")
+            
+            self.log(f"\n=== Toplu işlem tamamlandı! Başarılı: {results['success']}, Başarısız: {results['failed']} ===")
+        
+        except Exception as e:
+            self.log(f"Kritik hata: {str(e)}")
+            results["error"] = str(e)
+        finally:
+            self.engine.stop()
+        
+        return results
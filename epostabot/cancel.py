@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İşbirlikçi İptal
+Durdurma isteğini motorun tüm beklemelerine (sleep, WebDriverWait, HTTP)
+ileten paylaşımlı iptal bayrağı
+"""
+
+import threading
+from typing import Callable
+
+
+# Engelleyen çağrılar beklenirken iptal bayrağının kontrol aralığı
+CHECK_INTERVAL = 0.1
+
+
+class Cancelled(BaseException):
+    """
+    Çalışma durdurma isteğiyle kesildi
+    
+    asyncio.CancelledError gibi BaseException'dan türer; adımlardaki genel
+    "except Exception" blokları iptali hata sanıp yutmaz.
+    """
+
+
+class CancelToken:
+    """Bir çalışmanın durdurma isteği (thread'ler ve sinyal işleyicileri arasında paylaşılır)"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Durdurma istendi mi"""
+        return self._event.is_set()
+    
+    def cancel(self):
+        """Durdurma iste (herhangi bir thread'den veya sinyal işleyicisinden)"""
+        self._event.set()
+    
+    def check(self):
+        """
+        Durdurma istendiyse çalışmayı kes
+        
+        Raises:
+            Cancelled: Durdurma istendi
+        """
+        if self._event.is_set():
+            raise Cancelled()
+    
+    def sleep(self, seconds: float):
+        """
+        time.sleep yerine; durdurma isteğinde beklemeden uyanır
+        
+        Raises:
+            Cancelled: Beklerken durdurma istendi
+        """
+        if self._event.wait(max(0.0, seconds)):
+            raise Cancelled()
+    
+    def wrap(self, condition: Callable) -> Callable:
+        """
+        WebDriverWait koşulunu her yoklamada önce iptal bayrağına baktır
+        
+        İstek en geç bir yoklama aralığında (poll_frequency) fark edilir.
+        """
+        def checked(driver):
+            self.check()
+            return condition(driver)
+        return checked
+    
+    def call(self, function: Callable, *args, **kwargs):
+        """
+        Engelleyen çağrıyı (örn. HTTP isteği) ayrı thread'de çalıştır ve iptal
+        edilebilir şekilde bekle
+        
+        Kesilen çağrı arka planda kendi zaman aşımına kadar sürer; sonucu atılır.
+        
+        Returns:
+            Çağrının sonucu (istisnası aynen fırlatılır)
+        
+        Raises:
+            Cancelled: Beklerken durdurma istendi
+        """
+        self.check()
+        outcome = {}
+        done = threading.Event()
+        
+        def run():
+            try:
+                outcome["value"] = function(*args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+        
+        threading.Thread(target=run, name="cancellable-call", daemon=True).start()
+        while not done.wait(CHECK_INTERVAL):
+            self.check()
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["value"]
@@ -6,10 +6,13 @@ GUI olmadan argümanlarla çalıştırma
 """
 
 import argparse
+import os
+import signal
 import sys
+from contextlib import contextmanager
+from typing import Callable
 
 from .config import BotConfig
-from .bot import BotEngine
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -22,24 +25,80 @@ def create_parser() -> argparse.ArgumentParser:
   %(prog)s -p italyavize -s 100 -c 10 -w sifre123
   %(prog)s --prefix test --start 1 --count 5 --password pass --headless
   %(prog)s -p demo -s 50 -c 3 -w pass123 --url https://example.com/login
+  %(prog)s -p italyavize -s 100 -c 10 -w sifre123 --panel-email admin --reconcile
+  %(prog)s -p italyavize -s 100 -c 50 -w x --panel-email admin --bulk quota --quota 100
+  %(prog)s -p italyavize -s 100 -c 500 -w sifre123 --queue /queue/jobs.db --enqueue
+  %(prog)s --queue /queue/jobs.db --worker --headless --panel-email admin
+  %(prog)s --manifest jobs.yaml --headless --tabs 4
+
+Panel şifresi EPOSTABOT_PANEL_PASSWORD ortam değişkeninden de okunabilir.
         """
     )
     
-    # Zorunlu argümanlar
+    # Zorunlu argümanlar (kuyruk işçisi ve kuyruk durumu hariç)
     required = parser.add_argument_group("Zorunlu argümanlar")
     required.add_argument(
         "-p", "--prefix",
         type=str,
-        required=True,
+        default="",
         help="E-posta prefix'i (örn: italyavize)"
     )
     required.add_argument(
         "-w", "--password",
         type=str,
-        required=True,
+        default="",
         help="E-posta şifresi"
     )
     
+    # Panel giriş bilgileri
+    panel = parser.add_argument_group("Panel giriş bilgileri")
+    panel.add_argument(
+        "--panel-email",
+        type=str,
+        default=os.environ.get("EPOSTABOT_PANEL_EMAIL", ""),
+        help="Panel giriş e-postası (varsayılan: $EPOSTABOT_PANEL_EMAIL)"
+    )
+    panel.add_argument(
+        "--panel-password",
+        type=str,
+        default=os.environ.get("EPOSTABOT_PANEL_PASSWORD", ""),
+        help="Panel giriş şifresi (varsayılan: $EPOSTABOT_PANEL_PASSWORD)"
+    )
+    
+    # Dağıtık kuyruk
+    queue = parser.add_argument_group("Dağıtık kuyruk")
+    queue.add_argument(
+        "--queue",
+        type=str,
+        help="Paylaşımlı kuyruk (SQLite dosyası veya sqlite:///yol)"
+    )
+    queue.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Prefix/aralığı kuyruğa ekle ve çık"
+    )
+    queue.add_argument(
+        "--worker",
+        action="store_true",
+        help="Kuyruktan iş kiralayan işçi olarak çalış"
+    )
+    queue.add_argument(
+        "--queue-status",
+        action="store_true",
+        help="Kuyruğun merkezi özetini göster"
+    )
+    queue.add_argument(
+        "--lease",
+        type=float,
+        default=120,
+        help="Kiralama süresi saniye (varsayılan: 120)"
+    )
+    queue.add_argument(
+        "--worker-id",
+        type=str,
+        help="İşçi adı (varsayılan: host-pid)"
+    )
+    
     # Opsiyonel argümanlar
     optional = parser.add_argument_group("Opsiyonel argümanlar")
     optional.add_argument(
@@ -81,7 +140,106 @@ def create_parser() -> argparse.ArgumentParser:
         "--timeout",
         type=int,
         default=10,
-        help="Sayfa yükleme zaman aşımı (saniye)"
+        help="Sayfa yükleme zaman aşımı (saniye); geçmiş yokken login alanı için kullanılır"
+    )
+    optional.add_argument(
+        "--fixed-timeouts",
+        action="store_true",
+        help="Zaman aşımlarını geçmişten öğrenme, sabit varsayılanları kullan"
+    )
+    optional.add_argument(
+        "--timeout-factor",
+        type=float,
+        default=2.0,
+        help="Öğrenilen zaman aşımı = son sürelerin p99 değeri × katsayı (varsayılan: 2)"
+    )
+    optional.add_argument(
+        "--timeout-min",
+        type=float,
+        default=5.0,
+        help="Öğrenilen zaman aşımı alt sınırı (saniye, varsayılan: 5)"
+    )
+    optional.add_argument(
+        "--timeout-max",
+        type=float,
+        default=120.0,
+        help="Öğrenilen zaman aşımı üst sınırı (saniye, varsayılan: 120)"
+    )
+    optional.add_argument(
+        "--item-deadline",
+        type=float,
+        default=None,
+        help="Öğe başına kesin süre (saniye); aşılırsa tarayıcı öldürülüp yeniden başlatılır. "
+             "En uzun zaman aşımları toplamından kısa olamaz "
+             "(0 = kapalı, varsayılan: bu toplam + 30, --timeout-max 120 ile 270)"
+    )
+    optional.add_argument(
+        "--tabs",
+        type=int,
+        default=1,
+        help="Tek tarayıcıda eşzamanlı sekme sayısı (varsayılan: 1)"
+    )
+    optional.add_argument(
+        "--fixed-tabs",
+        action="store_true",
+        help="Sekme sayısını gecikme/hatalara göre ayarlama, hep --tabs kadar kullan"
+    )
+    optional.add_argument(
+        "--breaker",
+        type=int,
+        default=5,
+        help="Art arda bu kadar zaman aşımı/5xx hatasında işi durdur ve paneli yokla (0 = kapalı, varsayılan: 5)"
+    )
+    optional.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        default=30.0,
+        help="Devre açıldıktan sonra panel yoklamasına kadar bekleme (saniye, varsayılan: 30)"
+    )
+    optional.add_argument(
+        "--verify-imap",
+        action="store_true",
+        help="Oluşturulan posta kutularına IMAP ile giriş yaparak doğrula"
+    )
+    optional.add_argument(
+        "--imap-host",
+        type=str,
+        default="",
+        help="IMAP sunucusu (varsayılan: panel host'u)"
+    )
+    optional.add_argument(
+        "--imap-port",
+        type=int,
+        default=993,
+        help="IMAP portu; 993 ise SSL (varsayılan: 993)"
+    )
+    optional.add_argument(
+        "--imap-pool",
+        type=int,
+        default=4,
+        help="Eşzamanlı IMAP bağlantısı (varsayılan: 4)"
+    )
+    optional.add_argument(
+        "--persistent-profile",
+        action="store_true",
+        help="Panel hesabı başına kalıcı Chrome profili kullan (oturum geçerliyse giriş atlanır)"
+    )
+    optional.add_argument(
+        "--no-network-probe",
+        action="store_true",
+        help="Form sonucunu ağ günlüğü yerine sadece sayfa durumundan oku"
+    )
+    optional.add_argument(
+        "--rate",
+        type=float,
+        default=0.0,
+        help="Panel başına dakikada en fazla işlem, tüm süreçlerde ortak (0 = sınırsız)"
+    )
+    optional.add_argument(
+        "--burst",
+        type=int,
+        default=1,
+        help="Hız sınırında ani yük payı (varsayılan: 1)"
     )
     optional.add_argument(
         "-v", "--verbose",
@@ -93,10 +251,95 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Gerçek işlem yapmadan e-posta listesini göster"
     )
+    optional.add_argument(
+        "--deadline",
+        type=float,
+        help="Hedef süre (dakika); tahminde gereken sekme/işçi sayısını göster"
+    )
+    optional.add_argument(
+        "--profile",
+        action="store_true",
+        help="WebDriver komutlarını zamanla ve sonda profil raporu göster"
+    )
+    optional.add_argument(
+        "--manifest",
+        type=str,
+        help="Birden fazla işi (prefix, şifre, aralık) tek oturumda çalıştır: YAML/JSON/CSV dosyası"
+    )
+    optional.add_argument(
+        "--reconcile",
+        action="store_true",
+        help="Plesk'te olup mailpanel'e kaydedilmemiş hesapları bul ve kaydet"
+    )
+    optional.add_argument(
+        "--bulk",
+        choices=["delete", "quota", "password"],
+        help="Aralıktaki posta kutularına toplu işlem: sil, kota değiştir, "
+             "şifreyi -w ile verilen değere sıfırla"
+    )
+    optional.add_argument(
+        "--quota",
+        type=int,
+        default=30,
+        help="Posta kutusu boyutu MB (oluşturma ve --bulk quota için, varsayılan: 30)"
+    )
+    optional.add_argument(
+        "--journal",
+        type=str,
+        help="Toplu işlem sonuçlarının yazılacağı JSONL günlük dosyası"
+    )
+    optional.add_argument(
+        "--yes",
+        action="store_true",
+        help="--bulk delete için onay (dry-run olmadan silme yapılmaz)"
+    )
+    optional.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Mutabakat ve toplu işlemlerde eşzamanlı istek sayısı (varsayılan: 8)"
+    )
     
     return parser
 
 
+# Oluşturma çalışmasında --verbose olmadan da gösterilen log satırları
+RUN_LOG_PREFIXES = ("---", "===", "Tahmini", "Önbellek", "Kalıcı profil", "Eşzamanlılık", "Takılma", "Zaman aşımı")
+
+
+def run_logger(verbose: bool) -> Callable[[str], None]:
+    """Oluşturma çalışmasının log fonksiyonu (verbose değilse özet satırları ve ✓/✗)"""
+    def logger(msg: str):
+        if verbose or msg.startswith(RUN_LOG_PREFIXES) or "✓" in msg or "✗" in msg:
+            print(msg)
+    return logger
+
+
+@contextmanager
+def cancel_on_interrupt(engine):
+    """
+    Ctrl-C ve SIGTERM motoru işbirlikçi olarak durdursun
+    
+    İlk sinyalde bekleyen öğeler iptal olarak kaydedilir ve tarayıcı
+    kapatılır; ikinci Ctrl-C varsayılan davranışa (KeyboardInterrupt) döner.
+    """
+    previous = {number: signal.getsignal(number) for number in (signal.SIGINT, signal.SIGTERM)}
+    
+    def handler(number, frame):
+        print("\nDurduruluyor... (hemen çıkmak için tekrar Ctrl-C)", flush=True)
+        for restored, action in previous.items():
+            signal.signal(restored, action)
+        engine.cancel()
+    
+    for number in previous:
+        signal.signal(number, handler)
+    try:
+        yield
+    finally:
+        for number, action in previous.items():
+            signal.signal(number, action)
+
+
 def run_cli(args=None) -> int:
     """CLI uygulamasını çalıştır"""
     parser = create_parser()
@@ -109,12 +352,51 @@ def run_cli(args=None) -> int:
         start_number=parsed_args.start,
         count=parsed_args.count,
         email_domain=parsed_args.domain,
+        mailbox_quota_mb=parsed_args.quota,
         target_url=parsed_args.url,
         headless=parsed_args.headless,
         timeout=parsed_args.timeout,
-        delay_between_logins=parsed_args.delay
+        delay_between_logins=parsed_args.delay,
+        adaptive_timeouts=not parsed_args.fixed_timeouts,
+        timeout_factor=parsed_args.timeout_factor,
+        timeout_min=parsed_args.timeout_min,
+        timeout_max=parsed_args.timeout_max,
+        item_deadline=parsed_args.item_deadline,
+        tabs=parsed_args.tabs,
+        adaptive_tabs=not parsed_args.fixed_tabs,
+        breaker_threshold=parsed_args.breaker,
+        breaker_cooldown=parsed_args.breaker_cooldown,
+        network_probe=not parsed_args.no_network_probe,
+        persistent_profile=parsed_args.persistent_profile,
+        verify_imap=parsed_args.verify_imap,
+        imap_host=parsed_args.imap_host,
+        imap_port=parsed_args.imap_port,
+        imap_pool=parsed_args.imap_pool,
+        profile=parsed_args.profile,
+        rate_per_minute=parsed_args.rate,
+        rate_burst=parsed_args.burst
     )
     
+    # Manifesto: prefix/şifre/aralık işlerden gelir
+    if parsed_args.manifest:
+        return run_manifest(config, parsed_args)
+    
+    # Kuyruk işçisi ve durum: prefix/şifre öğelerden gelir
+    if parsed_args.worker or parsed_args.queue_status or parsed_args.enqueue:
+        if not parsed_args.queue:
+            print("Hata: --queue belirtilmeli")
+            return 1
+        if parsed_args.queue.startswith("memory://"):
+            # Bellek kuyruğu süreçle birlikte kaybolur; ekleme ve işçiler ayrı süreçlerdir
+            print("Hata: memory:// kuyruğu yalnızca süreç içinde paylaşılır; CLI için SQLite dosyası kullanın")
+            return 1
+        if parsed_args.worker and parsed_args.tabs > 1:
+            # İşçi öğeleri tek tek işler; eşzamanlılık işçi sayısıyla artırılır
+            print("Hata: --tabs işçi modunda desteklenmez; bunun yerine daha fazla işçi çalıştırın (make workers N=...)")
+            return 1
+        if parsed_args.worker or parsed_args.queue_status:
+            return run_queue(config, parsed_args)
+    
     # Doğrulama
     is_valid, error = config.validate()
     if not is_valid:
@@ -131,6 +413,31 @@ def run_cli(args=None) -> int:
     print(f"Domain: {config.email_domain}")
     print(f"Hedef URL: {config.target_url}")
     print(f"Headless: {'Evet' if config.headless else 'Hayır'}")
+    print(f"Sekme: {config.tabs}")
+    print("=" * 50)
+    
+    # Mutabakat modu
+    if parsed_args.reconcile:
+        return run_reconcile(config, parsed_args)
+    
+    # Toplu işlem modu
+    if parsed_args.bulk:
+        return run_bulk(config, parsed_args)
+    
+    # Kuyruğa ekleme modu
+    if parsed_args.enqueue:
+        from .jobqueue import open_queue
+        
+        added = open_queue(parsed_args.queue).enqueue_config(config)
+        print(f"Kuyruğa eklendi: {added} (zaten kuyrukta: {config.count - added})")
+        return 0
+    
+    # Geçmiş zamanlamalardan tahmin
+    from .history import TimingHistory
+    from .planner import RunPlanner
+    
+    for line in RunPlanner(config, TimingHistory.for_config(config)).describe(parsed_args.deadline):
+        print(line)
     print("=" * 50)
     
     # Dry-run modu
@@ -140,17 +447,22 @@ def run_cli(args=None) -> int:
             print(f"  - {email}")
         return 0
     
-    # Bot'u çalıştır
+    # Bot'u çalıştır (Selenium sadece burada yüklenir)
     print("\nBot başlatılıyor...\n")
+    from .pipeline import create_engine
     
-    def logger(msg: str):
-        if parsed_args.verbose or msg.startswith("---") or msg.startswith("===") or "✓" in msg or "✗" in msg:
-            print(msg)
+    logger = run_logger(parsed_args.verbose)
     
-    engine = BotEngine(config, logger=logger)
+    engine = create_engine(
+        config,
+        logger=logger,
+        panel_email=parsed_args.panel_email,
+        panel_password=parsed_args.panel_password
+    )
     
     try:
-        results = engine.run()
+        with cancel_on_interrupt(engine):
+            results = engine.run()
         
         # Sonuç özeti
         print("\n" + "=" * 50)
@@ -159,12 +471,248 @@ def run_cli(args=None) -> int:
         print(f"Toplam: {results['total']}")
         print(f"Başarılı: {results['success']}")
         print(f"Başarısız: {results['failed']}")
+        if results.get("cancelled"):
+            print(f"İptal: {results['cancelled']}")
+        if "verified" in results:
+            print(f"IMAP doğrulandı: {results['verified']}, doğrulanamadı: {results['unverified']}")
         
+        if engine.cancel_token.cancelled:
+            print("\nKullanıcı tarafından durduruldu.")
+            return 130
         return 0 if results['failed'] == 0 else 1
-        
+    
     except KeyboardInterrupt:
         print("\n\nKullanıcı tarafından durduruldu.")
         return 130
     except Exception as e:
         print(f"\nKritik hata: {e}")
         return 1
+
+
+def run_manifest(config: BotConfig, parsed_args) -> int:
+    """Manifestodaki işleri tek tarayıcı oturumunda çalıştır ve özet yazdır"""
+    from .manifest import build_jobs, describe_job, find_duplicates, panel_credentials, read_manifest
+    
+    try:
+        manifest = read_manifest(parsed_args.manifest)
+        jobs = build_jobs(config, manifest)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}")
+        return 1
+    
+    duplicate = find_duplicates(jobs)
+    if duplicate:
+        print(f"Hata: aynı posta kutusu birden fazla işte: {duplicate}")
+        return 1
+    
+    print("=" * 50)
+    print("E-posta Bot - Manifesto Modu")
+    print("=" * 50)
+    for number, job in enumerate(jobs, 1):
+        print(describe_job(number, len(jobs), job))
+    print(f"Toplam: {sum(job.count for job in jobs)} e-posta, {len(jobs)} iş")
+    print(f"Hedef URL: {config.target_url}")
+    print(f"Headless: {'Evet' if config.headless else 'Hayır'}")
+    print(f"Sekme: {config.tabs}")
+    print("=" * 50)
+    
+    if parsed_args.dry_run:
+        print("\n[DRY-RUN] Oluşturulacak e-postalar:")
+        for job in jobs:
+            for email in job.get_all_emails():
+                print(f"  - {email}")
+        return 0
+    
+    try:
+        panel_email, panel_password = panel_credentials(manifest, parsed_args.panel_email, parsed_args.panel_password)
+    except ValueError as e:
+        print(f"Hata: {e}")
+        return 1
+    
+    print("\nBot başlatılıyor...\n")
+    from .pipeline import create_engine
+    
+    logger = run_logger(parsed_args.verbose)
+    
+    engine = create_engine(config, logger=logger, panel_email=panel_email, panel_password=panel_password)
+    
+    try:
+        with cancel_on_interrupt(engine):
+            summary = engine.run_jobs(jobs)
+    except KeyboardInterrupt:
+        print("\n\nKullanıcı tarafından durduruldu.")
+        return 130
+    
+    print("\n" + "=" * 50)
+    print("SONUÇ")
+    print("=" * 50)
+    for number, results in enumerate(summary["jobs"], 1):
+        line = f"İş {number} ({results['prefix']}): {results['success']}/{results['total']} başarılı, {results['failed']} başarısız"
+        if results.get("cancelled"):
+            line += f", {results['cancelled']} iptal"
+        if "verified" in results:
+            line += f", IMAP doğrulandı: {results['verified']}"
+        print(line)
+    print("-" * 50)
+    print(f"Toplam: {summary['total']}")
+    print(f"Başarılı: {summary['success']}")
+    print(f"Başarısız: {summary['failed']}")
+    if summary["cancelled"]:
+        print(f"İptal: {summary['cancelled']}")
+    
+    if engine.cancel_token.cancelled:
+        print("\nKullanıcı tarafından durduruldu.")
+        return 130
+    processed = summary["success"] + summary["failed"]
+    return 0 if summary["failed"] == 0 and processed == summary["total"] else 1
+
+
+def run_reconcile(config: BotConfig, parsed_args) -> int:
+    """Plesk - mailpanel mutabakatını çalıştır ve özet yazdır"""
+    print("\nMutabakat başlatılıyor...\n")
+    from .bot import BotEngine
+    from .reconcile import Reconciler
+    
+    def logger(msg: str):
+        if parsed_args.verbose or msg.startswith("===") or "✓" in msg or "✗" in msg:
+            print(msg)
+    
+    engine = BotEngine(
+        config,
+        logger=logger,
+        panel_email=parsed_args.panel_email,
+        panel_password=parsed_args.panel_password
+    )
+    reconciler = Reconciler(engine, workers=parsed_args.workers)
+    
+    try:
+        results = reconciler.run(dry_run=parsed_args.dry_run)
+    except KeyboardInterrupt:
+        print("\n\nKullanıcı tarafından durduruldu.")
+        return 130
+    
+    if results["error"]:
+        print(f"\nKritik hata: {results['error']}")
+        return 1
+    
+    print("\n" + "=" * 50)
+    print("MUTABAKAT SONUCU")
+    print("=" * 50)
+    print(f"Senkron: {len(results['in_sync'])}")
+    print(f"Plesk'te yok: {len(results['missing_in_plesk'])}")
+    for address in results["orphaned_in_mailpanel"]:
+        print(f"  ! Posta kutusu yok ama mailpanel'de kayıtlı: {address}")
+    print(f"Mailpanel'de eksik: {len(results['missing_in_mailpanel'])}")
+    
+    if parsed_args.dry_run:
+        for address in results["missing_in_mailpanel"]:
+            print(f"  [DRY-RUN] kaydedilecek: {address}")
+        return 0
+    
+    failed = [address for address, ok in results["registered"].items() if not ok]
+    print(f"Kaydedilen: {len(results['registered']) - len(failed)}")
+    print(f"Kaydedilemeyen: {len(failed)}")
+    return 0 if not failed else 1
+
+
+def run_bulk(config: BotConfig, parsed_args) -> int:
+    """Aralıktaki posta kutularına toplu işlem uygula ve özet yazdır"""
+    if parsed_args.bulk == "delete" and not (parsed_args.dry_run or parsed_args.yes):
+        print("Hata: --bulk delete için --yes veya --dry-run gerekli")
+        return 1
+    
+    print(f"\nToplu işlem başlatılıyor: {parsed_args.bulk}\n")
+    from .bot import BotEngine
+    from .bulk import BulkOperations
+    from .journal import Journal
+    
+    def logger(msg: str):
+        if parsed_args.verbose or msg.startswith("===") or msg.lstrip().startswith("[DRY-RUN]") or "✓" in msg or "✗" in msg:
+            print(msg)
+    
+    engine = BotEngine(
+        config,
+        logger=logger,
+        panel_email=parsed_args.panel_email,
+        panel_password=parsed_args.panel_password
+    )
+    operations = BulkOperations(engine, journal=Journal(parsed_args.journal), workers=parsed_args.workers)
+    
+    try:
+        results = operations.run(
+            parsed_args.bulk,
+            dry_run=parsed_args.dry_run,
+            quota_mb=config.mailbox_quota_mb,
+            new_password=config.password
+        )
+    except KeyboardInterrupt:
+        print("\n\nKullanıcı tarafından durduruldu.")
+        return 130
+    
+    if results.get("error"):
+        print(f"\nKritik hata: {results['error']}")
+        return 1
+    
+    print("\n" + "=" * 50)
+    print("TOPLU İŞLEM SONUCU")
+    print("=" * 50)
+    print(f"Hedef: {results['total']}")
+    print(f"Başarılı: {results['success']}")
+    print(f"Başarısız: {results['failed']}")
+    
+    return 0 if results['failed'] == 0 else 1
+
+
+def print_queue_summary(summary: dict):
+    """Kuyruğun merkezi özetini yazdır"""
+    print("\n" + "=" * 50)
+    print("KUYRUK DURUMU")
+    print("=" * 50)
+    statuses = summary["statuses"]
+    print(f"Toplam: {summary['total']}")
+    print(f"Bekleyen: {statuses['pending']}")
+    print(f"Kiralanmış: {statuses['leased']}")
+    print(f"Başarılı: {statuses['done']} (mailpanel: {summary['mailpanel_registered']})")
+    print(f"Başarısız: {statuses['failed']}")
+    for worker, counts in sorted(summary["workers"].items()):
+        details = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+        print(f"  {worker}: {details}")
+
+
+def run_queue(config: BotConfig, parsed_args) -> int:
+    """Kuyruk işçisini veya kuyruk özetini çalıştır"""
+    from .jobqueue import open_queue
+    
+    queue = open_queue(parsed_args.queue)
+    if parsed_args.queue_status:
+        print_queue_summary(queue.summary())
+        return 0
+    
+    from .bot import BotEngine
+    from .worker import QueueWorker
+    
+    def logger(msg: str):
+        if parsed_args.verbose or msg.startswith(("---", "===", "Önbellek", "Kalıcı profil", "Takılma")) or "✓" in msg or "✗" in msg:
+            print(msg, flush=True)
+    
+    engine = BotEngine(
+        config,
+        logger=logger,
+        panel_email=parsed_args.panel_email,
+        panel_password=parsed_args.panel_password
+    )
+    worker = QueueWorker(engine, queue, worker_id=parsed_args.worker_id, lease_seconds=parsed_args.lease)
+    
+    try:
+        with cancel_on_interrupt(engine):
+            results = worker.run()
+    except KeyboardInterrupt:
+        print("\n\nKullanıcı tarafından durduruldu.")
+        return 130
+    
+    print(f"\nİşçi {results['worker']}: Başarılı: {results['success']}, Başarısız: {results['failed']}, "
+          f"İptal: {results['cancelled']}")
+    print_queue_summary(queue.summary())
+    if engine.cancel_token.cancelled:
+        return 130
+    return 0 if results["failed"] == 0 else 1
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uyarlamalı Eşzamanlılık
+Öğe başına gözlenen gecikme ve hatalara göre etkin sekme sayısını ayarlayan
+AIMD denetleyicisi ve panel çöktüğünde işi durduran devre kesici
+"""
+
+import time
+from typing import Optional
+
+
+class AIMDController:
+    """
+    Toplamsal artış / çarpımsal azalış (AIMD) denetleyicisi
+    
+    Sağlıklı her sonuçta sınır 1/sınır kadar artar (yaklaşık her "tur"da bir
+    sekme). Zaman aşımı, 5xx veya taban gecikmenin çok üstündeki bir sonuç
+    sınırı decrease oranıyla düşürür. Bir düşüşten önce gönderilmiş öğelerin
+    sonuçları ikinci bir düşüşe yol açmaz.
+    """
+    
+    def __init__(
+        self,
+        minimum: int = 1,
+        maximum: int = 1,
+        initial: Optional[int] = None,
+        baseline: Optional[float] = None,
+        decrease: float = 0.5,
+        latency_factor: float = 2.0,
+        smoothing: float = 0.1
+    ):
+        """
+        Args:
+            minimum: En az etkin eşzamanlılık
+            maximum: En fazla etkin eşzamanlılık
+            initial: Başlangıç değeri (varsayılan: minimum)
+            baseline: Sağlıklı öğe gecikmesi tahmini (saniye, örn. geçmiş ortalaması)
+            decrease: Tıkanmada sınırın çarpılacağı oran
+            latency_factor: Tabanın bu katından yavaş sonuçlar tıkanma sayılır
+            smoothing: Taban gecikme için üstel ortalama katsayısı
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(self.maximum, max(self.minimum, initial or self.minimum)))
+        self.baseline = baseline
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self._last_decrease = float("-inf")
+    
+    @property
+    def active(self) -> int:
+        """Şu anda izin verilen eşzamanlı öğe sayısı"""
+        return int(self.limit)
+    
+    def record(self, latency: float, congested: bool = False, submitted_at: Optional[float] = None) -> int:
+        """
+        Bir öğenin sonucunu işle
+        
+        Args:
+            latency: Öğenin gönderimden sonuca kadar süresi
+            congested: Zaman aşımı, 5xx veya tarayıcı hatası
+            submitted_at: Öğenin gönderim zamanı (time.monotonic)
+        
+        Returns:
+            Yeni etkin eşzamanlılık
+        """
+        if not congested and self.baseline and latency > self.baseline * self.latency_factor:
+            congested = True
+        
+        if congested:
+            # Aynı tıkanmanın eski sonuçları sınırı tekrar düşürmesin
+            if submitted_at is None or submitted_at > self._last_decrease:
+                self.limit = max(float(self.minimum), self.limit * self.decrease)
+                self._last_decrease = time.monotonic()
+        else:
+            self.baseline = latency if self.baseline is None else (
+                (1 - self.smoothing) * self.baseline + self.smoothing * latency
+            )
+            self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+        
+        return self.active
+
+
+class CircuitBreaker:
+    """
+    Panel için devre kesici
+    
+    Art arda threshold kadar tıkanma hatasında devre açılır ve yeni iş
+    gönderilmez. Bekleme süresi dolunca panel yoklanır; yoklama başarılıysa
+    devre kapanır, değilse bekleme süresi iki katına çıkar.
+    """
+    
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0, max_cooldown: float = 300.0):
+        """
+        Args:
+            threshold: Devreyi açacak art arda hata sayısı (0 = kapalı)
+            cooldown: İlk bekleme süresi (saniye)
+            max_cooldown: Başarısız yoklamalardan sonra en uzun bekleme
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max(cooldown, max_cooldown)
+        self.failures = 0
+        self.trips = 0
+        self._current_cooldown = cooldown
+        self._opened_at: Optional[float] = None
+    
+    @property
+    def is_open(self) -> bool:
+        """Devre açık mı (yeni iş gönderilmemeli)"""
+        return self._opened_at is not None
+    
+    def remaining(self) -> float:
+        """Yoklamaya kalan süre"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._current_cooldown - time.monotonic())
+    
+    def ready_to_probe(self) -> bool:
+        """Devre açık ve bekleme süresi doldu mu"""
+        return self.is_open and self.remaining() == 0.0
+    
+    def record(self, congested: bool) -> bool:
+        """
+        Bir öğenin sonucunu işle
+        
+        Returns:
+            True: bu sonuçla devre açıldı
+        """
+        if not congested:
+            self.failures = 0
+            return False
+        
+        self.failures += 1
+        if self.threshold and not self.is_open and self.failures >= self.threshold:
+            self._opened_at = time.monotonic()
+            self._current_cooldown = self.cooldown
+            self.trips += 1
+            return True
+        return False
+    
+    def record_probe(self, success: bool):
+        """Panel yoklamasının sonucunu işle"""
+        if success:
+            self._opened_at = None
+            self.failures = 0
+            return
+        self._current_cooldown = min(self.max_cooldown, self._current_cooldown * 2)
+        self._opened_at = time.monotonic()
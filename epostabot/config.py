@@ -5,8 +5,10 @@ Yapılandırma modülü
 Tüm ayarlar burada merkezi olarak yönetilir
 """
 
+import os
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlsplit
 
 
 @dataclass
@@ -19,6 +21,7 @@ class BotConfig:
     start_number: int = 100
     count: int = 10
     email_domain: str = "@gmail.com"
+    mailbox_quota_mb: int = 30
     
     # Hedef site ayarları
     target_url: str = "https://win-webb.wlsrv.com/login_up.php"
@@ -30,6 +33,34 @@ class BotConfig:
     headless: bool = False
     timeout: int = 10
     delay_between_logins: float = 2.0
+    adaptive_timeouts: bool = True  # Bekleme zaman aşımlarını geçmiş sürelerden öğren (p99 × katsayı)
+    timeout_factor: float = 2.0
+    timeout_min: float = 5.0  # Öğrenilen zaman aşımı alt/üst sınırı (saniye)
+    timeout_max: float = 120.0
+    item_deadline: Optional[float] = None  # Öğe başına kesin süre; aşılırsa tarayıcı yeniden başlatılır (None = otomatik, 0 = kapalı)
+    tabs: int = 1  # >1 ise tek tarayıcıda çok sekmeli boru hattı
+    adaptive_tabs: bool = True  # Etkin sekme sayısını gecikme/hatalara göre ayarla (tabs üst sınır)
+    breaker_threshold: int = 5  # Art arda bu kadar zaman aşımı/5xx'te işi durdur (0 = kapalı)
+    breaker_cooldown: float = 30.0  # Devre açıldıktan sonra panel yoklamasına kadar bekleme
+    network_probe: bool = True  # Form sonucunu Chrome ağ günlüğünden oku
+    persistent_profile: bool = False  # Panel hesabı başına kalıcı user-data-dir
+    
+    # Profilleme (chromedriver komut süreleri)
+    profile: bool = False
+    
+    # Hız sınırı (panel başına dakikada işlem, 0 = kapalı)
+    rate_per_minute: float = 0.0
+    rate_burst: int = 1
+    
+    # Yerel durum dosyaları (boşsa ~/.epostabot)
+    data_dir: str = ""
+    record_history: bool = True  # Adım sürelerini tahmin için sakla
+    
+    # Oluşturma sonrası IMAP doğrulaması
+    verify_imap: bool = False
+    imap_host: str = ""  # Boşsa panel host'u
+    imap_port: int = 993  # 993 ise SSL, diğerlerinde düz IMAP
+    imap_pool: int = 4  # Eşzamanlı IMAP bağlantısı
     
     # Chrome ayarları
     chrome_options: list = None
@@ -55,6 +86,24 @@ class BotConfig:
         """Tüm e-posta adreslerinin listesini döndür"""
         return [self.get_email(i) for i in range(self.count)]
     
+    @property
+    def panel_host(self) -> str:
+        """Hedef panelin host adı (örn: win-webb.wlsrv.com)"""
+        return urlsplit(self.target_url).netloc
+    
+    def get_data_dir(self) -> str:
+        """Hız sınırı durumu gibi yerel dosyaların tutulduğu dizin"""
+        return self.data_dir or os.path.join(os.path.expanduser("~"), ".epostabot")
+    
+    def get_imap_host(self) -> str:
+        """Posta kutularının doğrulanacağı IMAP sunucusu (varsayılan: panel host'u)"""
+        return self.imap_host or urlsplit(self.target_url).hostname
+    
+    def get_panel_url(self, path: str) -> str:
+        """Login URL'indeki şema ve host ile panel sayfası adresi oluştur"""
+        parts = urlsplit(self.target_url)
+        return f"{parts.scheme}://{parts.netloc}{path}"
+    
     def validate(self) -> tuple[bool, Optional[str]]:
         """Yapılandırmayı doğrula"""
         if not self.prefix:
@@ -65,4 +114,30 @@ class BotConfig:
             return False, "E-posta sayısı en az 1 olmalı"
         if self.start_number < 0:
             return False, "Başlangıç numarası 0'dan küçük olamaz"
+        if self.mailbox_quota_mb < 1:
+            return False, "Posta kutusu boyutu en az 1 MB olmalı"
+        if self.tabs < 1:
+            return False, "Sekme sayısı en az 1 olmalı"
+        if self.timeout_factor < 1:
+            return False, "Zaman aşımı katsayısı en az 1 olmalı"
+        if self.timeout_min <= 0 or self.timeout_max < self.timeout_min:
+            return False, "Zaman aşımı sınırları geçersiz (0 < min <= max)"
+        if self.item_deadline is not None:
+            if self.item_deadline < 0:
+                return False, "Öğe süre sınırı negatif olamaz"
+            from .timeouts import minimum_item_deadline
+            minimum = minimum_item_deadline(self)
+            if self.item_deadline and self.item_deadline < minimum:
+                return False, (f"Öğe süre sınırı en uzun zaman aşımları toplamından ({minimum:g} sn) "
+                               f"kısa olamaz; zaman aşımı üst sınırını düşürün veya sınırı kapatın (0)")
+        if self.imap_pool < 1:
+            return False, "IMAP bağlantı sayısı en az 1 olmalı"
+        if self.breaker_threshold < 0:
+            return False, "Devre kesici eşiği negatif olamaz"
+        if self.breaker_cooldown <= 0:
+            return False, "Devre kesici bekleme süresi 0'dan büyük olmalı"
+        if self.rate_per_minute < 0:
+            return False, "Hız sınırı negatif olamaz"
+        if self.rate_burst < 1:
+            return False, "Burst değeri en az 1 olmalı"
         return True, None
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dosya Kilidi
+Aynı veri dizinini paylaşan süreçler arasında özel (exclusive) dosya kilidi
+(POSIX: flock, Windows: msvcrt)
+"""
+
+import os
+from contextlib import contextmanager
+
+
+def lock_file(handle):
+    """Açık dosyanın kilidini al; başka süreç tutuyorsa bırakana kadar bekle"""
+    if os.name == "nt":
+        import msvcrt
+        handle.seek(0)
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        import fcntl
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+
+def unlock_file(handle):
+    """Dosya kilidini bırak"""
+    if os.name == "nt":
+        import msvcrt
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def locked(path: str):
+    """
+    Blok boyunca path'in yanındaki .lock dosyasını kilitli tut
+    
+    Kilit ayrı dosyada tutulur; böylece korunan dosya os.replace ile
+    değiştirilse bile tüm süreçler aynı kilidi kullanır.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", "a+", encoding="utf-8") as handle:
+        lock_file(handle)
+        try:
+            yield
+        finally:
+            unlock_file(handle)
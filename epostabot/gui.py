@@ -13,8 +13,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 
+from .cancel import CancelToken
 from .config import BotConfig
-from .bot import BotEngine
 
 
 class BotWorker(QThread):
@@ -27,23 +27,30 @@ class BotWorker(QThread):
         self.config = config
         self.panel_email = panel_email
         self.panel_password = panel_password
-        self.engine: BotEngine = None
+        self.engine = None
+        # Motor thread'de oluşturulurken (Selenium importu) basılan Durdur da geçerli olsun
+        self.cancel_token = CancelToken()
     
     def run(self):
         """Bot çalışma döngüsü"""
-        self.engine = BotEngine(
+        # Selenium, pencere açıldıktan sonra worker thread'inde yüklenir
+        from .pipeline import create_engine
+        
+        self.engine = create_engine(
             self.config, 
             logger=self.log_signal.emit,
             panel_email=self.panel_email,
-            panel_password=self.panel_password
+            panel_password=self.panel_password,
+            cancel_token=self.cancel_token
         )
         results = self.engine.run()
         self.finished_signal.emit(results)
     
     def stop(self):
-        """Bot'u durdur"""
+        """Bot'u durdur (bekleyen adımlar bir saniyeden kısa sürede kesilir)"""
+        self.cancel_token.cancel()
         if self.engine:
-            self.engine.running = False
+            self.engine.cancel()
 
 
 class MainWindow(QMainWindow):
@@ -158,6 +165,26 @@ class MainWindow(QMainWindow):
         self.headless_checkbox = QCheckBox("Headless Mod (Tarayıcı görünmez)")
         options_layout.addWidget(self.headless_checkbox)
         
+        # Kalıcı profil (oturum geçerliyse giriş atlanır)
+        self.persistent_profile_checkbox = QCheckBox("Kalıcı tarayıcı profili (oturumu hatırla)")
+        options_layout.addWidget(self.persistent_profile_checkbox)
+        
+        # Oluşturulan posta kutularını IMAP ile doğrula
+        self.verify_imap_checkbox = QCheckBox("Posta kutularını IMAP ile doğrula")
+        options_layout.addWidget(self.verify_imap_checkbox)
+        
+        # Sekme sayısı (tek tarayıcıda boru hattı)
+        tabs_layout = QHBoxLayout()
+        tabs_label = QLabel("Sekme Sayısı:")
+        tabs_label.setMinimumWidth(120)
+        self.tabs_input = QSpinBox()
+        self.tabs_input.setRange(1, 10)
+        self.tabs_input.setValue(1)
+        tabs_layout.addWidget(tabs_label)
+        tabs_layout.addWidget(self.tabs_input)
+        tabs_layout.addStretch()
+        options_layout.addLayout(tabs_layout)
+        
         layout.addWidget(options_group)
         
         # Butonlar
@@ -224,7 +251,10 @@ class MainWindow(QMainWindow):
             password=self.new_password_input.text(),
             start_number=self.start_num_input.value(),
             count=self.count_input.value(),
-            headless=self.headless_checkbox.isChecked()
+            headless=self.headless_checkbox.isChecked(),
+            persistent_profile=self.persistent_profile_checkbox.isChecked(),
+            verify_imap=self.verify_imap_checkbox.isChecked(),
+            tabs=self.tabs_input.value()
         )
     
     def start_bot(self):
@@ -255,6 +285,13 @@ class MainWindow(QMainWindow):
         self.log_text.append(f"Aralık: {config.prefix}{config.start_number} - {config.prefix}{config.start_number + config.count - 1}")
         self.log_text.append(f"Toplam: {config.count} e-posta oluşturulacak")
         self.log_text.append(f"Headless: {'Evet' if config.headless else 'Hayır'}")
+        self.log_text.append(f"Sekme: {config.tabs}")
+        
+        from .history import TimingHistory
+        from .planner import RunPlanner
+        
+        for line in RunPlanner(config, TimingHistory.for_config(config)).describe():
+            self.log_text.append(line)
         
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
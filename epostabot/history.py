@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zamanlama Geçmişi
+Panel host'u başına adım sürelerini ve öğe sonuçlarını yerel olarak saklar
+"""
+
+import json
+import math
+import os
+import threading
+from typing import Optional
+
+from .config import BotConfig
+from .filelock import locked
+
+
+# Adım başına saklanacak en fazla örnek
+MAX_SAMPLES = 500
+
+
+class TimingHistory:
+    """Adım süreleri ve başarı/başarısızlık sayıları için JSON deposu"""
+    
+    def __init__(self, path: Optional[str] = None, max_samples: int = MAX_SAMPLES):
+        """
+        Args:
+            path: Depo dosyası (None ise sadece bellekte tutulur)
+            max_samples: Adım başına saklanacak en fazla örnek
+        """
+        self.path = path
+        self.max_samples = max_samples
+        self.steps = {}
+        self.items = {"success": 0, "failed": 0}
+        self._new_steps = {}
+        self._new_items = {"success": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._load()
+    
+    @classmethod
+    def for_config(cls, config: BotConfig) -> "TimingHistory":
+        """Yapılandırmadaki panel host'u için depoyu aç"""
+        path = os.path.join(config.get_data_dir(), "history", f"{config.panel_host}.json")
+        return cls(path)
+    
+    def _read(self) -> dict:
+        """Depo dosyasını oku (yoksa veya bozuksa boş)"""
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+    
+    def _load(self):
+        data = self._read()
+        self.steps = {name: list(samples) for name, samples in data.get("steps", {}).items()}
+        self.items.update(data.get("items", {}))
+    
+    def record_step(self, name: str, seconds: float):
+        """Bir adımın süresini kaydet"""
+        with self._lock:
+            self.steps.setdefault(name, []).append(seconds)
+            self.steps[name] = self.steps[name][-self.max_samples:]
+            self._new_steps.setdefault(name, []).append(seconds)
+    
+    def record_item(self, success: bool):
+        """Bir öğenin sonucunu kaydet"""
+        key = "success" if success else "failed"
+        with self._lock:
+            self.items[key] += 1
+            self._new_items[key] += 1
+    
+    def samples(self, name: str) -> list:
+        """Adımın kayıtlı süreleri"""
+        return list(self.steps.get(name, []))
+    
+    def mean(self, name: str) -> Optional[float]:
+        """Adımın ortalama süresi (örnek yoksa None)"""
+        samples = self.steps.get(name)
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+    
+    def percentile(self, name: str, fraction: float, window: Optional[int] = None) -> Optional[float]:
+        """
+        Adımın son örneklerindeki yüzdelik değer (en yakın sıra yöntemi)
+        
+        Args:
+            name: Adım adı
+            fraction: Yüzdelik (örn. 0.99)
+            window: Sadece son bu kadar örneğe bak (None ise tümü)
+        
+        Returns:
+            Süre (saniye) veya örnek yoksa None
+        """
+        samples = self.steps.get(name, [])
+        if window:
+            samples = samples[-window:]
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = min(len(ordered), max(1, math.ceil(fraction * len(ordered))))
+        return ordered[rank - 1]
+    
+    def failure_rate(self) -> Optional[float]:
+        """Geçmişteki başarısız öğe oranı (kayıt yoksa None)"""
+        total = self.items["success"] + self.items["failed"]
+        if not total:
+            return None
+        return self.items["failed"] / total
+    
+    def save(self):
+        """
+        Bu çalışmadaki yeni örnekleri dosyaya ekle
+        
+        Okuma-birleştirme-değiştirme süreçler arası dosya kilidi altında
+        yapılır; böylece aynı panelde eşzamanlı çalışan süreçler birbirinin
+        verisini ezmez.
+        """
+        if not self.path:
+            return
+        
+        with self._lock, locked(self.path):
+            data = self._read()
+            steps = data.get("steps", {})
+            items = data.get("items", {"success": 0, "failed": 0})
+            
+            for name, samples in self._new_steps.items():
+                steps[name] = (steps.get(name, []) + samples)[-self.max_samples:]
+            for key, count in self._new_items.items():
+                items[key] = items.get(key, 0) + count
+            
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump({"steps": steps, "items": items}, handle)
+            os.replace(temp_path, self.path)
+            
+            self._new_steps = {}
+            self._new_items = {"success": 0, "failed": 0}
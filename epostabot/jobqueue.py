@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dağıtık İş Kuyruğu
+Birden fazla host/container'ın posta kutusu işlerini kiralama (lease) ile
+paylaştığı kuyruk. Varsayılan arka uç paylaşımlı diskte SQLite'tır.
+"""
+
+import inspect
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing
+from typing import Callable, Optional
+
+from .config import BotConfig
+
+
+# Süresi dolan kiralamalar en fazla bu kadar kez yeniden kuyruğa alınır
+MAX_ATTEMPTS = 3
+
+STATUSES = ("pending", "leased", "done", "failed")
+
+
+class JobQueue(ABC):
+    """
+    Kuyruk arayüzü
+    
+    Bir öğe: id, prefix, email, password, quota_mb, status, worker,
+    lease_expires, attempts, success, mailpanel_registered, error
+    
+    Arka uçlar soyut metotların hepsini uygulamalıdır; eksik bir arka uç
+    oluşturulurken TypeError verir.
+    """
+    
+    def enqueue_config(self, config: BotConfig) -> int:
+        """
+        Yapılandırmanın prefix/aralığındaki öğeleri kuyruğa ekle
+        
+        Aynı prefix zaten kuyruktaysa tekrar eklenmez; böylece çakışan
+        aralıklar aynı posta kutusunu iki kez oluşturmaz.
+        
+        Returns:
+            Yeni eklenen öğe sayısı
+        """
+        items = [
+            {
+                "prefix": config.get_email_prefix(i),
+                "email": config.get_email(i),
+                "password": config.password,
+                "quota_mb": config.mailbox_quota_mb,
+            }
+            for i in range(config.count)
+        ]
+        return self.enqueue(items)
+    
+    @abstractmethod
+    def enqueue(self, items: list) -> int:
+        """Prefix'i kuyrukta olmayan öğeleri ekle; eklenen sayıyı döndür"""
+    
+    @abstractmethod
+    def lease(self, worker: str, lease_seconds: float) -> Optional[dict]:
+        """Bekleyen bir öğeyi kirala (yoksa None)"""
+    
+    @abstractmethod
+    def heartbeat(self, item_id: int, worker: str, lease_seconds: float) -> bool:
+        """Kiralamayı uzat; kiralama artık bu işçide değilse False"""
+    
+    @abstractmethod
+    def complete(self, item_id: int, worker: str, success: bool,
+                 mailpanel_registered: bool = False, error: Optional[str] = None) -> bool:
+        """Öğenin sonucunu yaz; kiralama kaybedilmişse False"""
+    
+    @abstractmethod
+    def requeue_expired(self, max_attempts: int = MAX_ATTEMPTS) -> int:
+        """Süresi dolan kiralamaları kuyruğa geri al (veya başarısız say)"""
+    
+    @abstractmethod
+    def summary(self) -> dict:
+        """Durum ve işçi bazında merkezi özet"""
+
+
+class SQLiteJobQueue(JobQueue):
+    """Paylaşımlı birimdeki SQLite dosyası üzerinde kuyruk"""
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Veritabanı dosyası (tüm container'larda aynı birimde)
+        """
+        self.path = path
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    prefix TEXT NOT NULL UNIQUE,
+                    email TEXT NOT NULL,
+                    password TEXT NOT NULL,
+                    quota_mb INTEGER NOT NULL DEFAULT 30,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    success INTEGER,
+                    mailpanel_registered INTEGER,
+                    error TEXT,
+                    updated REAL
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS items_status ON items (status, lease_expires)")
+    
+    def _connect(self) -> closing:
+        # Her işlem kendi bağlantısını açar: thread ve süreçler arası güvenli
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        return closing(db)
+    
+    def enqueue(self, items: list) -> int:
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO items (prefix, email, password, quota_mb, updated) "
+                "VALUES (:prefix, :email, :password, :quota_mb, :updated)",
+                [dict(item, updated=time.time()) for item in items]
+            )
+            added = db.total_changes - before
+            db.execute("COMMIT")
+            return added
+    
+    def lease(self, worker: str, lease_seconds: float) -> Optional[dict]:
+        now = time.time()
+        with self._connect() as db:
+            # Yazma kilidi: iki işçi aynı öğeyi alamaz
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute(
+                "SELECT * FROM items WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                db.execute("COMMIT")
+                return None
+            db.execute(
+                "UPDATE items SET status = 'leased', worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker, now + lease_seconds, now, row["id"])
+            )
+            db.execute("COMMIT")
+            item = dict(row)
+            item.update(status="leased", worker=worker, attempts=row["attempts"] + 1)
+            return item
+    
+    def heartbeat(self, item_id: int, worker: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE items SET lease_expires = ?, updated = ? "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (now + lease_seconds, now, item_id, worker)
+            )
+            return cursor.rowcount == 1
+    
+    def complete(self, item_id: int, worker: str, success: bool,
+                 mailpanel_registered: bool = False, error: Optional[str] = None) -> bool:
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE items SET status = ?, success = ?, mailpanel_registered = ?, "
+                "error = ?, lease_expires = NULL, updated = ? "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                ("done" if success else "failed", int(success), int(mailpanel_registered),
+                 error, time.time(), item_id, worker)
+            )
+            return cursor.rowcount == 1
+    
+    def requeue_expired(self, max_attempts: int = MAX_ATTEMPTS) -> int:
+        now = time.time()
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "UPDATE items SET status = 'failed', success = 0, error = 'kiralama süresi doldu', "
+                "worker = NULL, lease_expires = NULL, updated = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, max_attempts)
+            )
+            cursor = db.execute(
+                "UPDATE items SET status = 'pending', worker = NULL, lease_expires = NULL, updated = ? "
+                "WHERE status = 'leased' AND lease_expires < ?",
+                (now, now)
+            )
+            requeued = cursor.rowcount
+            db.execute("COMMIT")
+            return requeued
+    
+    def summary(self) -> dict:
+        with self._connect() as db:
+            counts = {status: 0 for status in STATUSES}
+            for row in db.execute("SELECT status, COUNT(*) AS n FROM items GROUP BY status"):
+                counts[row["status"]] = row["n"]
+            
+            workers = {}
+            for row in db.execute(
+                "SELECT worker, status, COUNT(*) AS n FROM items "
+                "WHERE worker IS NOT NULL GROUP BY worker, status"
+            ):
+                workers.setdefault(row["worker"], {})[row["status"]] = row["n"]
+            
+            registered = db.execute(
+                "SELECT COUNT(*) FROM items WHERE status = 'done' AND mailpanel_registered = 1"
+            ).fetchone()[0]
+        
+        return {
+            "total": sum(counts.values()),
+            "statuses": counts,
+            "mailpanel_registered": registered,
+            "workers": workers,
+        }
+
+
+class MemoryJobQueue(JobQueue):
+    """
+    Tek süreç içinde paylaşılan kuyruk (testler ve gömülü kullanım)
+    
+    Öğeler süreçle birlikte kaybolur; ayrı süreçlerde çalışan ekleme ve
+    işçi komutları aynı bellek kuyruğunu göremez.
+    """
+    
+    def __init__(self, path: str = ""):
+        self.items = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def enqueue(self, items: list) -> int:
+        with self._lock:
+            known = {item["prefix"] for item in self.items.values()}
+            added = 0
+            for item in items:
+                if item["prefix"] in known:
+                    continue
+                self.items[self._next_id] = dict(
+                    item, id=self._next_id, status="pending", worker=None, lease_expires=None,
+                    attempts=0, success=None, mailpanel_registered=None, error=None
+                )
+                known.add(item["prefix"])
+                self._next_id += 1
+                added += 1
+            return added
+    
+    def lease(self, worker: str, lease_seconds: float) -> Optional[dict]:
+        with self._lock:
+            for item in self.items.values():
+                if item["status"] == "pending":
+                    item.update(status="leased", worker=worker,
+                                lease_expires=time.time() + lease_seconds,
+                                attempts=item["attempts"] + 1)
+                    return dict(item)
+            return None
+    
+    def _owned(self, item_id: int, worker: str) -> Optional[dict]:
+        item = self.items.get(item_id)
+        if item and item["status"] == "leased" and item["worker"] == worker:
+            return item
+        return None
+    
+    def heartbeat(self, item_id: int, worker: str, lease_seconds: float) -> bool:
+        with self._lock:
+            item = self._owned(item_id, worker)
+            if item:
+                item["lease_expires"] = time.time() + lease_seconds
+            return item is not None
+    
+    def complete(self, item_id: int, worker: str, success: bool,
+                 mailpanel_registered: bool = False, error: Optional[str] = None) -> bool:
+        with self._lock:
+            item = self._owned(item_id, worker)
+            if item:
+                item.update(status="done" if success else "failed", success=success,
+                            mailpanel_registered=mailpanel_registered, error=error,
+                            lease_expires=None)
+            return item is not None
+    
+    def requeue_expired(self, max_attempts: int = MAX_ATTEMPTS) -> int:
+        now = time.time()
+        requeued = 0
+        with self._lock:
+            for item in self.items.values():
+                if item["status"] != "leased" or item["lease_expires"] >= now:
+                    continue
+                if item["attempts"] >= max_attempts:
+                    item.update(status="failed", success=False, error="kiralama süresi doldu")
+                else:
+                    item["status"] = "pending"
+                    requeued += 1
+                item.update(worker=None, lease_expires=None)
+        return requeued
+    
+    def summary(self) -> dict:
+        with self._lock:
+            counts = {status: 0 for status in STATUSES}
+            workers = {}
+            registered = 0
+            for item in self.items.values():
+                counts[item["status"]] += 1
+                if item["worker"]:
+                    per_worker = workers.setdefault(item["worker"], {})
+                    per_worker[item["status"]] = per_worker.get(item["status"], 0) + 1
+                if item["status"] == "done" and item["mailpanel_registered"]:
+                    registered += 1
+        return {
+            "total": sum(counts.values()),
+            "statuses": counts,
+            "mailpanel_registered": registered,
+            "workers": workers,
+        }
+
+
+# Kuyruk arka uçları: "şema://yol" -> fabrika
+QUEUE_BACKENDS: dict = {
+    "sqlite": SQLiteJobQueue,
+    "memory": MemoryJobQueue,
+}
+
+_memory_queues: dict = {}
+
+
+def register_backend(scheme: str, factory: Callable[[str], JobQueue]):
+    """
+    Harici bir aracı (broker) için kuyruk arka ucu kaydet
+    
+    Args:
+        scheme: Kuyruk adresinin şeması (örn. "redis")
+        factory: Yol -> JobQueue (genellikle JobQueue alt sınıfı)
+    
+    Raises:
+        TypeError: Alt sınıf JobQueue'nun soyut metotlarını uygulamıyor
+    """
+    if inspect.isclass(factory) and inspect.isabstract(factory):
+        missing = ", ".join(sorted(factory.__abstractmethods__))
+        raise TypeError(f"Kuyruk arka ucu eksik: {factory.__name__} ({missing} uygulanmamış)")
+    QUEUE_BACKENDS[scheme] = factory
+
+
+def open_queue(url: str) -> JobQueue:
+    """
+    Kuyruk adresinden kuyruk aç
+    
+    Örnekler: /queue/jobs.db, sqlite:///queue/jobs.db, memory://yerel
+    
+    Raises:
+        ValueError: Bilinmeyen arka uç
+    """
+    scheme, separator, path = url.partition("://")
+    if not separator:
+        scheme, path = "sqlite", url
+    
+    if scheme not in QUEUE_BACKENDS:
+        raise ValueError(f"Bilinmeyen kuyruk arka ucu: {scheme}")
+    
+    # Aynı süreçteki işçiler aynı bellek kuyruğunu paylaşır
+    if scheme == "memory":
+        if path not in _memory_queues:
+            _memory_queues[path] = MemoryJobQueue(path)
+        return _memory_queues[path]
+    
+    return QUEUE_BACKENDS[scheme](path)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İşlem Günlüğü
+Toplu işlemlerin sonuçlarını satır satır JSON (JSONL) olarak kaydeder
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+
+class Journal:
+    """Thread-safe, sadece eklemeli JSONL günlüğü"""
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Günlük dosyası (None ise kayıt tutulmaz)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+    
+    def record(self, operation: str, email: str, status: str, **extra):
+        """
+        Tek bir işlem sonucunu günlüğe ekle
+        
+        Args:
+            operation: İşlem adı (delete, quota, password...)
+            email: İşlem yapılan adres
+            status: ok, failed, skipped, dry-run
+            **extra: Ek alanlar (hata mesajı vb.)
+        """
+        if not self.path:
+            return
+        
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "operation": operation,
+            "email": email,
+            "status": status,
+        }
+        entry.update(extra)
+        
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mailpanel API İstemcisi
+E-posta hesaplarını mailpanel'e kaydetme ve listeleme
+"""
+
+from typing import Callable, Optional
+
+from .cancel import CancelToken
+from .ratelimit import TokenBucket
+
+
+MAILPANEL_API_URL = "https://mailpanel2.phoenixtur.com/api/email-accounts/"
+MAILPANEL_DOMAIN = "@mailpanel.phoenixtur.com"
+
+
+class MailpanelClient:
+    """Mailpanel REST API istemcisi"""
+    
+    def __init__(
+        self,
+        logger: Optional[Callable[[str], None]] = None,
+        api_url: str = MAILPANEL_API_URL,
+        timeout: int = 30,
+        rate_limiter: Optional[TokenBucket] = None,
+        cancel_token: Optional[CancelToken] = None
+    ):
+        """
+        İstemciyi başlat
+        
+        Args:
+            logger: Log fonksiyonu (opsiyonel, varsayılan: print)
+            api_url: E-posta hesapları API adresi
+            timeout: HTTP istek zaman aşımı (saniye)
+            rate_limiter: Kayıt isteklerinin çekeceği ortak token bucket
+            cancel_token: Kayıt isteğini ve hız sınırı beklemesini kesen iptal bayrağı
+        """
+        self.logger = logger or print
+        self.api_url = api_url
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.cancel_token = cancel_token or CancelToken()
+    
+    def log(self, message: str):
+        """Log mesajı gönder"""
+        self.logger(message)
+    
+    def register(self, email_address: str, password: str) -> bool:
+        """
+        E-postayı mailpanel API'sine kaydet
+        
+        Args:
+            email_address: Tam e-posta adresi (örn: test100@mailpanel.phoenixtur.com)
+            password: E-posta şifresi
+        
+        Returns:
+            True: başarılı, False: başarısız
+        
+        Raises:
+            Cancelled: İstek beklenirken durdurma istendi (kayıt yapılmış olabilir)
+        """
+        import requests
+        
+        # E-posta adresinden name oluştur
+        email_name = email_address.split("@")[0]
+        
+        payload = {
+            "name": f"Phoenix {email_name}",
+            "email_address": email_address,
+            "password": password,
+            "check_interval": 5,
+            "is_active": True
+        }
+        
+        if self.rate_limiter:
+            waited = self.rate_limiter.acquire(self.cancel_token)
+            if waited > 0:
+                self.log(f"Hız sınırı: mailpanel için {waited:.1f} sn beklendi")
+        
+        try:
+            self.log(f"Mailpanel API'ye kayıt gönderiliyor: {email_address}")
+            
+            # İstek ayrı thread'de; durdurma isteği 30 sn zaman aşımını beklemez
+            response = self.cancel_token.call(
+                requests.post,
+                self.api_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
+            )
+            
+            if response.status_code in [200, 201]:
+                self.log(f"✓ Mailpanel'e kaydedildi: {email_address}")
+                return True
+            else:
+                self.log(f"✗ Mailpanel API hatası: {response.status_code} - {response.text}")
+                return False
+        
+        except requests.exceptions.Timeout:
+            self.log(f"✗ Mailpanel API zaman aşımı: {email_address}")
+            return False
+        except requests.exceptions.RequestException as e:
+            self.log(f"✗ Mailpanel API bağlantı hatası: {str(e)}")
+            return False
+        except Exception as e:
+            self.log(f"✗ Mailpanel kayıt hatası: {str(e)}")
+            return False
+    
+    def list_accounts(self) -> set:
+        """
+        Mailpanel'deki tüm e-posta adreslerini toplu olarak getir
+        
+        Sayfalı yanıtlarda (count/next/results) tüm sayfalar takip edilir,
+        düz liste yanıtı da desteklenir.
+        
+        Returns:
+            Küçük harfe çevrilmiş e-posta adresleri kümesi
+        
+        Raises:
+            requests.exceptions.RequestException: API'ye ulaşılamazsa
+        """
+        import requests
+        
+        addresses = set()
+        url = self.api_url
+        
+        with requests.Session() as session:
+            while url:
+                response = session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+                data = response.json()
+                
+                if isinstance(data, dict):
+                    accounts = data.get("results", [])
+                    url = data.get("next")
+                else:
+                    accounts = data
+                    url = None
+                
+                for account in accounts:
+                    address = account.get("email_address")
+                    if address:
+                        addresses.add(address.lower())
+        
+        self.log(f"Mailpanel'de {len(addresses)} hesap bulundu")
+        return addresses
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İş Manifestosu
+Tek oturumda art arda çalıştırılacak oluşturma işlerini (prefix, şifre,
+aralık, kota) YAML/JSON/CSV dosyasından okur
+"""
+
+import csv
+import dataclasses
+import getpass
+import json
+import os
+import sys
+from typing import Optional
+
+from .config import BotConfig
+
+
+# Manifestodaki iş alanı -> BotConfig alanı
+JOB_FIELDS = {
+    "prefix": "prefix",
+    "password": "password",
+    "start": "start_number",
+    "count": "count",
+    "domain": "email_domain",
+    "quota": "mailbox_quota_mb",
+}
+
+# Tam sayı olması gereken alanlar (CSV'de metin gelir)
+INTEGER_FIELDS = ("start", "count", "quota")
+
+
+def read_manifest(path: str) -> dict:
+    """
+    Manifesto dosyasını oku
+    
+    YAML için PyYAML gerekir (opsiyonel). CSV'de her satır bir iştir ve
+    panel bölümü yoktur.
+    
+    Returns:
+        {"panel": {...}, "jobs": [...]}
+    
+    Raises:
+        ValueError: Dosya biçimi veya içeriği geçersiz
+        OSError: Dosya okunamadı
+    """
+    extension = os.path.splitext(path)[1].lower()
+    
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML manifesto için PyYAML gerekli: pip install pyyaml")
+            data = yaml.safe_load(handle)
+        elif extension == ".json":
+            data = json.load(handle)
+        elif extension == ".csv":
+            data = {"jobs": [
+                {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+                for row in csv.DictReader(handle)
+            ]}
+        else:
+            raise ValueError(f"Desteklenmeyen manifesto biçimi: {extension or path} (.yaml, .json, .csv)")
+    
+    if isinstance(data, list):
+        data = {"jobs": data}
+    if not isinstance(data, dict) or not isinstance(data.get("jobs"), list) or not data["jobs"]:
+        raise ValueError("Manifestoda en az bir iş içeren 'jobs' listesi olmalı")
+    if not isinstance(data.get("panel", {}), dict):
+        raise ValueError("Manifestodaki 'panel' bölümü sözlük olmalı")
+    return data
+
+
+def panel_credentials(manifest: dict, email: str = "", password: str = "") -> tuple[str, str]:
+    """
+    Panel giriş bilgilerini belirle
+    
+    Öncelik: komut satırı/ortam değişkeni, manifestoda adı verilen ortam
+    değişkeni (email_env, password_env), etkileşimli terminalde sorma.
+    Panel şifresi manifestoya düz metin olarak yazılamaz.
+    
+    Returns:
+        (panel e-postası, panel şifresi)
+    
+    Raises:
+        ValueError: Şifre manifestoda düz metin verilmiş veya bulunamadı
+    """
+    panel = manifest.get("panel", {})
+    if "password" in panel:
+        raise ValueError("Panel şifresi manifestoya yazılamaz; password_env ile ortam değişkeni adı verin")
+    
+    email = email or (os.environ.get(panel["email_env"], "") if panel.get("email_env") else "") or panel.get("email", "")
+    if not password and panel.get("password_env"):
+        password = os.environ.get(panel["password_env"], "")
+    
+    if not password and email and sys.stdin.isatty():
+        password = getpass.getpass(f"Panel şifresi ({email}): ")
+    if not email or not password:
+        raise ValueError("Panel giriş bilgileri eksik (--panel-email/--panel-password, ortam değişkeni veya manifesto)")
+    return email, password
+
+
+def _job_value(job: dict, key: str):
+    """İş alanını oku; şifre password_env ile ortam değişkeninden de gelebilir"""
+    if key == "password" and "password" not in job and job.get("password_env"):
+        return os.environ.get(job["password_env"], "")
+    value = job[key]
+    if key in INTEGER_FIELDS:
+        return int(value)
+    return str(value)
+
+
+def build_jobs(base: BotConfig, manifest: dict) -> list:
+    """
+    Her iş için temel yapılandırmadan türetilmiş BotConfig oluştur
+    
+    Manifestoda verilmeyen alanlar (domain, kota ...) temel yapılandırmadan gelir.
+    
+    Returns:
+        Doğrulanmış BotConfig listesi
+    
+    Raises:
+        ValueError: İş geçersiz (hata mesajında iş numarası yer alır)
+    """
+    jobs = []
+    for number, job in enumerate(manifest["jobs"], 1):
+        if not isinstance(job, dict):
+            raise ValueError(f"İş {number}: sözlük olmalı")
+        
+        unknown = set(job) - set(JOB_FIELDS) - {"password_env"}
+        if unknown:
+            raise ValueError(f"İş {number}: bilinmeyen alan: {', '.join(sorted(unknown))}")
+        
+        try:
+            changes = {
+                field: _job_value(job, key)
+                for key, field in JOB_FIELDS.items()
+                if key in job or (key == "password" and "password_env" in job)
+            }
+        except ValueError as e:
+            raise ValueError(f"İş {number}: geçersiz sayı: {str(e)}")
+        
+        config = dataclasses.replace(base, **changes)
+        is_valid, error = config.validate()
+        if not is_valid:
+            raise ValueError(f"İş {number} ({config.prefix or '?'}): {error}")
+        jobs.append(config)
+    
+    return jobs
+
+
+def describe_job(number: int, total: int, config: BotConfig) -> str:
+    """İşin tek satırlık özeti"""
+    last = config.start_number + config.count - 1
+    return (f"İş {number}/{total}: {config.prefix}{config.start_number} - {config.prefix}{last} "
+            f"({config.count} e-posta, {config.email_domain}, {config.mailbox_quota_mb} MB)")
+
+
+def combined_summary(job_results: list) -> dict:
+    """İş sonuçlarını toplam özet sözlüğünde birleştir"""
+    summary = {"total": 0, "success": 0, "failed": 0, "cancelled": 0, "jobs": job_results}
+    for results in job_results:
+        for key in ("total", "success", "failed", "cancelled"):
+            summary[key] += results[key]
+    return summary
+
+
+def find_duplicates(jobs: list) -> Optional[str]:
+    """
+    İki işte aynı posta kutusu varsa ilkini döndür
+    
+    Posta kutusunu prefix belirler (panelde ve mailpanelde adres prefix'ten
+    türetilir); email_domain sadece log gösterimidir, karşılaştırmaya girmez.
+    """
+    seen = {}
+    for number, config in enumerate(jobs, 1):
+        for i in range(config.count):
+            name = config.get_email_prefix(i).lower()
+            if name in seen and seen[name] != number:
+                return f"{config.get_email_prefix(i)} (iş {seen[name]} ve iş {number})"
+            seen[name] = number
+    return None
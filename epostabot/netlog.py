@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ağ Yanıtı İzleyici
+Chrome performans günlüğündeki Network olaylarından form gönderiminin
+sunucu yanıtını okur; sonuç liste sayfasına yönlendirme beklenmeden bilinir
+"""
+
+import json
+from typing import Optional
+from urllib.parse import parse_qs
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Oluşturma formunun gönderildiği adres
+SUBMIT_PATH = "/smb/email-address/create"
+
+# Chrome'dan sadece Network olaylarını iste (Page/Tracing kapalı)
+LOGGING_PREFS = {"performance": "ALL"}
+PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": False}
+
+# Panelin satır içi hata mesajları
+ERROR_SELECTORS = (
+    ".field-errors .error-hint, .msg-box.msg-error, .pul-form-field__error, "
+    ".pul-toast--danger, .pul-alert--danger"
+)
+
+# Mevcut URL'i ve görünür ilk hata mesajını tek komutta oku
+INLINE_STATUS_SCRIPT = """
+    for (const el of document.querySelectorAll(arguments[0])) {
+        const text = el.innerText.trim();
+        if (text && el.offsetParent !== null) { return [location.href, text]; }
+    }
+    return [location.href, null];
+"""
+
+
+def parse_submit_body(body: str) -> Optional[tuple[bool, Optional[str]]]:
+    """
+    Plesk form yanıtını yorumla
+    
+    Returns:
+        (başarılı mı, hata mesajı) veya yanıt JSON değilse None
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    
+    if data.get("status") == "error":
+        messages = [message.get("content", "") for message in data.get("statusMessages", []) if isinstance(message, dict)]
+        
+        # Alan hataları iç içe sözlüklerdedir: {"general": {"name": {"exists": "..."}}}
+        pending = [data.get("formMessages", {})]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                pending.extend(value.values())
+            elif isinstance(value, str) and value:
+                messages.append(value)
+        
+        return False, "; ".join(message for message in messages if message) or "Panel hata döndürdü"
+    
+    if data.get("status") == "success" or data.get("redirect"):
+        return True, None
+    return None
+
+
+class SubmitMonitor:
+    """
+    Form gönderimlerini performans günlüğünden izler
+    
+    Günlük tüm sekmeler için ortaktır; gönderimler POST gövdesindeki posta
+    kutusu adıyla eşleştirilir. Yanıt gövdesi, sonucu soran sekme aktifken
+    CDP ile okunur. Tüm yanıtlar için önbellek isabetleri de sayılır.
+    """
+    
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Performans günlüğü açık Chrome WebDriver
+        """
+        self.driver = driver
+        self.enabled = True
+        self._requests = {}  # requestId -> formdaki değerler
+        self._finished = {}  # requestId -> (HTTP durumu, ağ hatası)
+        self._status = {}
+        self._from_cache = set()
+        self.responses = 0
+        self.cache_hits = 0
+        self.server_failure = False  # Son sonuç 5xx veya ağ hatası mıydı
+    
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Önbellekten (disk/bellek) karşılanan yanıt oranı"""
+        if not self.responses:
+            return None
+        return self.cache_hits / self.responses
+    
+    def drain(self):
+        """Biriken günlük kayıtlarını işle"""
+        if not self.enabled:
+            return
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            # Günlük açık değil: URL/DOM kontrolüne düş
+            self.enabled = False
+            return
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            
+            if method == "Network.requestServedFromCache":
+                self._from_cache.add(request_id)
+            elif method == "Network.responseReceived":
+                self.responses += 1
+                if params.get("response", {}).get("fromDiskCache") or request_id in self._from_cache:
+                    self.cache_hits += 1
+                self._from_cache.discard(request_id)
+            
+            if method == "Network.requestWillBeSent":
+                request = params.get("request", {})
+                if request.get("method") == "POST" and SUBMIT_PATH in request.get("url", ""):
+                    fields = parse_qs(request.get("postData", ""))
+                    self._requests[request_id] = {value for values in fields.values() for value in values}
+            elif request_id not in self._requests:
+                continue
+            elif method == "Network.responseReceived":
+                self._status[request_id] = params.get("response", {}).get("status", 0)
+            elif method == "Network.loadingFinished":
+                self._finished[request_id] = (self._status.pop(request_id, 0), None)
+            elif method == "Network.loadingFailed":
+                self._finished[request_id] = (0, params.get("errorText", "ağ hatası"))
+    
+    def forget(self, email_prefix: str):
+        """Aynı posta kutusu için önceki gönderimleri unut (yeniden deneme öncesi)"""
+        for request_id, values in list(self._requests.items()):
+            if email_prefix in values:
+                self._requests.pop(request_id)
+                self._finished.pop(request_id, None)
+                self._status.pop(request_id, None)
+    
+    def result(self, email_prefix: str) -> Optional[tuple[bool, Optional[str]]]:
+        """
+        Posta kutusunun gönderim sonucunu döndür
+        
+        Sonucu soran sekmenin aktif olması gerekir (yanıt gövdesi o sekmeden okunur).
+        
+        Returns:
+            (başarılı mı, hata mesajı) veya yanıt henüz gelmediyse None
+        """
+        for request_id, (status, network_error) in list(self._finished.items()):
+            if email_prefix not in self._requests.get(request_id, ()):
+                continue
+            self._finished.pop(request_id)
+            self._requests.pop(request_id)
+            self.server_failure = bool(network_error) or status >= 500
+            
+            if network_error:
+                return False, f"Ağ hatası: {network_error}"
+            if status >= 400:
+                return False, f"Panel HTTP {status} döndürdü"
+            
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            except WebDriverException:
+                return None
+            return parse_submit_body(body.get("body", ""))
+        return None
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çok Sekmeli Boru Hattı Motoru
+Tek oturum açılmış tarayıcıda birden fazla sekmeyle e-posta oluşturur
+"""
+
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from .bot import BotEngine
+from .cancel import Cancelled, CancelToken
+from .config import BotConfig
+
+
+# Tüm sekmeler meşgulken sonuç kontrolleri arasındaki bekleme
+POLL_INTERVAL = 0.2
+
+
+class PipelinedEngine(BotEngine):
+    """
+    Boru hattı motoru
+    
+    Bir sekme form gönderiminin sonucunu beklerken sıradaki sekme kendi
+    formunu doldurur. Birden fazla Chrome başlatmadan eşzamanlılık sağlar.
+    
+    config.tabs üst sınırdır; aynı anda sonuç bekleyen sekme sayısı AIMD
+    denetleyicisiyle ayarlanır. Devre kesici açıkken yeni form gönderilmez.
+    """
+    
+    def _chrome_arguments(self) -> list:
+        """Arka plan sekmelerinin zamanlayıcıları yavaşlatılmasın"""
+        return super()._chrome_arguments() + [
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+        ]
+    
+    def _open_tabs(self) -> list:
+        """
+        Yapılandırılan sayıda sekme aç ve pencere tanıtıcılarını döndür
+        
+        Aynı oturumda tekrar çağrılırsa (örn. manifest işleri) açık sekmeler
+        yeniden kullanılır.
+        """
+        handles = list(self.driver.window_handles)[:self.config.tabs]
+        for _ in range(self.config.tabs - len(handles)):
+            self.driver.switch_to.new_window("tab")
+            handles.append(self.driver.current_window_handle)
+        self.log(f"{len(handles)} sekme ile boru hattı başlatıldı")
+        return handles
+    
+    def _recover_tabs(self, results: dict, in_flight: dict) -> Optional[deque]:
+        """
+        Bekçi tarayıcıyı öldürdükten sonra sekmeleri yeniden kur
+        
+        Sonucu beklenen öğeler başarısız sayılır (sekmeleri artık yok) ve
+        tıkanma olarak eşzamanlılık denetleyicisine ve devre kesiciye bildirilir.
+        
+        Returns:
+            Yeni boş sekmeler veya tarayıcı kurtarılamadıysa None
+        """
+        for index, started_at, _ in in_flight.values():
+            self.log(f"✗ {self.config.get_email(index)}: tarayıcı yeniden başlatıldığı için sonuç alınamadı")
+            self._observe(time.monotonic() - started_at, True, started_at)
+            self._record_result(results, index, False)
+        in_flight.clear()
+        
+        if not self.recover_browser():
+            self.log("Tarayıcı kurtarılamadı! Bot durduruluyor.")
+            return None
+        return deque(self._open_tabs())
+    
+    def _submit_in_tab(self, handle: str, index: int) -> bool:
+        """
+        Sekmeye geç, formu doldur ve gönder
+        
+        Gönderimin başlangıcı (hız sınırı beklemesinden sonra)
+        submit_started_at'e yazılır; gecikme buradan ölçülür.
+        
+        Gönderim hataları tıkanma olarak bildirilir (takılma sonrası kopan
+        sürücü bağlantısı dahil).
+        
+        Returns:
+            True: form gönderildi, False: gönderim sırasında hata
+        """
+        self.submit_started_at = None
+        email = self.config.get_email(index)
+        self.log(f"\n--- E-posta {index+1}/{self.config.count}: {email} ---")
+        if self.profiler:
+            self.profiler.set_item(email)
+        
+        try:
+            self.driver.switch_to.window(handle)
+            with self._step("submit_create_form"):
+                self.submit_create_form(self.config.get_email_prefix(index), rate_limited=False)
+            return True
+        except WebDriverException as e:
+            self.log(f"✗ {email}: Tarayıcı hatası: {str(e)}")
+        except Exception as e:
+            # Bekçi tarayıcıyı öldürdüyse sürücü bağlantısı kopar
+            self.log(f"✗ {email}: Beklenmeyen hata: {str(e)}")
+        started_at = self.submit_started_at if self.submit_started_at is not None else time.monotonic()
+        self._observe(time.monotonic() - started_at, True, started_at)
+        return False
+    
+    def _poll_tab(self, handle: str, index: int, started_at: float, submitted_at: float) -> Optional[bool]:
+        """
+        Sekmedeki gönderimin sonucunu beklemeden kontrol et
+        
+        Returns:
+            True: başarılı, False: başarısız/zaman aşımı, None: hâlâ bekleniyor
+        """
+        email = self.config.get_email(index)
+        if self.profiler:
+            self.profiler.set_item(email)
+        
+        try:
+            self.driver.switch_to.window(handle)
+            with self._step("check_create_result"):
+                done = self.check_create_result(self.config.get_email_prefix(index))
+        except WebDriverException as e:
+            self.log(f"✗ {email}: Tarayıcı hatası: {str(e)}")
+            self._observe(time.monotonic() - started_at, True, submitted_at)
+            return False
+        except Exception as e:
+            # Bekçi tarayıcıyı öldürdüyse sürücü bağlantısı kopar
+            self.log(f"✗ {email}: Beklenmeyen hata: {str(e)}")
+            self._observe(time.monotonic() - started_at, True, submitted_at)
+            return False
+        
+        latency = time.monotonic() - started_at
+        waited = time.monotonic() - submitted_at
+        if done is not None:
+            # Sıralı moddaki sonuç beklemesiyle aynı ölçü; zaman aşımı buradan öğrenilir
+            self.timeouts.record("create_result", waited)
+        if done is False:
+            self.log(f"✗ {email} oluşturulamadı: {self.last_create_error}")
+            self._observe(latency, self.last_create_congested, submitted_at)
+            return False
+        if done:
+            self.log(f"✓ {email} başarıyla oluşturuldu!")
+            # Tahminler için sıralı moddaki create_email ile aynı ölçü
+            self.history.record_step("create_email", latency)
+            self._observe(latency, False, submitted_at)
+            return True
+        timeout = self.timeouts.get("create_result")
+        if waited > timeout:
+            self.timeouts.record_timeout("create_result")
+            self.log(f"✗ {email}: Zaman aşımı ({timeout:.0f} sn), mevcut URL: {self.driver.current_url}")
+            self._observe(latency, True, submitted_at)
+            return False
+        return None
+    
+    def _create_all(self, results: dict):
+        """
+        Aralıktaki e-postaları sekmeler arasında boru hattıyla oluştur
+        
+        Args:
+            results: run() sonuç sözlüğü
+        """
+        in_flight = {}  # sekme -> (indeks, gönderim başlangıcı, gönderim bitişi)
+        try:
+            self._pipeline(results, in_flight)
+        except Cancelled:
+            # Gönderilmiş ama sonucu okunmamış formlar iptal sayılır
+            for index, _, _ in in_flight.values():
+                self._record_cancelled(results, index)
+            in_flight.clear()
+            raise
+    
+    def _pipeline(self, results: dict, in_flight: dict):
+        """
+        Boru hattı döngüsü
+        
+        Args:
+            results: run() sonuç sözlüğü
+            in_flight: Sonucu beklenen sekmeler (durdurmada iptal kaydı için paylaşılır)
+        """
+        free = deque(self._open_tabs())
+        next_index = 0
+        last_submit = None
+        
+        while next_index < self.config.count or in_flight:
+            self.cancel_token.check()
+            if not self.running:
+                self.log("Bot durduruldu!")
+                break
+            
+            # Devre açıksa yeni form gönderme; süresi dolunca boş bir sekmede paneli yokla
+            if self.breaker.is_open:
+                if free and self.breaker.ready_to_probe():
+                    with self._watch("panel yoklaması"):
+                        self.driver.switch_to.window(free[0])
+                        self._probe_breaker()
+            
+            # Boş sekmelere, etkin eşzamanlılık sınırına kadar yeni formlar gönder
+            while (free and next_index < self.config.count and self.running
+                   and not self.breaker.is_open and len(in_flight) < self.concurrency.active):
+                if last_submit is not None:
+                    remaining = self.config.delay_between_logins - (time.monotonic() - last_submit)
+                    if remaining > 0:
+                        break
+                # Token yoksa beklemek yerine sonuçları topla; aksi halde bu bekleme
+                # diğer sekmelerin gecikmesine eklenir ve tıkanma sanılır
+                if self.panel_limiter and self.panel_limiter.try_acquire() > 0:
+                    break
+                
+                handle = free.popleft()
+                index = next_index
+                next_index += 1
+                last_submit = time.monotonic()
+                
+                try:
+                    with self._watch(self.config.get_email(index)):
+                        submitted = self._submit_in_tab(handle, index)
+                except Cancelled:
+                    self._record_cancelled(results, index)
+                    raise
+                if self._check_hang():
+                    if submitted:
+                        # Gönderim süre dolarken bitti; hatası yukarıda bildirilmedi
+                        self._observe(time.monotonic() - self.submit_started_at, True, self.submit_started_at)
+                    self._record_result(results, index, False)
+                    free = self._recover_tabs(results, in_flight)
+                    if free is None:
+                        return
+                    break
+                
+                if submitted:
+                    in_flight[handle] = (index, self.submit_started_at, time.monotonic())
+                else:
+                    self._record_result(results, index, False)
+                    free.append(handle)
+            
+            # Bekleyen sekmelerin sonuçlarını topla
+            for handle, (index, started_at, submitted_at) in list(in_flight.items()):
+                with self._watch(self.config.get_email(index)):
+                    outcome = self._poll_tab(handle, index, started_at, submitted_at)
+                if self._check_hang():
+                    del in_flight[handle]
+                    self._record_result(results, index, False)
+                    free = self._recover_tabs(results, in_flight)
+                    if free is None:
+                        return
+                    break
+                if outcome is None:
+                    continue
+                del in_flight[handle]
+                free.append(handle)
+                self._record_result(results, index, outcome)
+            
+            if in_flight or next_index < self.config.count:
+                self.cancel_token.sleep(POLL_INTERVAL)
+
+
+def create_engine(
+    config: BotConfig,
+    logger: Optional[Callable[[str], None]] = None,
+    panel_email: str = "",
+    panel_password: str = "",
+    cancel_token: Optional[CancelToken] = None
+) -> BotEngine:
+    """Yapılandırmaya göre uygun motoru oluştur (tabs > 1 ise boru hattı)"""
+    engine_class = PipelinedEngine if config.tabs > 1 else BotEngine
+    return engine_class(
+        config,
+        logger=logger,
+        panel_email=panel_email,
+        panel_password=panel_password,
+        cancel_token=cancel_token
+    )
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çalışma Planlayıcı
+Geçmiş adım sürelerinden toplam süre, hata oranı ve gereken işçi sayısını tahmin eder
+"""
+
+from typing import Optional
+
+from .config import BotConfig
+from .history import TimingHistory
+
+
+# Geçmiş veri yokken kullanılan adım süreleri (saniye)
+DEFAULT_STEP_SECONDS = {
+    "panel_login": 5.0,
+    "wait_for_dashboard": 3.0,
+    "create_email": 15.0,
+    "submit_create_form": 5.0,
+    "register_email_to_mailpanel": 1.0,
+}
+
+# Hedef süre hesabında denenecek en fazla sekme/işçi
+MAX_WORKERS = 32
+
+# Canlı tahminde gözlenen hıza geçmek için gereken en az öğe
+MIN_LIVE_ITEMS = 3
+
+
+def format_duration(seconds: float) -> str:
+    """Süreyi okunabilir hale getir (örn: 1 sa 5 dk, 3 dk 20 sn)"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours} sa {minutes} dk"
+    if minutes:
+        return f"{minutes} dk {secs} sn"
+    return f"{secs} sn"
+
+
+class RunPlanner:
+    """Geçmiş zamanlamalara dayalı süre tahmini"""
+    
+    def __init__(self, config: BotConfig, history: TimingHistory):
+        """
+        Args:
+            config: Bot yapılandırması (aralık, sekme sayısı, bekleme)
+            history: Panel host'unun zamanlama geçmişi
+        """
+        self.config = config
+        self.history = history
+    
+    def step_seconds(self, name: str) -> float:
+        """Adımın geçmiş ortalaması, yoksa varsayılan değer"""
+        mean = self.history.mean(name)
+        return DEFAULT_STEP_SECONDS.get(name, 0.0) if mean is None else mean
+    
+    @property
+    def has_history(self) -> bool:
+        """Oluşturma adımı için geçmiş örnek var mı"""
+        return self.history.mean("create_email") is not None or self.history.mean("submit_create_form") is not None
+    
+    def item_seconds(self, workers: int) -> float:
+        """
+        Bir öğenin duvar saati maliyeti
+        
+        Sıralı modda oluşturma + kayıt + bekleme toplamıdır. Boru hattında
+        bekleme süreleri sekmeler arasında örtüşür, ancak form doldurma
+        tek tarayıcıda sıralı kaldığı için alt sınırdır.
+        """
+        create = self.step_seconds("create_email")
+        register = self.step_seconds("register_email_to_mailpanel")
+        delay = self.config.delay_between_logins
+        sequential = create + register + delay
+        
+        if workers <= 1:
+            return sequential
+        serial = self.step_seconds("submit_create_form") + register
+        return max(sequential / workers, serial, delay)
+    
+    def estimate(self, workers: Optional[int] = None, count: Optional[int] = None) -> dict:
+        """
+        Çalışmanın toplam süresini tahmin et
+        
+        Args:
+            workers: Eşzamanlı sekme/işçi sayısı (varsayılan: config.tabs)
+            count: Öğe sayısı (varsayılan: config.count)
+        
+        Returns:
+            seconds, setup_seconds, item_seconds, failure_rate, workers
+        """
+        workers = workers or self.config.tabs
+        count = self.config.count if count is None else count
+        setup = self.step_seconds("panel_login") + self.step_seconds("wait_for_dashboard")
+        item = self.item_seconds(workers)
+        
+        return {
+            "seconds": setup + count * item,
+            "setup_seconds": setup,
+            "item_seconds": item,
+            "failure_rate": self.history.failure_rate(),
+            "workers": workers,
+            "from_history": self.has_history,
+        }
+    
+    def workers_for_deadline(self, deadline_seconds: float, max_workers: int = MAX_WORKERS) -> Optional[int]:
+        """
+        Son teslim süresini karşılamak için gereken en az işçi sayısı
+        
+        Returns:
+            İşçi sayısı veya max_workers ile bile yetişmiyorsa None
+        """
+        for workers in range(1, max_workers + 1):
+            if self.estimate(workers=workers)["seconds"] <= deadline_seconds:
+                return workers
+        return None
+    
+    def remaining(self, done: int, elapsed: float) -> float:
+        """
+        Çalışma sırasında kalan süreyi tahmin et
+        
+        İlk birkaç öğeden sonra bu çalışmada gözlenen hız, geçmiş tahmini ile
+        tamamlanan oran kadar harmanlanır.
+        
+        Args:
+            done: Tamamlanan öğe sayısı
+            elapsed: Oluşturma adımının başından beri geçen süre
+        """
+        left = max(self.config.count - done, 0)
+        planned = left * self.item_seconds(self.config.tabs)
+        if done < MIN_LIVE_ITEMS:
+            return planned
+        observed = left * elapsed / done
+        weight = done / self.config.count
+        return weight * observed + (1 - weight) * planned
+    
+    def describe(self, deadline_minutes: Optional[float] = None) -> list:
+        """
+        Kullanıcıya gösterilecek tahmin satırları
+        
+        Args:
+            deadline_minutes: Hedef süre (dakika, opsiyonel)
+        """
+        estimate = self.estimate()
+        source = "geçmiş verilere göre" if estimate["from_history"] else "varsayılan değerlere göre, geçmiş yok"
+        lines = [f"Tahmini süre: {format_duration(estimate['seconds'])} ({source})"]
+        
+        if estimate["failure_rate"] is not None:
+            expected_failures = estimate["failure_rate"] * self.config.count
+            lines.append(f"Beklenen hata oranı: %{estimate['failure_rate'] * 100:.1f} (~{expected_failures:.0f} e-posta)")
+        
+        if deadline_minutes:
+            workers = self.workers_for_deadline(deadline_minutes * 60)
+            if workers is None:
+                lines.append(f"{deadline_minutes:g} dk hedefi {MAX_WORKERS} sekme/işçiyle bile karşılanamıyor")
+            else:
+                lines.append(f"{deadline_minutes:g} dk hedefi için gereken sekme/işçi: {workers}")
+        
+        return lines
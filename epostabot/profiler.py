@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebDriver Komut Profilleyici
+Chromedriver'a giden her komutu öğe ve adım bazında sayar ve zamanlar
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Optional
+
+
+# Sayfa yüklemesi bekleyen komutlar
+PAGE_LOAD_COMMANDS = {"get", "refresh", "goBack", "goForward"}
+
+
+class CommandProfiler:
+    """Selenium sürücüsünü saran, opsiyonel profilleme katmanı"""
+    
+    def __init__(self):
+        self.item = "-"
+        self.step = "-"
+        # (öğe, adım, komut) -> [adet, toplam süre]
+        self.commands = defaultdict(lambda: [0, 0.0])
+        # (öğe, adım) -> [adım süresi, komut süresi]
+        self.steps = defaultdict(lambda: [0.0, 0.0])
+        self._step_command_time = 0.0
+    
+    def attach(self, driver):
+        """
+        Sürücünün execute metodunu sar
+        
+        WebElement komutları da sürücünün execute metodundan geçtiği için
+        findElement, sendKeys, click gibi tüm komutlar yakalanır.
+        
+        Args:
+            driver: Selenium WebDriver örneği
+        """
+        original_execute = driver.execute
+        
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self.record_command(driver_command, time.perf_counter() - start)
+        
+        driver.execute = profiled_execute
+    
+    def set_item(self, item: Optional[str]):
+        """Sonraki komutların ait olduğu öğeyi belirle"""
+        self.item = item or "-"
+    
+    def record_command(self, command: str, elapsed: float):
+        """Tek bir komutun süresini kaydet"""
+        entry = self.commands[(self.item, self.step, command)]
+        entry[0] += 1
+        entry[1] += elapsed
+        self._step_command_time += elapsed
+    
+    @contextmanager
+    def measure_step(self, name: str):
+        """Bir motor adımının toplam ve komut sürelerini ölç"""
+        previous_step, previous_command_time = self.step, self._step_command_time
+        self.step = name
+        self._step_command_time = 0.0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.steps[(self.item, name)]
+            entry[0] += time.perf_counter() - start
+            entry[1] += self._step_command_time
+            self.step = previous_step
+            self._step_command_time = previous_command_time + self._step_command_time
+    
+    def summary(self) -> dict:
+        """
+        Toplanan verileri özetle
+        
+        Returns:
+            Komut, adım, öğe ve kategori bazında toplamlar
+        """
+        by_command = defaultdict(lambda: [0, 0.0])
+        by_item = defaultdict(float)
+        categories = {"round_trip": 0.0, "page_load": 0.0, "wait": 0.0}
+        
+        for (item, step, command), (count, elapsed) in self.commands.items():
+            by_command[command][0] += count
+            by_command[command][1] += elapsed
+            if command in PAGE_LOAD_COMMANDS:
+                categories["page_load"] += elapsed
+            else:
+                categories["round_trip"] += elapsed
+        
+        by_step = defaultdict(lambda: [0.0, 0.0])
+        for (item, step), (step_time, command_time) in self.steps.items():
+            by_step[step][0] += step_time
+            by_step[step][1] += command_time
+            by_item[item] += step_time
+            # Komut dışında geçen süre: time.sleep ve WebDriverWait beklemeleri
+            categories["wait"] += max(step_time - command_time, 0.0)
+        
+        return {
+            "commands": {name: {"count": c, "seconds": s} for name, (c, s) in by_command.items()},
+            "steps": {name: {"seconds": s, "command_seconds": c} for name, (s, c) in by_step.items()},
+            "items": dict(by_item),
+            "categories": categories,
+        }
+    
+    def report(self, top: int = 10) -> str:
+        """
+        Duvar saati süresinin nereye gittiğini gösteren sıralı rapor
+        
+        Args:
+            top: Gösterilecek en yavaş komut/öğe sayısı
+        
+        Returns:
+            Çok satırlı rapor metni
+        """
+        data = self.summary()
+        labels = {
+            "round_trip": "Komut gidiş-dönüş",
+            "page_load": "Sayfa yükleme",
+            "wait": "Bekleme (sleep/WebDriverWait)",
+        }
+        
+        lines = ["=== Profil Raporu ===", "Kategoriler:"]
+        for key, seconds in sorted(data["categories"].items(), key=lambda kv: kv[1], reverse=True):
+            lines.append(f"  {labels[key]:<32} {seconds:8.2f} sn")
+        
+        lines.append("Adımlar:")
+        for name, entry in sorted(data["steps"].items(), key=lambda kv: kv[1]["seconds"], reverse=True):
+            lines.append(
+                f"  {name:<32} {entry['seconds']:8.2f} sn "
+                f"(komut: {entry['command_seconds']:.2f} sn)"
+            )
+        
+        lines.append("Komutlar:")
+        commands = sorted(data["commands"].items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+        for name, entry in commands[:top]:
+            average_ms = entry["seconds"] / entry["count"] * 1000 if entry["count"] else 0.0
+            lines.append(
+                f"  {name:<32} {entry['seconds']:8.2f} sn "
+                f"x{entry['count']} (ort. {average_ms:.0f} ms)"
+            )
+        
+        lines.append("En yavaş öğeler:")
+        items = sorted(data["items"].items(), key=lambda kv: kv[1], reverse=True)
+        for name, seconds in items[:top]:
+            lines.append(f"  {name:<32} {seconds:8.2f} sn")
+        
+        return "\n".join(lines)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kalıcı Tarayıcı Profilleri
+Panel hesabı başına Chrome user-data-dir dizinleri; oturum çerezleri ve
+statik dosya önbelleği çalışmalar arasında korunur
+"""
+
+import os
+import re
+import time
+
+from .config import BotConfig
+from .filelock import locked
+
+
+# Profil dizinindeki sahiplik kilidi (içinde sahibin PID'i yazar)
+LOCK_FILE = "epostabot.lock"
+
+# Aynı hesap için denenecek en fazla profil dizini (hesap, hesap-1, hesap-2 ...)
+MAX_PROFILES = 16
+
+# PID yazılmamış kilit bu süreden eskiyse sahipsiz sayılır
+EMPTY_LOCK_GRACE = 10
+
+
+def _pid_alive(pid: int) -> bool:
+    """Süreç hâlâ çalışıyor mu"""
+    if pid <= 0:
+        return False
+    
+    if os.name == "nt":
+        import ctypes
+        
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class BrowserProfile:
+    """Tek bir sürecin kilitlediği kalıcı profil dizini"""
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Chrome user-data-dir dizini
+        """
+        self.path = path
+        self.lock_path = os.path.join(path, LOCK_FILE)
+        self.locked = False
+    
+    @classmethod
+    def acquire(cls, config: BotConfig, account: str, max_profiles: int = MAX_PROFILES) -> "BrowserProfile":
+        """
+        Panel hesabı için boşta olan ilk profili kilitle
+        
+        Eşzamanlı işçiler aynı dizini paylaşmaz; dizin kilitliyse sıradaki
+        (hesap-1, hesap-2 ...) denenir.
+        
+        Raises:
+            RuntimeError: Boşta profil yok
+        """
+        name = re.sub(r"[^\w.@-]", "_", account.lower()) or "default"
+        base = os.path.join(config.get_data_dir(), "profiles", config.panel_host, name)
+        
+        for number in range(max_profiles):
+            profile = cls(base if number == 0 else f"{base}-{number}")
+            if profile.lock():
+                return profile
+        raise RuntimeError(f"Boşta tarayıcı profili kalmadı: {base}")
+    
+    def _owner_alive(self) -> bool:
+        """Kilidin sahibi hâlâ çalışıyor mu"""
+        try:
+            with open(self.lock_path, "r", encoding="utf-8") as handle:
+                content = handle.read().strip()
+        except OSError:
+            return False
+        
+        if not content:
+            # Sahibi PID'i henüz yazmamış olabilir
+            try:
+                return time.time() - os.path.getmtime(self.lock_path) < EMPTY_LOCK_GRACE
+            except OSError:
+                return False
+        
+        try:
+            return _pid_alive(int(content))
+        except ValueError:
+            return False
+    
+    def lock(self) -> bool:
+        """
+        Profili bu süreç adına kilitle
+        
+        Sahibi ölmüş kilitler kaldırılır. Sahiplik kontrolü, eski kilidin
+        kaldırılması ve yeni kilidin yazılması süreçler arası dosya kilidi
+        altında tek adımda yapılır; aynı anda eski kilidi gören iki süreçten
+        biri diğerinin yeni aldığı kilidi silemez.
+        
+        Returns:
+            True: kilit alındı, False: profil başka bir süreçte
+        """
+        os.makedirs(self.path, exist_ok=True)
+        
+        with locked(self.lock_path):
+            if os.path.exists(self.lock_path):
+                if self._owner_alive():
+                    return False
+                try:
+                    os.remove(self.lock_path)
+                except FileNotFoundError:
+                    pass
+            
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                return False
+            
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(str(os.getpid()))
+            self.locked = True
+            return True
+    
+    def release(self):
+        """Kilidi bırak"""
+        if not self.locked:
+            return
+        self.locked = False
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+    
+    @property
+    def is_new(self) -> bool:
+        """Profil daha önce Chrome tarafından kullanılmamış mı"""
+        return not os.path.exists(os.path.join(self.path, "Default"))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token Bucket Hız Sınırlayıcı
+Aynı panele giden istekleri thread'ler ve süreçler arasında ortak bir
+dakika başı kota ile sınırlar
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from .cancel import CancelToken
+from .config import BotConfig
+from .filelock import lock_file, unlock_file
+
+
+class TokenBucket:
+    """Süreç içi, thread-safe token bucket"""
+    
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        """
+        Args:
+            rate_per_minute: Dakikada izin verilen işlem sayısı
+            burst: Kovada biriktirilebilecek en fazla token (ani yük payı)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+    
+    def _take(self, tokens: float, updated: float, now: float) -> tuple[float, float]:
+        """
+        Kovayı doldur ve bir token almayı dene
+        
+        Returns:
+            (kalan token, beklenmesi gereken süre) - süre 0 ise token alındı
+        """
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+        if tokens >= 1.0:
+            return tokens - 1.0, 0.0
+        return tokens, (1.0 - tokens) / self.rate
+    
+    def _try_acquire(self) -> float:
+        """Bir token almayı dene, alınamazsa beklenecek süreyi döndür"""
+        with self._lock:
+            now = time.time()
+            self._tokens, wait = self._take(self._tokens, self._updated, now)
+            self._updated = now
+            return wait
+    
+    def try_acquire(self) -> float:
+        """
+        Beklemeden bir token almayı dene
+        
+        Returns:
+            0: token alındı, aksi halde token için beklenmesi gereken süre
+            (token alınmaz)
+        """
+        return self._try_acquire()
+    
+    def acquire(self, cancel_token: Optional[CancelToken] = None) -> float:
+        """
+        Token alınana kadar bekle
+        
+        Args:
+            cancel_token: Verilirse bekleme durdurma isteğiyle kesilir
+        
+        Returns:
+            Toplam bekleme süresi (saniye)
+        
+        Raises:
+            Cancelled: Beklerken durdurma istendi
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return waited
+            if cancel_token:
+                cancel_token.sleep(wait)
+            else:
+                time.sleep(wait)
+            waited += wait
+
+
+class SharedTokenBucket(TokenBucket):
+    """Durumu kilitli bir dosyada tutan, süreçler arası token bucket"""
+    
+    def __init__(self, path: str, rate_per_minute: float, burst: int = 1):
+        """
+        Args:
+            path: Kova durumunun saklanacağı JSON dosyası
+            rate_per_minute: Dakikada izin verilen işlem sayısı
+            burst: Kovada biriktirilebilecek en fazla token
+        """
+        super().__init__(rate_per_minute, burst)
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    
+    def _try_acquire(self) -> float:
+        """Durumu dosyadan oku, token almayı dene ve geri yaz"""
+        with self._lock, open(self.path, "a+", encoding="utf-8") as handle:
+            lock_file(handle)
+            try:
+                handle.seek(0)
+                try:
+                    state = json.loads(handle.read() or "{}")
+                except ValueError:
+                    state = {}
+                
+                now = time.time()
+                tokens, wait = self._take(
+                    state.get("tokens", float(self.burst)),
+                    state.get("updated", now),
+                    now
+                )
+                
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps({"tokens": tokens, "updated": now}))
+                handle.flush()
+                return wait
+            finally:
+                unlock_file(handle)
+
+
+_limiters: dict = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config: BotConfig, host: str) -> Optional[TokenBucket]:
+    """
+    Host için ortak hız sınırlayıcıyı getir
+    
+    Aynı süreçteki tüm motorlar aynı nesneyi, farklı süreçler ise
+    veri dizinindeki aynı durum dosyasını paylaşır.
+    
+    Args:
+        config: Bot yapılandırması (rate_per_minute, rate_burst, data_dir)
+        host: Sınırlanacak panel host'u
+    
+    Returns:
+        TokenBucket veya sınırlama kapalıysa None
+    """
+    if config.rate_per_minute <= 0:
+        return None
+    
+    path = os.path.join(config.get_data_dir(), "ratelimit", f"{host}.json")
+    key = (path, config.rate_per_minute, config.rate_burst)
+    
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = SharedTokenBucket(path, config.rate_per_minute, config.rate_burst)
+        return _limiters[key]
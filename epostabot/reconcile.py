@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plesk - Mailpanel Mutabakatı
+Plesk'te oluşturulmuş fakat mailpanel'e kaydedilmemiş hesapları bulup kaydeder
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .bot import BotEngine
+from .mailpanel import MAILPANEL_DOMAIN, MailpanelClient
+
+
+def diff_accounts(expected: set, plesk: set, mailpanel: set) -> dict:
+    """
+    İki tarafın hesap listelerini küme işlemleriyle karşılaştır
+    
+    Args:
+        expected: Prefix/aralıktan üretilen beklenen adresler
+        plesk: Plesk'te bulunan adresler
+        mailpanel: Mailpanel'de bulunan adresler
+    
+    Returns:
+        Sıralı adres listeleri içeren fark sözlüğü
+    """
+    return {
+        # Plesk'te var, mailpanel'de yok -> kaydedilecek
+        "missing_in_mailpanel": sorted((expected & plesk) - mailpanel),
+        # Hiç oluşturulmamış
+        "missing_in_plesk": sorted(expected - plesk),
+        # Mailpanel'de kayıtlı ama posta kutusu yok
+        "orphaned_in_mailpanel": sorted((expected & mailpanel) - plesk),
+        "in_sync": sorted(expected & plesk & mailpanel),
+    }
+
+
+class Reconciler:
+    """Plesk ve mailpanel arasında toplu mutabakat"""
+    
+    def __init__(
+        self,
+        engine: BotEngine,
+        mailpanel: Optional[MailpanelClient] = None,
+        workers: int = 8
+    ):
+        """
+        Args:
+            engine: Panele giriş yapacak bot motoru (yapılandırması aralığı belirler)
+            mailpanel: Mailpanel istemcisi (opsiyonel, varsayılan: motorunki)
+            workers: Eşzamanlı kayıt isteği sayısı
+        """
+        self.engine = engine
+        self.config = engine.config
+        self.mailpanel = mailpanel or engine.mailpanel
+        self.workers = max(1, workers)
+    
+    def log(self, message: str):
+        """Log mesajı gönder"""
+        self.engine.log(message)
+    
+    def expected_addresses(self) -> set:
+        """Prefix/aralıktaki tüm mailpanel adresleri"""
+        return {
+            f"{self.config.get_email_prefix(i)}{MAILPANEL_DOMAIN}".lower()
+            for i in range(self.config.count)
+        }
+    
+    def register_missing(self, addresses: list) -> dict:
+        """
+        Eksik hesapları mailpanel'e eşzamanlı olarak kaydet
+        
+        Args:
+            addresses: Kaydedilecek adresler
+        
+        Returns:
+            Adres -> başarı durumu
+        """
+        if not addresses:
+            return {}
+        
+        password = self.config.password
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(addresses))) as executor:
+            outcomes = executor.map(lambda address: self.mailpanel.register(address, password), addresses)
+            return dict(zip(addresses, outcomes))
+    
+    def run(self, dry_run: bool = False) -> dict:
+        """
+        Mutabakatı çalıştır
+        
+        1. Panele giriş yap ve posta kutusu listesini tek seferde oku
+        2. Mailpanel hesap listesini toplu olarak getir
+        3. Farkı hesapla ve eksikleri eşzamanlı kaydet
+        
+        Args:
+            dry_run: True ise sadece farkı raporla, kayıt yapma
+        
+        Returns:
+            Fark listeleri ve kayıt sonuçları
+        """
+        results = {"registered": {}, "error": None}
+        
+        try:
+            self.engine.start()
+            
+            self.log("\n=== ADIM 1: Panel Girişi ===")
+            if not self.engine.login():
+                results["error"] = "Panel girişi başarısız"
+                return results
+            
+            self.log("\n=== ADIM 2: Hesap Listeleri ===")
+            plesk = self.engine.list_mailboxes()
+            mailpanel = self.mailpanel.list_accounts()
+            
+            results.update(diff_accounts(self.expected_addresses(), plesk, mailpanel))
+            missing = results["missing_in_mailpanel"]
+            self.log(f"=== Mailpanel'de eksik: {len(missing)}, "
+                     f"Plesk'te eksik: {len(results['missing_in_plesk'])}, "
+                     f"Senkron: {len(results['in_sync'])} ===")
+            
+            if dry_run:
+                return results
+            
+            self.log("\n=== ADIM 3: Eksik Hesaplar Kaydediliyor ===")
+            results["registered"] = self.register_missing(missing)
+        
+        except Exception as e:
+            self.log(f"Kritik hata: {str(e)}")
+            results["error"] = str(e)
+        finally:
+            self.engine.stop()
+        
+        return results
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uyarlamalı Zaman Aşımları
+Her bekleme adımının zaman aşımı, o adımın panelde gözlenen son sürelerinin
+yüksek yüzdeliğinden türetilir; geçmiş yokken sabit varsayılanlar kullanılır
+"""
+
+from typing import Optional
+
+from .config import BotConfig
+from .history import TimingHistory
+
+
+# Bekleme süreleri geçmişte bu önekle saklanır (planner adımlarından ayrı)
+SAMPLE_PREFIX = "wait_"
+
+# Geçmiş yokken kullanılan zaman aşımları (saniye); None = config.timeout
+DEFAULT_TIMEOUTS = {
+    "login_form": None,      # Login sayfasında kullanıcı adı alanı
+    "dashboard": 30,         # Girişten sonra dashboard yönlendirmesi
+    "panel_probe": None,     # Oturum/devre kesici yoklaması
+    "create_form": 30,       # Oluşturma formunun yüklenmesi
+    "create_result": 60,     # Form gönderiminden sonra sonuç
+    "mailbox_list": 30,      # Posta kutusu listesi tablosu
+    "confirm_dialog": 10,    # Toplu silmede onay penceresi
+}
+
+# Yüzdelik hesabına girecek en son örnek sayısı (kayan pencere)
+WINDOW = 200
+
+# Bundan az örnekle varsayılan kullanılır (p99 birkaç örnekte anlamsız)
+MIN_SAMPLES = 20
+
+# Öğrenilen zaman aşımı bu adımlarda varsayılanın bu oranının altına inmez.
+# create_result zaman aşımı öğeyi başarısız sayar ve mailpanel kaydını atlar;
+# oysa kutu panelde oluşmuş olabilir (yetim kayıt). Hızlı panelde öğrenilen
+# birkaç saniyelik sınır tek bir yavaş yanıtı bu duruma düşürmesin.
+FLOOR_FRACTIONS = {
+    "create_result": 0.5,
+}
+
+# Art arda bu kadar zaman aşımında sınır bir kademe genişletilir
+WIDEN_AFTER = 3
+
+# Kademe başına genişletme oranı (sınır yine maximum'u aşmaz)
+WIDEN_STEP = 0.5
+
+# Otomatik öğe süre sınırında en uzun beklemelerin üstüne eklenen pay
+# (sayfa yükleme, form doldurma; saniye)
+DEADLINE_MARGIN = 30
+
+
+class StepTimeouts:
+    """
+    Adım başına öğrenilen zaman aşımları
+    
+    Zaman aşımı = tamamlanan son beklemelerin yüzdeliği × katsayı,
+    [minimum, maximum] aralığına sıkıştırılır (FLOOR_FRACTIONS'taki adımlarda
+    alt sınır daha yüksektir). Zaman aşımına uğrayan
+    beklemeler örneklere girmez (süreleri bilinmiyor; sınırın kendi kendini
+    büyütmesine yol açar). Panel yavaşlarsa art arda WIDEN_AFTER zaman
+    aşımında bir sonraki tamamlanan beklemeye kadar sınır kademeli genişletilir.
+    """
+    
+    def __init__(
+        self,
+        history: TimingHistory,
+        defaults: dict,
+        enabled: bool = True,
+        factor: float = 2.0,
+        minimum: float = 5.0,
+        maximum: float = 120.0,
+        fraction: float = 0.99,
+        min_samples: int = MIN_SAMPLES
+    ):
+        """
+        Args:
+            history: Panel host'unun zamanlama geçmişi
+            defaults: Adım -> soğuk başlangıç zaman aşımı
+            enabled: False ise her zaman varsayılanlar kullanılır
+            factor: Yüzdelik değerinin çarpanı
+            minimum: Öğrenilen zaman aşımının alt sınırı
+            maximum: Öğrenilen zaman aşımının üst sınırı
+            fraction: Kullanılacak yüzdelik (0.99 = p99)
+            min_samples: Öğrenilen değer için gereken en az örnek
+        """
+        self.history = history
+        self.defaults = defaults
+        self.enabled = enabled
+        self.factor = factor
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.fraction = fraction
+        self.min_samples = min_samples
+        self._timeout_streaks = {}  # adım -> art arda zaman aşımı sayısı
+    
+    @classmethod
+    def for_config(cls, config: BotConfig, history: TimingHistory) -> "StepTimeouts":
+        """Yapılandırmadaki sınırlarla oluştur"""
+        defaults = {
+            step: config.timeout if seconds is None else seconds
+            for step, seconds in DEFAULT_TIMEOUTS.items()
+        }
+        return cls(
+            history,
+            defaults,
+            enabled=config.adaptive_timeouts,
+            factor=config.timeout_factor,
+            minimum=config.timeout_min,
+            maximum=config.timeout_max
+        )
+    
+    def learned(self, step: str) -> Optional[float]:
+        """Geçmişten öğrenilen zaman aşımı (yeterli örnek yoksa None)"""
+        if not self.enabled:
+            return None
+        name = SAMPLE_PREFIX + step
+        if len(self.history.samples(name)[-WINDOW:]) < self.min_samples:
+            return None
+        value = self.history.percentile(name, self.fraction, WINDOW) * self.factor
+        floor = max(self.minimum, self.defaults[step] * FLOOR_FRACTIONS.get(step, 0.0))
+        widen = 1 + WIDEN_STEP * (self._timeout_streaks.get(step, 0) // WIDEN_AFTER)
+        return min(self.maximum, max(floor, value) * widen)
+    
+    def get(self, step: str) -> float:
+        """Adımın şu anki zaman aşımı (saniye)"""
+        learned = self.learned(step)
+        return self.defaults[step] if learned is None else learned
+    
+    def ceiling(self, step: str) -> float:
+        """Adımın alabileceği en uzun zaman aşımı"""
+        default = self.defaults[step]
+        return max(default, self.maximum) if self.enabled else default
+    
+    def worst_case(self) -> float:
+        """Bekçiyle korunan tek bir bloktaki en uzun toplam bekleme"""
+        return max(
+            self.ceiling("create_form") + self.ceiling("create_result"),
+            self.ceiling("login_form") + self.ceiling("dashboard")
+        )
+    
+    def record(self, step: str, seconds: float):
+        """Tamamlanan beklemenin süresini kaydet"""
+        self._timeout_streaks[step] = 0
+        self.history.record_step(SAMPLE_PREFIX + step, seconds)
+    
+    def record_timeout(self, step: str):
+        """Zaman aşımına uğrayan beklemeyi say (örneklere girmez)"""
+        self._timeout_streaks[step] = self._timeout_streaks.get(step, 0) + 1
+    
+    def describe(self) -> list:
+        """Öğrenilmiş zaman aşımlarını varsayılanlarıyla birlikte listele"""
+        lines = []
+        for step, default in self.defaults.items():
+            learned = self.learned(step)
+            if learned is not None:
+                lines.append(f"Zaman aşımı: {step} {learned:.1f} sn (varsayılan {default:g} sn)")
+        return lines
+
+
+def minimum_item_deadline(config: BotConfig) -> float:
+    """
+    Öğe süre sınırının alabileceği en küçük değer
+    
+    Sağlıklı ama öğrenilen en uzun zaman aşımlarını bekleyen bir öğe
+    takılma sayılmasın diye bekçiyle korunan bloktaki en uzun toplam bekleme.
+    """
+    return StepTimeouts.for_config(config, TimingHistory()).worst_case()
+
+
+def item_deadline(config: BotConfig) -> float:
+    """
+    Öğe bekçisinin süresi (saniye, 0 = kapalı)
+    
+    Verilmemişse (None) en uzun beklemeler toplamı + DEADLINE_MARGIN kullanılır;
+    verilen değer BotConfig.validate ile en az bu toplam olacak şekilde denetlenir.
+    """
+    if config.item_deadline is None:
+        return minimum_item_deadline(config) + DEADLINE_MARGIN
+    return config.item_deadline
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IMAP Doğrulama
+Oluşturulan posta kutularına belirlenen şifreyle IMAP üzerinden giriş yapılarak
+kullanılabilir oldukları doğrulanır; oluşturma döngüsünden bağımsız çalışır
+"""
+
+import imaplib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from .cancel import CancelToken
+
+
+# SSL kullanılan standart IMAP portu (diğer portlarda düz IMAP4)
+IMAPS_PORT = 993
+
+
+class ImapVerifier:
+    """Sınırlı sayıda eşzamanlı IMAP bağlantısıyla posta kutusu doğrulayıcı"""
+    
+    def __init__(
+        self,
+        host: str,
+        port: int = IMAPS_PORT,
+        pool_size: int = 4,
+        timeout: float = 15.0,
+        attempts: int = 3,
+        retry_delay: float = 5.0,
+        logger: Optional[Callable[[str], None]] = None,
+        cancel_token: Optional[CancelToken] = None
+    ):
+        """
+        Args:
+            host: IMAP sunucusu
+            port: IMAP portu (993 ise SSL)
+            pool_size: Aynı anda açık olabilecek en fazla IMAP bağlantısı
+            timeout: Bağlantı zaman aşımı (saniye)
+            attempts: Posta kutusu henüz hazır değilse deneme sayısı
+            retry_delay: Denemeler arası bekleme
+            logger: Log fonksiyonu
+            cancel_token: Denemeler arası beklemeyi kesen iptal bayrağı
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.attempts = max(1, attempts)
+        self.retry_delay = retry_delay
+        self.logger = logger or print
+        self.cancel_token = cancel_token or CancelToken()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, pool_size), thread_name_prefix="imap")
+        self._pending = set()
+        self._lock = threading.Lock()
+    
+    def check(self, email_address: str, password: str) -> bool:
+        """
+        Tek bir IMAP giriş denemesi
+        
+        Returns:
+            True: giriş başarılı, False: kimlik doğrulama reddedildi
+        
+        Raises:
+            OSError: Sunucuya bağlanılamadı
+        """
+        imap_class = imaplib.IMAP4_SSL if self.port == IMAPS_PORT else imaplib.IMAP4
+        connection = imap_class(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.login(email_address, password)
+            return True
+        except imaplib.IMAP4.error:
+            return False
+        finally:
+            try:
+                connection.logout()
+            except (OSError, imaplib.IMAP4.error):
+                pass
+    
+    def verify(self, email_address: str, password: str) -> bool:
+        """
+        Posta kutusunu doğrula; yeni kutu henüz hazır değilse tekrar dene
+        
+        Returns:
+            True: doğrulandı, False: tüm denemeler başarısız
+        """
+        reason = "giriş reddedildi"
+        for attempt in range(self.attempts):
+            if attempt:
+                self.cancel_token.sleep(self.retry_delay)
+            try:
+                if self.check(email_address, password):
+                    self.logger(f"✓ IMAP doğrulandı: {email_address}")
+                    return True
+                reason = "giriş reddedildi"
+            except OSError as e:
+                reason = f"bağlantı hatası: {str(e)}"
+        
+        self.logger(f"✗ IMAP doğrulanamadı: {email_address} ({reason})")
+        return False
+    
+    def submit(self, email_address: str, password: str, on_done: Callable[[bool], None]) -> Future:
+        """
+        Doğrulamayı arka planda başlat
+        
+        Args:
+            on_done: Sonuçla çağrılır (iptal edilen doğrulamalarda çağrılmaz)
+        """
+        def run() -> bool:
+            # Sonuç, future tamamlanmadan yazılır; wait() döndüğünde hazırdır
+            verified = self.verify(email_address, password)
+            on_done(verified)
+            return verified
+        
+        def finished(done: Future):
+            with self._lock:
+                self._pending.discard(done)
+        
+        future = self._executor.submit(run)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(finished)
+        return future
+    
+    def wait(self, cancel: bool = False):
+        """
+        Bekleyen doğrulamaların bitmesini bekle
+        
+        Args:
+            cancel: True ise henüz başlamamış doğrulamaları iptal et
+        """
+        with self._lock:
+            pending = list(self._pending)
+        if cancel:
+            for future in pending:
+                future.cancel()
+        wait(pending)
+    
+    def close(self):
+        """Bağlantı havuzunu kapat"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
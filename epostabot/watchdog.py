@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Öğe Bekçisi (Watchdog)
+Sürücü thread'inin dışından öğe başına kesin bir süre sınırı uygular; süre
+dolarsa takılan chromedriver/Chrome süreç ağacı zorla sonlandırılır
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+
+def kill_process_tree(pid: int):
+    """
+    Süreci ve alt süreçlerini zorla sonlandır
+    
+    POSIX'te chromedriver kendi süreç grubunda başlatılır (start_new_session),
+    böylece Chrome alt süreçleriyle birlikte tek seferde öldürülür.
+    Windows'ta taskkill /T kullanılır.
+    """
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)], capture_output=True)
+        return
+    
+    try:
+        group = os.getpgid(pid)
+        if group == os.getpgrp():
+            # Ayrı grupta değil: kendi sürecimizi öldürmemek için sadece chromedriver
+            os.kill(pid, signal.SIGKILL)
+        else:
+            os.killpg(group, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+class Watchdog:
+    """Kurulduğu süre içinde kaldırılmayan öğede on_expire'ı çağıran bekçi"""
+    
+    def __init__(self, deadline: float, on_expire: Callable[[str], None], interval: float = 0.5):
+        """
+        Args:
+            deadline: Öğe başına kesin süre sınırı (saniye)
+            on_expire: Süre dolunca öğe etiketiyle çağrılır (bekçi thread'inde)
+            interval: Kontrol aralığı
+        """
+        self.deadline = deadline
+        self.on_expire = on_expire
+        self.interval = interval
+        self.hangs = 0
+        self._lock = threading.Lock()
+        self._expires: Optional[float] = None
+        self._label = ""
+        self._fired = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _run(self, stop: threading.Event):
+        while not stop.wait(self.interval):
+            with self._lock:
+                if self._expires is None or time.monotonic() < self._expires:
+                    continue
+                label = self._label
+                self._expires = None
+                self._fired = True
+                self.hangs += 1
+            self.on_expire(label)
+    
+    def arm(self, label: str):
+        """Öğe için süreyi başlat"""
+        with self._lock:
+            if self._thread is None:
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._stop,), name="watchdog", daemon=True)
+                self._thread.start()
+            self._expires = time.monotonic() + self.deadline
+            self._label = label
+    
+    def disarm(self):
+        """Öğe zamanında bitti"""
+        with self._lock:
+            self._expires = None
+    
+    @contextmanager
+    def paused(self):
+        """
+        Blok süresince kurulu süreyi dondur
+        
+        Sürücü dışındaki beklemeler (örn. hız sınırı token'ı) takılma sayılmaz;
+        blok bitince kalan süre kaldığı yerden devam eder.
+        """
+        with self._lock:
+            remaining = None if self._expires is None else self._expires - time.monotonic()
+            self._expires = None
+        try:
+            yield
+        finally:
+            if remaining is not None:
+                with self._lock:
+                    self._expires = time.monotonic() + remaining
+    
+    @contextmanager
+    def guard(self, label: str):
+        """Blok süresince bekçiyi kur"""
+        self.arm(label)
+        try:
+            yield
+        finally:
+            self.disarm()
+    
+    def consume(self) -> bool:
+        """Son kurulumdan beri süre doldu mu (bayrak sıfırlanır)"""
+        with self._lock:
+            fired, self._fired = self._fired, False
+            return fired
+    
+    def close(self):
+        """
+        Bekçi thread'ini durdur
+        
+        Thread on_expire üzerinden motoru tuttuğu için çalışma bitince
+        çağrılmalıdır; sonraki arm() yeni bir thread başlatır.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._expires = None
+            self._stop.set()
+        if thread and thread is not threading.current_thread():
+            thread.join()
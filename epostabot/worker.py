@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kuyruk İşçisi
+Paylaşımlı kuyruktan posta kutusu işleri kiralayıp tek bir oturumla işler
+"""
+
+import dataclasses
+import os
+import socket
+import threading
+from typing import Optional
+
+from .bot import BotEngine
+from .cancel import Cancelled
+from .jobqueue import JobQueue
+
+
+class QueueWorker:
+    """Kuyruktan iş çeken, kiralamasını heartbeat ile canlı tutan işçi"""
+    
+    def __init__(
+        self,
+        engine: BotEngine,
+        queue: JobQueue,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 120,
+        poll_interval: float = 5,
+        exit_when_empty: bool = True
+    ):
+        """
+        Args:
+            engine: Panele giriş yapacak bot motoru (prefix/şifre öğelerden gelir)
+            queue: Paylaşımlı iş kuyruğu
+            worker_id: İşçi adı (varsayılan: host-pid)
+            lease_seconds: Kiralama süresi; heartbeat bunun üçte birinde bir yenilenir
+            poll_interval: Kuyruk boşken bekleme süresi
+            exit_when_empty: Bekleyen ve kiralanmış iş kalmayınca çık
+        """
+        self.engine = engine
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.exit_when_empty = exit_when_empty
+        self.base_config = engine.config
+    
+    def log(self, message: str):
+        """Log mesajı gönder"""
+        self.engine.log(message)
+    
+    def _heartbeat(self, item_id: int, done: threading.Event):
+        """İş sürerken kiralamayı düzenli olarak uzat"""
+        while not done.wait(self.lease_seconds / 3):
+            if not self.queue.heartbeat(item_id, self.worker_id, self.lease_seconds):
+                self.log(f"✗ Kiralama kaybedildi: öğe {item_id}")
+                return
+    
+    def process(self, item: dict, detail: dict) -> tuple[bool, bool]:
+        """
+        Kiralanan tek bir öğeyi işle
+        
+        Args:
+            item: Kuyruk öğesi
+            detail: Öğenin sonuç kaydı (IMAP doğrulaması açıksa sonradan doldurulur)
+        
+        Returns:
+            (oluşturma başarılı mı, mailpanel'e kaydedildi mi, tarayıcı takıldı mı)
+        """
+        # Öğenin şifresi ve kotası bu iş süresince motorun yapılandırması olur
+        self.engine.config = dataclasses.replace(
+            self.base_config,
+            password=item["password"],
+            mailbox_quota_mb=item["quota_mb"]
+        )
+        try:
+            # Bekçi sadece tarayıcı adımını korur; mailpanel isteği süreye sayılmaz
+            success, hung = self.engine.create_one(item["prefix"], item["email"])
+            detail["success"] = success
+            registered = False
+            if success:
+                registered = self.engine.register_created(item["prefix"])
+                self.engine.verify_created(item["prefix"], detail)
+            return success, registered, hung
+        finally:
+            self.engine.config = self.base_config
+    
+    def _cancel_item(self, item: dict, detail: dict, results: dict):
+        """
+        Durdurma isteğiyle kesilen öğeyi kaydet
+        
+        Posta kutusu oluşmuşsa öğe başarılı (mailpanel'e kaydedilmemiş) olarak
+        tamamlanır; aksi halde kiralama bırakılır ve süresi dolunca öğe
+        kuyruğa geri döner.
+        """
+        results["total"] += 1
+        if detail.get("success"):
+            self.queue.complete(item["id"], self.worker_id, True, False, "mailpanel kaydı durdurma isteğiyle kesildi")
+            results["success"] += 1
+            detail["mailpanel_registered"] = False
+            self.engine.history.record_item(True)
+        else:
+            self.log(f"✗ {item['email']}: iptal edildi, kiralama süresi dolunca kuyruğa geri dönecek")
+            results["cancelled"] += 1
+            detail.update(success=False, cancelled=True, mailpanel_registered=False)
+        results["details"].append(detail)
+    
+    def run(self) -> dict:
+        """
+        İşçi döngüsü
+        
+        1. Panele bir kez giriş yap
+        2. Kuyruktan öğe kirala, heartbeat başlat, işle ve sonucu yaz
+        3. Kuyruk boşalınca (veya durdurulunca) çık
+        
+        Returns:
+            Bu işçinin sonuç istatistikleri
+        """
+        results = {"worker": self.worker_id, "total": 0, "success": 0, "failed": 0, "cancelled": 0, "details": []}
+        
+        try:
+            self.engine.start()
+            
+            self.log(f"\n=== İşçi {self.worker_id}: Panel Girişi ===")
+            if not self.engine.login():
+                self.log("Panel girişi başarısız! İşçi durduruluyor.")
+                return results
+            
+            # Devre açıkken kiralama yapılmaz; kiralamalar başka işçilere kalır
+            while self.engine.wait_for_breaker():
+                requeued = self.queue.requeue_expired()
+                if requeued:
+                    self.log(f"Süresi dolan {requeued} kiralama kuyruğa geri alındı")
+                
+                item = self.queue.lease(self.worker_id, self.lease_seconds)
+                if item is None:
+                    statuses = self.queue.summary()["statuses"]
+                    if self.exit_when_empty and not statuses["pending"] and not statuses["leased"]:
+                        break
+                    self.engine.cancel_token.sleep(self.poll_interval)
+                    continue
+                
+                self.log(f"\n--- {item['email']} (deneme {item['attempts']}) ---")
+                done = threading.Event()
+                heartbeat = threading.Thread(target=self._heartbeat, args=(item["id"], done), daemon=True)
+                heartbeat.start()
+                
+                detail = {"email": item["email"]}
+                try:
+                    success, registered, hung = self.process(item, detail)
+                    error = "tarayıcı takıldı" if hung else None
+                except Cancelled:
+                    self._cancel_item(item, detail, results)
+                    raise
+                except Exception as e:
+                    success, registered, hung, error = False, False, False, str(e)
+                finally:
+                    done.set()
+                    heartbeat.join()
+                
+                if not self.queue.complete(item["id"], self.worker_id, success, registered, error):
+                    self.log(f"✗ {item['email']}: kiralama başka işçiye geçmiş, sonuç yazılmadı")
+                
+                results["total"] += 1
+                results["success" if success else "failed"] += 1
+                detail.update(success=success, mailpanel_registered=registered)
+                results["details"].append(detail)
+                self.engine.history.record_item(success)
+                
+                # Takılan tarayıcı yeniden başlatılır; kurtarılamazsa işçi çıkar
+                if hung and not self.engine.recover_browser():
+                    self.log("Tarayıcı kurtarılamadı! İşçi durduruluyor.")
+                    break
+                
+                if self.engine.running:
+                    self.engine.cancel_token.sleep(self.base_config.delay_between_logins)
+            
+            self.engine.finish_verification(results)
+            self.engine.log_cache_stats()
+            self.engine.report_hangs(results)
+            self.log(f"\n=== İşçi {self.worker_id} tamamlandı! Başarılı: {results['success']}, Başarısız: {results['failed']} ===")
+        
+        except Cancelled:
+            self.engine.shutdown_cancelled(results)
+        except Exception as e:
+            self.log(f"Kritik hata: {str(e)}")
+        finally:
+            try:
+                self.engine.history.save()
+            except OSError:
+                pass
+            # Kapatma hatası asıl hatayı (veya sonuçları) gizlemesin
+            try:
+                self.engine.stop()
+            except Exception as e:
+                self.log(f"Tarayıcı kapatılamadı: {str(e)}")
+        
+        return results
@@ -0,0 +1 @@
+# E-posta Bot Testleri
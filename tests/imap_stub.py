@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test IMAP Sunucusu
+Süreç içinde çalışan, sadece CAPABILITY/LOGIN/LOGOUT komutlarını yanıtlayan
+küçük IMAP sunucusu; bağlantı ve giriş sayılarını ölçer
+"""
+
+import socketserver
+import threading
+import time
+from typing import Optional
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Tek bir IMAP bağlantısı"""
+    
+    def handle(self):
+        stub = self.server.stub
+        stub._connected()
+        try:
+            self._send("* OK IMAP4rev1 test sunucusu hazır")
+            for line in self.rfile:
+                parts = line.decode("utf-8").split()
+                if len(parts) < 2:
+                    continue
+                tag, command = parts[0], parts[1].upper()
+                
+                if command == "CAPABILITY":
+                    self._send("* CAPABILITY IMAP4rev1 AUTH=PLAIN")
+                    self._send(f"{tag} OK CAPABILITY tamamlandı")
+                elif command == "LOGIN" and len(parts) >= 4:
+                    accepted = stub._login(parts[2].strip('"'), parts[3].strip('"'))
+                    self._send(f"{tag} OK LOGIN tamamlandı" if accepted else f"{tag} NO [AUTHENTICATIONFAILED] reddedildi")
+                elif command == "LOGOUT":
+                    self._send("* BYE çıkış")
+                    self._send(f"{tag} OK LOGOUT tamamlandı")
+                    return
+                else:
+                    self._send(f"{tag} BAD desteklenmeyen komut")
+        finally:
+            stub._disconnected()
+    
+    def _send(self, text: str):
+        self.wfile.write(f"{text}\r\n".encode("utf-8"))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ImapStub:
+    """
+    Test için IMAP sunucusu (127.0.0.1, rastgele port; SSL'siz)
+    
+    Kullanım:
+        with ImapStub({"kutu@alan": "şifre"}) as stub:
+            ImapVerifier("127.0.0.1", stub.port)
+    """
+    
+    def __init__(
+        self,
+        accounts: dict,
+        not_ready: Optional[dict] = None,
+        login_delay: float = 0.0,
+        gate: Optional[threading.Event] = None
+    ):
+        """
+        Args:
+            accounts: Kullanıcı -> şifre (diğer girişler NO ile reddedilir)
+            not_ready: Kullanıcı -> ilk kaç girişin reddedileceği (kutu henüz hazır değil)
+            login_delay: Her LOGIN yanıtından önce bekleme (saniye)
+            gate: Verilirse LOGIN yanıtları bu olay set edilene kadar bekletilir
+        """
+        self.accounts = dict(accounts)
+        self.not_ready = dict(not_ready or {})
+        self.login_delay = login_delay
+        self.gate = gate
+        self.logins = []  # (kullanıcı, kabul edildi mi)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+    
+    @property
+    def port(self) -> int:
+        """Sunucunun dinlediği port"""
+        return self._server.server_address[1]
+    
+    def start(self) -> "ImapStub":
+        """Sunucuyu arka plan thread'inde başlat"""
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="imap-stub", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Sunucuyu kapat"""
+        if self.gate:
+            self.gate.set()
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+    
+    def __enter__(self) -> "ImapStub":
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def _connected(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+    
+    def _disconnected(self):
+        with self._lock:
+            self.active -= 1
+    
+    def _login(self, user: str, password: str) -> bool:
+        if self.gate:
+            self.gate.wait()
+        if self.login_delay:
+            time.sleep(self.login_delay)
+        with self._lock:
+            accepted = self.accounts.get(user) == password
+            if accepted and self.not_ready.get(user, 0) > 0:
+                self.not_ready[user] -= 1
+                accepted = False
+            self.logins.append((user, accepted))
+        return accepted
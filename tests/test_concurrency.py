@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uyarlamalı Eşzamanlılık Testleri
+AIMD denetleyicisi ve devre kesici, sahte saatle deterministik olarak denenir
+"""
+
+import unittest
+from unittest import mock
+
+from epostabot import concurrency
+from epostabot.concurrency import AIMDController, CircuitBreaker
+
+
+class FakeClock:
+    """time modülünün yerine geçen, elle ilerletilen monotonic saat"""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class ClockTestCase(unittest.TestCase):
+    """concurrency modülünün saatini sahte saatle değiştirir"""
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(concurrency, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class AIMDControllerTest(ClockTestCase):
+    """Toplamsal artış, çarpımsal azalış ve tekrar düşüş koruması"""
+    
+    def test_additive_increase_adds_one_per_round(self):
+        aimd = AIMDController(minimum=1, maximum=8, initial=2)
+        # Her sağlıklı sonuç 1/sınır ekler: yaklaşık bir tur bir sekme demektir
+        self.assertEqual(aimd.record(1.0), 2)
+        self.assertAlmostEqual(aimd.limit, 2.5)
+        self.assertEqual(aimd.record(1.0), 2)
+        self.assertAlmostEqual(aimd.limit, 2.9)
+        self.assertEqual(aimd.record(1.0), 3)
+    
+    def test_increase_is_capped_at_maximum(self):
+        aimd = AIMDController(minimum=1, maximum=3)
+        for _ in range(50):
+            aimd.record(1.0)
+        self.assertEqual(aimd.limit, 3.0)
+    
+    def test_multiplicative_decrease_on_congestion(self):
+        aimd = AIMDController(minimum=1, maximum=8, initial=8)
+        self.assertEqual(aimd.record(1.0, congested=True), 4)
+        self.clock.advance(1)
+        self.assertEqual(aimd.record(1.0, congested=True), 2)
+        self.clock.advance(1)
+        self.assertEqual(aimd.record(1.0, congested=True), 1)
+        self.clock.advance(1)
+        # Alt sınırın altına inmez
+        self.assertEqual(aimd.record(1.0, congested=True), 1)
+        self.assertEqual(aimd.limit, 1.0)
+    
+    def test_custom_decrease_ratio(self):
+        aimd = AIMDController(minimum=1, maximum=10, initial=10, decrease=0.7)
+        aimd.record(1.0, congested=True)
+        self.assertAlmostEqual(aimd.limit, 7.0)
+    
+    def test_results_submitted_before_decrease_do_not_decrease_again(self):
+        aimd = AIMDController(minimum=1, maximum=8, initial=8)
+        submitted = self.clock.monotonic()
+        self.clock.advance(5)
+        aimd.record(5.0, congested=True, submitted_at=submitted)
+        self.assertEqual(aimd.active, 4)
+        
+        # Aynı tıkanmada gönderilmiş diğer sekmeler sınırı tekrar düşürmez
+        aimd.record(5.0, congested=True, submitted_at=submitted + 1)
+        self.assertEqual(aimd.active, 4)
+        
+        # Düşüşten sonra gönderilen öğe yeni bir tıkanmadır
+        self.clock.advance(1)
+        aimd.record(1.0, congested=True, submitted_at=self.clock.monotonic())
+        self.assertEqual(aimd.active, 2)
+    
+    def test_slow_result_counts_as_congestion(self):
+        aimd = AIMDController(minimum=1, maximum=8, initial=8, baseline=10.0, latency_factor=2.0)
+        aimd.record(20.0)
+        self.assertEqual(aimd.active, 8)
+        self.assertAlmostEqual(aimd.baseline, 11.0)
+        aimd.record(22.1)
+        self.assertEqual(aimd.active, 4)
+        # Tıkanan sonuç taban gecikmeyi değiştirmez
+        self.assertAlmostEqual(aimd.baseline, 11.0)
+    
+    def test_baseline_is_learned_from_healthy_results(self):
+        aimd = AIMDController(maximum=4, smoothing=0.5)
+        aimd.record(4.0)
+        self.assertEqual(aimd.baseline, 4.0)
+        aimd.record(6.0)
+        self.assertEqual(aimd.baseline, 5.0)
+    
+    def test_initial_is_clamped(self):
+        self.assertEqual(AIMDController(minimum=2, maximum=4, initial=9).active, 4)
+        self.assertEqual(AIMDController(minimum=2, maximum=4).active, 2)
+        self.assertEqual(AIMDController(minimum=0, maximum=0).active, 1)
+
+
+class CircuitBreakerTest(ClockTestCase):
+    """Açılma, yoklama ve üstel bekleme"""
+    
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(threshold=3, cooldown=30)
+        self.assertFalse(breaker.record(True))
+        self.assertFalse(breaker.record(True))
+        self.assertTrue(breaker.record(True))
+        self.assertTrue(breaker.is_open)
+        self.assertEqual(breaker.trips, 1)
+        self.assertEqual(breaker.remaining(), 30.0)
+        # Açıkken gelen hatalar devreyi yeniden açmaz
+        self.assertFalse(breaker.record(True))
+        self.assertEqual(breaker.trips, 1)
+    
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(threshold=3)
+        breaker.record(True)
+        breaker.record(True)
+        breaker.record(False)
+        self.assertFalse(breaker.record(True))
+        self.assertFalse(breaker.is_open)
+    
+    def test_zero_threshold_never_opens(self):
+        breaker = CircuitBreaker(threshold=0)
+        for _ in range(20):
+            self.assertFalse(breaker.record(True))
+        self.assertFalse(breaker.is_open)
+    
+    def test_probe_waits_for_cooldown(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=30)
+        breaker.record(True)
+        self.clock.advance(29)
+        self.assertFalse(breaker.ready_to_probe())
+        self.assertEqual(breaker.remaining(), 1.0)
+        self.clock.advance(1)
+        self.assertTrue(breaker.ready_to_probe())
+    
+    def test_successful_probe_closes(self):
+        breaker = CircuitBreaker(threshold=2, cooldown=30)
+        breaker.record(True)
+        breaker.record(True)
+        self.clock.advance(30)
+        breaker.record_probe(True)
+        self.assertFalse(breaker.is_open)
+        self.assertEqual(breaker.remaining(), 0.0)
+        # Hata sayacı da sıfırlandı
+        self.assertFalse(breaker.record(True))
+    
+    def test_failed_probe_doubles_cooldown_up_to_maximum(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=30, max_cooldown=100)
+        breaker.record(True)
+        waits = []
+        for _ in range(4):
+            self.clock.advance(breaker.remaining())
+            self.assertTrue(breaker.ready_to_probe())
+            breaker.record_probe(False)
+            self.assertTrue(breaker.is_open)
+            waits.append(breaker.remaining())
+        self.assertEqual(waits, [60.0, 100.0, 100.0, 100.0])
+    
+    def test_new_trip_starts_from_initial_cooldown(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=30, max_cooldown=300)
+        breaker.record(True)
+        self.clock.advance(30)
+        breaker.record_probe(False)
+        self.clock.advance(60)
+        breaker.record_probe(True)
+        
+        self.assertTrue(breaker.record(True))
+        self.assertEqual(breaker.remaining(), 30.0)
+        self.assertEqual(breaker.trips, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İş Kuyruğu Testleri
+Kiralama, heartbeat, süre dolumu, deneme sınırı ve prefix tekilliği her iki
+arka uçta (SQLite ve bellek) aynı senaryolarla denenir
+"""
+
+import os
+import tempfile
+import unittest
+
+from epostabot.config import BotConfig
+from epostabot.jobqueue import (
+    JobQueue, MAX_ATTEMPTS, MemoryJobQueue, SQLiteJobQueue, open_queue, register_backend,
+)
+
+
+def make_item(prefix: str) -> dict:
+    return {"prefix": prefix, "email": f"{prefix}@mailpanel.example",
+            "password": "Gizli.123", "quota_mb": 30}
+
+
+class JobQueueContract:
+    """Her arka ucun uyması gereken kuyruk kuralları"""
+    
+    def make_queue(self) -> JobQueue:
+        raise NotImplementedError
+    
+    def setUp(self):
+        self.queue = self.make_queue()
+    
+    def test_duplicate_prefix_is_not_enqueued(self):
+        self.assertEqual(self.queue.enqueue([make_item("a1"), make_item("a2")]), 2)
+        self.assertEqual(self.queue.enqueue([make_item("a2"), make_item("a3")]), 1)
+        self.assertEqual(self.queue.summary()["total"], 3)
+    
+    def test_enqueue_config_skips_overlapping_range(self):
+        config = BotConfig(prefix="test", password="Gizli.123", start_number=1, count=5)
+        self.assertEqual(self.queue.enqueue_config(config), 5)
+        config.start_number = 4
+        self.assertEqual(self.queue.enqueue_config(config), 3)
+        self.assertEqual(self.queue.summary()["total"], 8)
+    
+    def test_lease_hands_out_each_item_once(self):
+        self.queue.enqueue([make_item("a1"), make_item("a2")])
+        first = self.queue.lease("w1", 60)
+        second = self.queue.lease("w2", 60)
+        self.assertEqual((first["prefix"], first["worker"], first["attempts"]), ("a1", "w1", 1))
+        self.assertEqual((second["prefix"], second["worker"]), ("a2", "w2"))
+        self.assertIsNone(self.queue.lease("w3", 60))
+    
+    def test_complete_records_result_for_owner_only(self):
+        self.queue.enqueue([make_item("a1"), make_item("a2")])
+        first = self.queue.lease("w1", 60)
+        second = self.queue.lease("w1", 60)
+        self.assertFalse(self.queue.complete(first["id"], "w2", True))
+        self.assertTrue(self.queue.complete(first["id"], "w1", True, mailpanel_registered=True))
+        self.assertTrue(self.queue.complete(second["id"], "w1", False, error="zaman aşımı"))
+        # Tamamlanan öğe ikinci kez tamamlanamaz
+        self.assertFalse(self.queue.complete(first["id"], "w1", False))
+        
+        summary = self.queue.summary()
+        self.assertEqual(summary["statuses"], {"pending": 0, "leased": 0, "done": 1, "failed": 1})
+        self.assertEqual(summary["mailpanel_registered"], 1)
+        self.assertEqual(summary["workers"], {"w1": {"done": 1, "failed": 1}})
+    
+    def test_heartbeat_extends_lease_for_owner_only(self):
+        self.queue.enqueue([make_item("a1")])
+        item = self.queue.lease("w1", -1)
+        self.assertFalse(self.queue.heartbeat(item["id"], "w2", 60))
+        self.assertTrue(self.queue.heartbeat(item["id"], "w1", 60))
+        # Uzatılan kiralama süresi dolmuş sayılmaz
+        self.assertEqual(self.queue.requeue_expired(), 0)
+        self.assertEqual(self.queue.summary()["statuses"]["leased"], 1)
+    
+    def test_expired_lease_is_requeued_and_lost_by_worker(self):
+        self.queue.enqueue([make_item("a1")])
+        item = self.queue.lease("w1", -1)
+        self.assertEqual(self.queue.requeue_expired(), 1)
+        
+        # Eski işçi kiralamayı kaybetti: heartbeat ve sonuç reddedilir
+        self.assertFalse(self.queue.heartbeat(item["id"], "w1", 60))
+        self.assertFalse(self.queue.complete(item["id"], "w1", True))
+        
+        retry = self.queue.lease("w2", 60)
+        self.assertEqual((retry["id"], retry["worker"], retry["attempts"]), (item["id"], "w2", 2))
+    
+    def test_unexpired_lease_is_not_requeued(self):
+        self.queue.enqueue([make_item("a1")])
+        self.queue.lease("w1", 60)
+        self.assertEqual(self.queue.requeue_expired(), 0)
+        self.assertIsNone(self.queue.lease("w2", 60))
+    
+    def test_item_fails_after_max_attempts(self):
+        self.queue.enqueue([make_item("a1")])
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            item = self.queue.lease(f"w{attempt}", -1)
+            self.assertEqual(item["attempts"], attempt)
+            self.queue.requeue_expired()
+        
+        self.assertIsNone(self.queue.lease("w9", 60))
+        summary = self.queue.summary()
+        self.assertEqual(summary["statuses"]["failed"], 1)
+        self.assertEqual(summary["workers"], {})
+    
+    def test_max_attempts_is_configurable(self):
+        self.queue.enqueue([make_item("a1")])
+        self.queue.lease("w1", -1)
+        self.assertEqual(self.queue.requeue_expired(max_attempts=1), 0)
+        self.assertEqual(self.queue.summary()["statuses"]["failed"], 1)
+
+
+class SQLiteJobQueueTest(JobQueueContract, unittest.TestCase):
+    """SQLite arka ucu, her test için geçici dosyada"""
+    
+    def make_queue(self) -> JobQueue:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "jobs.db")
+        return SQLiteJobQueue(self.path)
+    
+    def test_state_is_shared_between_connections(self):
+        self.queue.enqueue([make_item("a1")])
+        other = open_queue(f"sqlite://{self.path}")
+        item = other.lease("w1", 60)
+        self.assertEqual(item["prefix"], "a1")
+        self.assertTrue(self.queue.complete(item["id"], "w1", True))
+        self.assertEqual(other.summary()["statuses"]["done"], 1)
+
+
+class MemoryJobQueueTest(JobQueueContract, unittest.TestCase):
+    """Bellek arka ucu"""
+    
+    def make_queue(self) -> JobQueue:
+        return MemoryJobQueue()
+    
+    def test_open_queue_shares_memory_queue_by_name(self):
+        name = f"memory://{self.id()}"
+        self.assertIs(open_queue(name), open_queue(name))
+        self.assertIsNot(open_queue(name), open_queue(name + "-diger"))
+
+
+class QueueBackendTest(unittest.TestCase):
+    """Arka uç seçimi ve kaydı"""
+    
+    def test_unknown_scheme_is_rejected(self):
+        with self.assertRaises(ValueError):
+            open_queue("redis://kuyruk")
+    
+    def test_incomplete_backend_is_rejected(self):
+        class Incomplete(JobQueue):
+            def enqueue(self, items: list) -> int:
+                return 0
+        
+        with self.assertRaises(TypeError):
+            register_backend("eksik", Incomplete)
+
+
+if __name__ == "__main__":
+    unittest.main()
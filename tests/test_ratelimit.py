@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hız Sınırlayıcı Testleri
+Token bucket sahte saatle deterministik olarak, dosya paylaşımlı kova ise
+gerçek süreçler arasında denenir
+"""
+
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from epostabot import ratelimit
+from epostabot.cancel import Cancelled, CancelToken
+from epostabot.config import BotConfig
+from epostabot.ratelimit import SharedTokenBucket, TokenBucket, get_rate_limiter
+
+
+class FakeClock:
+    """time modülünün yerine geçen, sleep ile ilerleyen saat"""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+    
+    def time(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def acquire_times(path: str, rate_per_minute: float, count: int, start: float) -> list:
+    """Alt süreç: ortak kovadan count token al, alınma zamanlarını döndür"""
+    bucket = SharedTokenBucket(path, rate_per_minute)
+    time.sleep(max(0.0, start - time.time()))
+    times = []
+    for _ in range(count):
+        bucket.acquire()
+        times.append(time.time())
+    return times
+
+
+class TokenBucketTest(unittest.TestCase):
+    """Süreç içi kova: patlama payı, bekleme süresi ve tempo"""
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(ratelimit, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_burst_is_available_immediately(self):
+        bucket = TokenBucket(60, burst=3)
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.try_acquire(), 1.0)
+    
+    def test_try_acquire_reports_wait_without_taking(self):
+        bucket = TokenBucket(30)
+        self.assertEqual(bucket.try_acquire(), 0.0)
+        self.assertAlmostEqual(bucket.try_acquire(), 2.0)
+        self.clock.now += 0.5
+        self.assertAlmostEqual(bucket.try_acquire(), 1.5)
+        self.clock.now += 1.5
+        self.assertEqual(bucket.try_acquire(), 0.0)
+    
+    def test_tokens_do_not_exceed_burst(self):
+        bucket = TokenBucket(60, burst=2)
+        self.clock.now += 3600
+        self.assertEqual([bucket.try_acquire() for _ in range(2)], [0.0, 0.0])
+        self.assertGreater(bucket.try_acquire(), 0.0)
+    
+    def test_acquire_paces_to_rate(self):
+        bucket = TokenBucket(120, burst=1)
+        start = self.clock.now
+        waits = [bucket.acquire() for _ in range(5)]
+        self.assertEqual(waits[0], 0.0)
+        for wait in waits[1:]:
+            self.assertAlmostEqual(wait, 0.5)
+        self.assertAlmostEqual(self.clock.now - start, 2.0)
+    
+    def test_acquire_is_interrupted_by_cancel_token(self):
+        bucket = TokenBucket(60)
+        bucket.acquire()
+        token = CancelToken()
+        token.cancel()
+        with self.assertRaises(Cancelled):
+            bucket.acquire(token)
+        self.assertEqual(self.clock.sleeps, [])
+    
+    def test_shared_buckets_share_state_through_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ratelimit", "panel.json")
+            first = SharedTokenBucket(path, 60, burst=2)
+            second = SharedTokenBucket(path, 60, burst=2)
+            self.assertEqual(first.try_acquire(), 0.0)
+            self.assertEqual(second.try_acquire(), 0.0)
+            self.assertAlmostEqual(first.try_acquire(), 1.0)
+            self.assertAlmostEqual(second.try_acquire(), 1.0)
+            self.clock.now += 1.0
+            self.assertEqual(second.try_acquire(), 0.0)
+            self.assertGreater(first.try_acquire(), 0.0)
+    
+    def test_corrupt_state_file_starts_full(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "panel.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("{bozuk")
+            bucket = SharedTokenBucket(path, 60)
+            self.assertEqual(bucket.try_acquire(), 0.0)
+
+
+class SharedTokenBucketProcessTest(unittest.TestCase):
+    """Ayrı süreçlerdeki motorlar tek bir tempoya uyar"""
+    
+    RATE_PER_MINUTE = 1200    # 20/sn: token aralığı 50 ms
+    PROCESSES = 3
+    PER_PROCESS = 4
+    
+    def test_processes_are_paced_together(self):
+        interval = 60.0 / self.RATE_PER_MINUTE
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ratelimit", "panel.json")
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(self.PROCESSES) as pool:
+                start = time.time() + 1.0
+                results = pool.starmap(
+                    acquire_times,
+                    [(path, self.RATE_PER_MINUTE, self.PER_PROCESS, start)] * self.PROCESSES
+                )
+        
+        times = sorted(t for result in results for t in result)
+        self.assertEqual(len(times), self.PROCESSES * self.PER_PROCESS)
+        # Kovada tek token var: süreç sayısından bağımsız olarak toplam süre
+        # (token sayısı - 1) aralıktan kısa olamaz. Zaman alt süreçte token
+        # alındıktan sonra okunduğundan bir aralık pay bırakılır.
+        self.assertGreaterEqual(times[-1] - times[0], (len(times) - 2) * interval)
+
+
+class RateLimiterRegistryTest(unittest.TestCase):
+    """Yapılandırmadan ortak sınırlayıcı"""
+    
+    def test_disabled_rate_returns_none(self):
+        self.assertIsNone(get_rate_limiter(BotConfig(rate_per_minute=0), "panel.example"))
+    
+    def test_same_host_shares_one_limiter(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config = BotConfig(rate_per_minute=30, data_dir=directory)
+            limiter = get_rate_limiter(config, "panel.example")
+            self.assertIsInstance(limiter, SharedTokenBucket)
+            self.assertIs(get_rate_limiter(config, "panel.example"), limiter)
+            self.assertIsNot(get_rate_limiter(config, "diger.example"), limiter)
+            self.assertEqual(
+                limiter.path, os.path.join(directory, "ratelimit", "panel.example.json")
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uyarlamalı Zaman Aşımı Testleri
+StepTimeouts bellekteki zamanlama geçmişiyle deterministik olarak denenir
+"""
+
+import unittest
+
+from epostabot.config import BotConfig
+from epostabot.history import TimingHistory
+from epostabot.timeouts import (
+    DEADLINE_MARGIN, MIN_SAMPLES, SAMPLE_PREFIX, WINDOW, StepTimeouts,
+    item_deadline, minimum_item_deadline,
+)
+
+
+class StepTimeoutsTest(unittest.TestCase):
+    """p99 × katsayı, sıkıştırma, genişletme ve zaman aşımı örnekleri"""
+    
+    def setUp(self):
+        self.history = TimingHistory()
+        self.timeouts = StepTimeouts.for_config(BotConfig(), self.history)
+    
+    def fill(self, step: str, samples: list):
+        for seconds in samples:
+            self.timeouts.record(step, seconds)
+    
+    def test_defaults_without_history(self):
+        self.assertEqual(self.timeouts.get("dashboard"), 30)
+        self.assertEqual(self.timeouts.get("create_result"), 60)
+        # None varsayılanlar config.timeout'u kullanır
+        self.assertEqual(self.timeouts.get("login_form"), BotConfig().timeout)
+    
+    def test_too_few_samples_keep_default(self):
+        self.fill("dashboard", [1.0] * (MIN_SAMPLES - 1))
+        self.assertIsNone(self.timeouts.learned("dashboard"))
+        self.assertEqual(self.timeouts.get("dashboard"), 30)
+        self.fill("dashboard", [1.0])
+        self.assertIsNotNone(self.timeouts.learned("dashboard"))
+    
+    def test_p99_times_factor(self):
+        # 0.1 ... 10.0: p99 = 9.9
+        self.fill("dashboard", [i / 10 for i in range(1, 101)])
+        self.assertAlmostEqual(self.timeouts.get("dashboard"), 9.9 * 2.0)
+    
+    def test_learned_value_is_clamped(self):
+        self.fill("dashboard", [1.0] * MIN_SAMPLES)
+        self.assertEqual(self.timeouts.get("dashboard"), 5.0)
+        self.fill("mailbox_list", [100.0] * MIN_SAMPLES)
+        self.assertEqual(self.timeouts.get("mailbox_list"), 120.0)
+    
+    def test_only_recent_window_counts(self):
+        self.fill("dashboard", [50.0] * 10 + [4.0] * WINDOW)
+        self.assertEqual(self.timeouts.get("dashboard"), 8.0)
+    
+    def test_create_result_keeps_floor(self):
+        # Hızlı panelde bile create_result varsayılanın yarısının altına inmez
+        self.fill("create_result", [1.0] * MIN_SAMPLES)
+        self.assertEqual(self.timeouts.get("create_result"), 30.0)
+        self.fill("create_form", [1.0] * MIN_SAMPLES)
+        self.assertEqual(self.timeouts.get("create_form"), 5.0)
+    
+    def test_timeouts_are_not_samples(self):
+        self.fill("dashboard", [5.0] * MIN_SAMPLES)
+        for _ in range(5):
+            self.timeouts.record_timeout("dashboard")
+        self.assertEqual(self.history.samples(SAMPLE_PREFIX + "dashboard"), [5.0] * MIN_SAMPLES)
+        # Zaman aşımları tek başına öğrenmeyi başlatmaz
+        for _ in range(MIN_SAMPLES):
+            self.timeouts.record_timeout("mailbox_list")
+        self.assertIsNone(self.timeouts.learned("mailbox_list"))
+    
+    def test_widens_after_three_consecutive_timeouts(self):
+        self.fill("dashboard", [5.0] * MIN_SAMPLES)
+        observed = []
+        for _ in range(6):
+            self.timeouts.record_timeout("dashboard")
+            observed.append(self.timeouts.get("dashboard"))
+        self.assertEqual(observed, [10.0, 10.0, 15.0, 15.0, 15.0, 20.0])
+        
+        # Tamamlanan bekleme genişletmeyi sıfırlar
+        self.timeouts.record("dashboard", 5.0)
+        self.assertEqual(self.timeouts.get("dashboard"), 10.0)
+    
+    def test_widening_does_not_exceed_maximum(self):
+        self.fill("dashboard", [50.0] * MIN_SAMPLES)
+        for _ in range(12):
+            self.timeouts.record_timeout("dashboard")
+        self.assertEqual(self.timeouts.get("dashboard"), 120.0)
+    
+    def test_streaks_are_per_step(self):
+        self.fill("dashboard", [5.0] * MIN_SAMPLES)
+        self.fill("create_form", [5.0] * MIN_SAMPLES)
+        for _ in range(3):
+            self.timeouts.record_timeout("create_form")
+        self.assertEqual(self.timeouts.get("dashboard"), 10.0)
+        self.assertEqual(self.timeouts.get("create_form"), 15.0)
+    
+    def test_disabled_uses_defaults(self):
+        timeouts = StepTimeouts.for_config(BotConfig(adaptive_timeouts=False), self.history)
+        self.fill("dashboard", [1.0] * MIN_SAMPLES)
+        self.assertIsNone(timeouts.learned("dashboard"))
+        self.assertEqual(timeouts.get("dashboard"), 30)
+    
+    def test_describe_lists_learned_steps_only(self):
+        self.fill("dashboard", [5.0] * MIN_SAMPLES)
+        self.assertEqual(self.timeouts.describe(),
+                         ["Zaman aşımı: dashboard 10.0 sn (varsayılan 30 sn)"])
+
+
+class ItemDeadlineTest(unittest.TestCase):
+    """Öğe bekçisi süresi ve en uzun bekleme toplamı"""
+    
+    def test_worst_case_uses_ceilings(self):
+        config = BotConfig(timeout_max=120)
+        self.assertEqual(minimum_item_deadline(config), 240)
+        # Öğrenme kapalıyken varsayılanlar üst sınırdır: create_form + create_result
+        config.adaptive_timeouts = False
+        self.assertEqual(minimum_item_deadline(config), 90)
+    
+    def test_automatic_deadline_adds_margin(self):
+        config = BotConfig(timeout_max=60)
+        self.assertEqual(item_deadline(config), 120 + DEADLINE_MARGIN)
+    
+    def test_explicit_deadline_is_kept(self):
+        self.assertEqual(item_deadline(BotConfig(item_deadline=0)), 0)
+        self.assertEqual(item_deadline(BotConfig(item_deadline=500)), 500)
+    
+    def test_deadline_below_worst_case_is_rejected(self):
+        config = BotConfig(prefix="test", password="Gizli.123", item_deadline=100)
+        is_valid, error = config.validate()
+        self.assertFalse(is_valid)
+        self.assertIn("240 sn", error)
+        config.item_deadline = 240
+        self.assertEqual(config.validate(), (True, None))
+        config.item_deadline = 0
+        self.assertEqual(config.validate(), (True, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
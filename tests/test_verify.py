@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IMAP Doğrulama Testleri
+ImapVerifier, süreç içi test IMAP sunucusuna karşı çalıştırılır
+"""
+
+import threading
+import unittest
+
+from epostabot.cancel import Cancelled, CancelToken
+from epostabot.verify import ImapVerifier
+from tests.imap_stub import ImapStub
+
+
+ADDRESS = "test1@mailpanel.example"
+PASSWORD = "Gizli.123"
+
+
+class ImapVerifierTest(unittest.TestCase):
+    """ImapVerifier giriş, tekrar deneme, havuz ve iptal davranışı"""
+    
+    def make_verifier(self, stub: ImapStub, **kwargs) -> ImapVerifier:
+        kwargs.setdefault("retry_delay", 0.01)
+        kwargs.setdefault("timeout", 5.0)
+        self.messages = []
+        verifier = ImapVerifier("127.0.0.1", stub.port, logger=self.messages.append, **kwargs)
+        self.addCleanup(verifier.close)
+        return verifier
+    
+    def test_accepted_login_verifies(self):
+        with ImapStub({ADDRESS: PASSWORD}) as stub:
+            verifier = self.make_verifier(stub)
+            self.assertTrue(verifier.verify(ADDRESS, PASSWORD))
+        self.assertEqual(stub.logins, [(ADDRESS, True)])
+        self.assertIn(f"✓ IMAP doğrulandı: {ADDRESS}", self.messages)
+    
+    def test_rejected_login_fails_after_all_attempts(self):
+        with ImapStub({ADDRESS: PASSWORD}) as stub:
+            verifier = self.make_verifier(stub, attempts=3)
+            self.assertFalse(verifier.verify(ADDRESS, "yanlis"))
+        self.assertEqual(stub.logins, [(ADDRESS, False)] * 3)
+        self.assertIn(f"✗ IMAP doğrulanamadı: {ADDRESS} (giriş reddedildi)", self.messages)
+    
+    def test_check_is_single_attempt(self):
+        with ImapStub({ADDRESS: PASSWORD}) as stub:
+            verifier = self.make_verifier(stub)
+            self.assertFalse(verifier.check(ADDRESS, "yanlis"))
+            self.assertTrue(verifier.check(ADDRESS, PASSWORD))
+        self.assertEqual(len(stub.logins), 2)
+    
+    def test_retries_until_mailbox_is_ready(self):
+        with ImapStub({ADDRESS: PASSWORD}, not_ready={ADDRESS: 2}) as stub:
+            verifier = self.make_verifier(stub, attempts=3)
+            self.assertTrue(verifier.verify(ADDRESS, PASSWORD))
+        self.assertEqual(stub.logins, [(ADDRESS, False), (ADDRESS, False), (ADDRESS, True)])
+    
+    def test_connection_error_is_reported(self):
+        with ImapStub({}) as stub:
+            port = stub.port
+        verifier = ImapVerifier("127.0.0.1", port, attempts=1, timeout=1.0, logger=lambda message: None)
+        self.addCleanup(verifier.close)
+        self.assertFalse(verifier.verify(ADDRESS, PASSWORD))
+    
+    def test_pool_bounds_concurrent_connections(self):
+        accounts = {f"test{i}@mailpanel.example": PASSWORD for i in range(8)}
+        results = {}
+        with ImapStub(accounts, login_delay=0.05) as stub:
+            verifier = self.make_verifier(stub, pool_size=2)
+            for address in accounts:
+                verifier.submit(address, PASSWORD, lambda ok, address=address: results.__setitem__(address, ok))
+            verifier.wait()
+        self.assertEqual(results, {address: True for address in accounts})
+        self.assertLessEqual(stub.max_active, 2)
+        self.assertEqual(stub.max_active, 2)
+    
+    def test_wait_with_cancel_drops_queued_verifications(self):
+        gate = threading.Event()
+        accounts = {f"test{i}@mailpanel.example": PASSWORD for i in range(4)}
+        results = []
+        with ImapStub(accounts, gate=gate) as stub:
+            verifier = self.make_verifier(stub, pool_size=1)
+            futures = [verifier.submit(address, PASSWORD, results.append) for address in accounts]
+            
+            # İlk doğrulama sunucuda bekletilirken diğerleri kuyrukta kalır
+            threading.Timer(0.2, gate.set).start()
+            verifier.wait(cancel=True)
+        
+        self.assertEqual(results, [True])
+        self.assertTrue(futures[0].result())
+        self.assertTrue(all(future.cancelled() for future in futures[1:]))
+        self.assertEqual(len(stub.logins), 1)
+    
+    def test_cancel_token_interrupts_retry_delay(self):
+        token = CancelToken()
+        with ImapStub({ADDRESS: PASSWORD}, not_ready={ADDRESS: 5}) as stub:
+            verifier = self.make_verifier(stub, attempts=5, retry_delay=30.0, cancel_token=token)
+            future = verifier.submit(ADDRESS, PASSWORD, lambda ok: None)
+            threading.Timer(0.2, token.cancel).start()
+            with self.assertRaises(Cancelled):
+                future.result(timeout=5)
+        self.assertEqual(stub.logins, [(ADDRESS, False)])
+    
+    
+    def test_close_stops_pool_threads(self):
+        with ImapStub({ADDRESS: PASSWORD}) as stub:
+            verifier = self.make_verifier(stub, pool_size=2)
+            verifier.submit(ADDRESS, PASSWORD, lambda ok: None)
+            verifier.wait()
+            verifier.close()
+        self.assertFalse([thread for thread in threading.enumerate() if thread.name.startswith("imap_")])
+
+
+if __name__ == "__main__":
+    unittest.main()